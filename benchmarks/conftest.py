@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+from collections.abc import Generator
+
+import pandas as pd
+import pytest
+
+from vivarium import InteractiveContext
+from vivarium.examples.disease_model import get_model_specification_path
+from vivarium.framework.engine import SimulationContext
+
+POPULATION_SIZES = (10_000, 100_000, 1_000_000)
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    parser.addoption(
+        "--population-sizes",
+        action="store",
+        default=",".join(str(size) for size in POPULATION_SIZES),
+        help="Comma separated population sizes to run the benchmarks at.",
+    )
+
+
+def pytest_generate_tests(metafunc: pytest.Metafunc) -> None:
+    if "population_size" in metafunc.fixturenames:
+        sizes = [
+            int(size) for size in metafunc.config.getoption("population_sizes").split(",")
+        ]
+        metafunc.parametrize("population_size", sizes, ids=str, scope="session")
+
+
+def build_simulation(population_size: int) -> InteractiveContext:
+    """Builds the example disease model and takes a single time step with it so
+    that every pipeline, lookup table, and observation has been exercised."""
+    simulation = InteractiveContext(
+        get_model_specification_path(),
+        configuration={"population": {"population_size": population_size}},
+    )
+    simulation.take_steps(1)
+    return simulation
+
+
+@pytest.fixture(scope="session")
+def simulation(population_size: int) -> Generator[InteractiveContext, None, None]:
+    """A disease model simulation shared by benchmarks that do not advance time."""
+    yield build_simulation(population_size)
+    SimulationContext._clear_context_cache()
+
+
+@pytest.fixture
+def fresh_simulation(population_size: int) -> Generator[InteractiveContext, None, None]:
+    """A disease model simulation for benchmarks that advance time."""
+    yield build_simulation(population_size)
+    SimulationContext._clear_context_cache()
+
+
+@pytest.fixture(scope="session")
+def population_index(simulation: InteractiveContext) -> pd.Index[int]:
+    return simulation._population.get_population_index()
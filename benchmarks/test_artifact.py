@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from vivarium.framework.artifact import Artifact, convert_artifact
+
+NUMBER_OF_KEYS = 10
+NUMBER_OF_DRAWS = 500
+
+
+@pytest.fixture(scope="session")
+def artifact_paths(tmp_path_factory: pytest.TempPathFactory) -> dict[str, Path]:
+    """An HDF artifact of wide, draw-level tables and its Parquet conversion."""
+    index = pd.MultiIndex.from_product(
+        [
+            ["Kenya", "Uganda"],
+            ["Female", "Male"],
+            np.arange(0, 115, 5),
+            np.arange(1990, 2020),
+        ],
+        names=["location", "sex", "age_start", "year_start"],
+    )
+    rng = np.random.default_rng(12345)
+    directory = tmp_path_factory.mktemp("artifacts")
+    hdf_path = directory / "artifact.hdf"
+    artifact = Artifact(hdf_path)
+    for i in range(NUMBER_OF_KEYS):
+        data = pd.DataFrame(
+            rng.uniform(size=(len(index), NUMBER_OF_DRAWS)),
+            index=index,
+            columns=[f"draw_{draw}" for draw in range(NUMBER_OF_DRAWS)],
+        )
+        artifact.write(f"cause.cause_{i}.incidence_rate", data)
+    parquet_path = directory / "artifact.parquet"
+    convert_artifact(hdf_path, parquet_path)
+    return {"hdf": hdf_path, "parquet": parquet_path}
+
+
+@pytest.mark.parametrize("backend", ["hdf", "parquet"])
+def test_artifact_setup_load(
+    benchmark: BenchmarkFixture, artifact_paths: dict[str, Path], backend: str
+) -> None:
+    """Loads a single draw of every key, as the artifact manager does during setup."""
+
+    def load_all() -> None:
+        artifact = Artifact(artifact_paths[backend], filter_terms=["draw == 7"])
+        artifact.acquire_handle()
+        for key in artifact:
+            artifact.load(key)
+        artifact.release_handle()
+
+    benchmark(load_all)
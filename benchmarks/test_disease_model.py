@@ -0,0 +1,15 @@
+from __future__ import annotations
+
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from vivarium import InteractiveContext
+
+STEPS_PER_ROUND = 5
+
+
+def test_disease_model_loop(
+    benchmark: BenchmarkFixture, fresh_simulation: InteractiveContext
+) -> None:
+    benchmark.pedantic(  # type: ignore [no-untyped-call]
+        fresh_simulation.take_steps, args=(STEPS_PER_ROUND,), rounds=3
+    )
@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from vivarium.framework.lookup.interpolation import Interpolation
+
+
+def test_interpolation(benchmark: BenchmarkFixture, population_size: int) -> None:
+    ages = np.arange(0, 100)
+    years = np.arange(1990, 2020)
+    data = pd.DataFrame(
+        [
+            (sex, age, age + 1, year, year + 1)
+            for sex in ["Female", "Male"]
+            for age in ages
+            for year in years
+        ],
+        columns=["sex", "age_start", "age_end", "year_start", "year_end"],
+    )
+    data["value"] = np.random.default_rng(12345).uniform(size=len(data))
+    interpolation = Interpolation(
+        data,
+        categorical_parameters=["sex"],
+        continuous_parameters=[
+            ["age", "age_start", "age_end"],
+            ["year", "year_start", "year_end"],
+        ],
+        value_columns=["value"],
+        order=0,
+        extrapolate=True,
+        validate=True,
+    )
+
+    rng = np.random.default_rng(54321)
+    interpolants = pd.DataFrame(
+        {
+            "sex": rng.choice(["Female", "Male"], population_size),
+            "age": rng.uniform(0, 100, population_size),
+            "year": rng.uniform(1990, 2020, population_size),
+        }
+    )
+    values = benchmark(interpolation, interpolants)
+    assert len(values) == population_size
@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+from typing import Any
+
+import pandas as pd
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from vivarium import InteractiveContext
+
+
+def test_population_view_get_private_columns(
+    benchmark: BenchmarkFixture,
+    simulation: InteractiveContext,
+    population_index: pd.Index[int],
+) -> None:
+    view = simulation.get_component("base_population").population_view
+    population = benchmark(view.get, population_index, ["age", "sex", "entrance_time"])
+    assert len(population) == len(population_index)
+
+
+def test_population_view_get_attributes(
+    benchmark: BenchmarkFixture,
+    simulation: InteractiveContext,
+    population_index: pd.Index[int],
+) -> None:
+    view = simulation.get_component("base_population").population_view
+    attributes = ["age", "lower_respiratory_infections", "child_wasting.exposure"]
+    population = benchmark(view.get, population_index, attributes, query="is_alive == True")
+    assert list(population.columns) == attributes
+
+
+def test_population_view_update(
+    benchmark: BenchmarkFixture, simulation: InteractiveContext
+) -> None:
+    view = simulation.get_component("base_population").population_view
+
+    def modifier(age: pd.Series[Any]) -> pd.Series[Any]:
+        return age + 0.0
+
+    benchmark(view.update, "age", modifier)
@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from vivarium import InteractiveContext
+from vivarium.framework.randomness import RandomnessStream
+from vivarium.framework.randomness.index_map import IndexMap
+
+
+def get_stream(simulation: InteractiveContext) -> RandomnessStream:
+    stream: RandomnessStream = simulation.get_component("risk.child_wasting").randomness
+    return stream
+
+
+def test_get_draw(
+    benchmark: BenchmarkFixture,
+    simulation: InteractiveContext,
+    population_index: pd.Index[int],
+) -> None:
+    draws = benchmark(get_stream(simulation).get_draw, population_index, "benchmark")
+    assert len(draws) == len(population_index)
+
+
+def test_choice(
+    benchmark: BenchmarkFixture,
+    simulation: InteractiveContext,
+    population_index: pd.Index[int],
+) -> None:
+    choices = ["cat1", "cat2", "cat3", "cat4"]
+    weights = [0.1, 0.2, 0.3, 0.4]
+    chosen = benchmark(
+        get_stream(simulation).choice, population_index, choices, weights, "benchmark"
+    )
+    assert len(chosen) == len(population_index)
+
+
+def test_filter_for_probability(
+    benchmark: BenchmarkFixture,
+    simulation: InteractiveContext,
+    population_index: pd.Index[int],
+) -> None:
+    probabilities = pd.Series(
+        np.linspace(0, 1, len(population_index)), index=population_index
+    )
+    filtered = benchmark(
+        get_stream(simulation).filter_for_probability,
+        population_index,
+        probabilities,
+        "benchmark",
+    )
+    assert len(filtered) < len(population_index)
+
+
+def test_index_map_update(benchmark: BenchmarkFixture, population_size: int) -> None:
+    rng = np.random.default_rng(12345)
+    keys = pd.DataFrame(
+        {
+            "entrance_time": pd.Timestamp("2022-01-01"),
+            "age": rng.uniform(0, 5, population_size),
+        }
+    )
+    map_size = max(1_000_000, 10 * population_size)
+
+    def setup() -> tuple[tuple[IndexMap, pd.DataFrame, pd.Timestamp], dict[str, object]]:
+        index_map = IndexMap(["entrance_time", "age"], size=map_size)
+        return (index_map, keys, pd.Timestamp("2022-01-01")), {}
+
+    benchmark.pedantic(IndexMap.update, setup=setup, rounds=5)  # type: ignore [no-untyped-call]
@@ -0,0 +1,22 @@
+from __future__ import annotations
+
+import pandas as pd
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from vivarium import InteractiveContext
+from vivarium.framework.event import Event
+
+
+def test_gather_results(
+    benchmark: BenchmarkFixture,
+    simulation: InteractiveContext,
+    population_index: pd.Index[int],
+) -> None:
+    event = Event(
+        name="collect_metrics",
+        index=population_index,
+        user_data={},
+        time=simulation._clock.event_time,
+        step_size=simulation._clock.step_size,
+    )
+    benchmark(simulation._results.gather_results, event)
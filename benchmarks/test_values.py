@@ -0,0 +1,26 @@
+from __future__ import annotations
+
+import pandas as pd
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from vivarium import InteractiveContext
+
+
+@pytest.mark.parametrize(
+    "attribute",
+    [
+        "infected_with_lower_respiratory_infections.incidence_rate",
+        "child_wasting.exposure",
+        "mortality_rate",
+    ],
+)
+def test_attribute_pipeline(
+    benchmark: BenchmarkFixture,
+    simulation: InteractiveContext,
+    population_index: pd.Index[int],
+    attribute: str,
+) -> None:
+    pipeline = simulation._values.get_attribute(attribute)
+    values = benchmark(pipeline, population_index)
+    assert len(values) == len(population_index)
@@ -44,7 +44,6 @@ if __name__ == "__main__":
         "vivarium_dependencies[numpy_lt_2,pandas,pyyaml,scipy,click,tables,loguru,pyarrow,networkx]",
         "vivarium_build_utils>=3.0.2,<4.0.0",
         "layered_config_tree",
-        "dill",
     ]
 
     setup_requires = ["setuptools_scm"]
@@ -58,6 +57,10 @@ if __name__ == "__main__":
         "vivarium_testing_utils",
     ]
 
+    benchmark_requirements = [
+        "pytest-benchmark",
+    ]
+
     lint_requirements = [
         "vivarium_dependencies[lint]",
         "mypy<1.17.0",  # FIXME [MIC-6218]
@@ -106,8 +109,10 @@ if __name__ == "__main__":
             "docs": doc_requirements,
             "test": test_requirements,
             "interactive": interactive_requirements,
+            "benchmark": test_requirements + benchmark_requirements,
             "dev": doc_requirements
             + test_requirements
+            + benchmark_requirements
             + lint_requirements
             + interactive_requirements,
         },
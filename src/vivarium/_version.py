@@ -0,0 +1 @@
+__version__ = "0.1.dev1+gcae3c3396"
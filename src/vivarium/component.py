@@ -77,6 +77,7 @@ class Component(ABC):
     - :meth:`on_time_step_cleanup`
     - :meth:`on_collect_metrics`
     - :meth:`on_simulation_end`
+    - :meth:`on_branch`
 
     """
 
@@ -227,6 +228,28 @@ class Component(ABC):
         """A mapping of lookup table names to their value columns."""
         return {}
 
+    @property
+    def listener_reads(self) -> list[str] | None:
+        """The attributes this component's time step listeners read, or None if
+        they are not declared.
+
+        This must include every attribute the listeners get from the population,
+        including the attributes used in queries. Listeners of components that
+        declare both what they read and what they write may run concurrently
+        with other listeners when the ``event.parallel_listeners`` configuration
+        key is set.
+        """
+        return None
+
+    @property
+    def listener_writes(self) -> list[str] | None:
+        """The private columns this component's time step listeners update, or
+        None if they are not declared.
+
+        See :attr:`listener_reads`.
+        """
+        return None
+
     @property
     def post_setup_priority(self) -> int:
         """The priority of this component's ``post_setup`` listener."""
@@ -394,6 +417,22 @@ class Component(ABC):
         """
         pass
 
+    def on_branch(self) -> None:
+        """Method that vivarium will run when a set up simulation branches into
+        a scenario.
+
+        This method is intended to be overridden by subclasses whose behavior
+        can change between scenarios after setup, e.g. an intervention whose
+        coverage is configurable. Overriding it declares the component
+        branchable. When a simulation is branched with
+        :meth:`~vivarium.framework.engine.SimulationContext.branch`, the
+        :attr:`configuration` of each branchable component is rebuilt with the
+        scenario's configuration overrides before this method is called, so
+        the component can update any state it derived from its configuration
+        during setup.
+        """
+        pass
+
     ##################
     # Helper methods #
     ##################
@@ -1,4 +1,8 @@
-from vivarium.framework.artifact.artifact import Artifact, ArtifactException
+from vivarium.framework.artifact.artifact import (
+    Artifact,
+    ArtifactException,
+    convert_artifact,
+)
 from vivarium.framework.artifact.hdf import EntityKey
 from vivarium.framework.artifact.interface import ArtifactInterface
 from vivarium.framework.artifact.manager import (
@@ -13,11 +13,17 @@ archive file for convenient access and inspection.
 import re
 import warnings
 from collections import defaultdict
-from collections.abc import Iterator
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Any
+from typing import Any, Protocol
 
-from vivarium.framework.artifact import hdf
+import pandas as pd
+
+from vivarium.framework.artifact import hdf, parquet
+from vivarium.framework.artifact.cache import ArtifactCache
+from vivarium.framework.artifact.shared import SharedArtifactData
+from vivarium.framework.utilities import get_nbytes
 
 
 class ArtifactException(Exception):
@@ -26,26 +32,98 @@ class ArtifactException(Exception):
     pass
 
 
+class ArtifactBackend(Protocol):
+    """The storage format an :class:`Artifact` reads and writes its data with.
+
+    The :mod:`~vivarium.framework.artifact.hdf` and
+    :mod:`~vivarium.framework.artifact.parquet` modules both implement this
+    interface. An artifact's backend is chosen by the suffix of its path.
+    """
+
+    def touch(self, path: Path | str) -> None:
+        ...
+
+    def write(self, path: Path | str, entity_key: str, data: Any) -> None:
+        ...
+
+    def load(
+        self,
+        path: Path | str,
+        entity_key: str,
+        filter_terms: list[str] | None,
+        column_filters: list[str] | None,
+    ) -> Any:
+        ...
+
+    def remove(self, path: Path | str, entity_key: str) -> None:
+        ...
+
+    def get_keys(self, path: Path | str) -> list[str]:
+        ...
+
+    def contains(self, path: Path | str, entity_key: str) -> bool:
+        ...
+
+
+def get_backend(path: Path) -> ArtifactBackend:
+    """Gets the storage format for an artifact from the suffix of its path.
+
+    Parameters
+    ----------
+    path
+        The path to the artifact.
+
+    Returns
+    -------
+        The :mod:`~vivarium.framework.artifact.parquet` interface for paths
+        with a ``.parquet`` suffix and the :mod:`~vivarium.framework.artifact.hdf`
+        interface otherwise.
+    """
+    return parquet if path.suffix == parquet.SUFFIX else hdf
+
+
 class Artifact:
     """An interface for interacting with :mod:`vivarium` artifacts."""
 
-    def __init__(self, path: str | Path, filter_terms: list[str] | None = None) -> None:
+    def __init__(
+        self,
+        path: str | Path,
+        filter_terms: list[str] | None = None,
+        cache_size: int | None = None,
+        shared_directory: str | Path | None = None,
+    ) -> None:
         """
         Parameters
         ----------
         path
-            The path to the artifact file.
+            The path to the artifact file. Artifacts with a ``.hdf`` or ``.h5``
+            suffix are stored in HDF and artifacts with a ``.parquet`` suffix
+            are stored in Parquet.
         filter_terms
             A set of terms suitable for usage with the ``where`` kwarg
             for :func:`pandas.read_hdf`.
+        cache_size
+            The maximum number of bytes of loaded data to cache. When the
+            cache is full, the least recently loaded keys are evicted. If
+            None, every loaded key is cached.
+        shared_directory
+            A directory to share draw-invariant data with other simulations
+            using the same artifact on this node. See
+            :mod:`~vivarium.framework.artifact.shared`. If None, no data is
+            shared.
         """
         self._path = Path(path)
         self._filter_terms = filter_terms
         self._draw_column_filter = _parse_draw_filters(filter_terms)
-        self._cache: dict[str, Any] = {}
+        self._cache = ArtifactCache(cache_size)
+        self._prefetched: dict[str, Any] = {}
 
         self.create_hdf_with_keyspace(self._path)
         self._keys = Keys(self._path)
+        self._backend = get_backend(self._path)
+        self._handle = hdf.get_read_handle(self._path) if self._backend is hdf else None
+        self._shared_directory = shared_directory
+        self._shared = self._get_shared_data()
 
     @property
     def path(self) -> str:
@@ -62,14 +140,31 @@ class Artifact:
         """Filters that will be applied to the requested data on loads."""
         return self._filter_terms
 
+    @property
+    def key_index(self) -> dict[str, dict[str, Any]]:
+        """Information about the data stored at each key.
+
+        Each entry holds the type and size in bytes of the data and, for
+        :mod:`pandas` data, its number of rows, its columns and their dtypes,
+        and its index levels. The index is read from the artifact the first
+        time it is needed. Keys written before the artifact kept an index are
+        missing from it until :meth:`rebuild_key_index` is called.
+        """
+        return dict(self._keys.index)
+
     @staticmethod
     def create_hdf_with_keyspace(path: Path) -> None:
-        """Creates the artifact HDF file and adds a node to track keys."""
-        if not path.is_file():
+        """Creates the artifact file and adds a node to track keys."""
+        backend = get_backend(path)
+        if not path.exists():
             warnings.warn(f"No artifact found at {path}. Building new artifact.")
-            hdf.touch(path)
+            backend.touch(path)
+        elif backend.contains(path, Keys.keyspace_node):
+            return
 
-        keys = hdf.get_keys(path)
+        # Only existing files without a keyspace need every key listed to
+        # tell whether they are empty or were written by something else.
+        keys = backend.get_keys(path)
         if keys and "metadata.keyspace" not in keys:
             raise ArtifactException(
                 "Attempting to construct an Artifact from a malformed existing file. "
@@ -79,7 +174,7 @@ class Artifact:
                 "and a non-existent or empty hdf file."
             )
         if not keys:
-            hdf.write(path, "metadata.keyspace", ["metadata.keyspace"])
+            backend.write(path, "metadata.keyspace", ["metadata.keyspace"])
 
     def load(self, entity_key: str) -> Any:
         """Loads the data associated with provided entity_key.
@@ -103,17 +198,64 @@ class Artifact:
             raise ArtifactException(f"{entity_key} should be in {self.path}.")
 
         if entity_key not in self._cache:
-            data = hdf.load(
-                self._path, entity_key, self._filter_terms, self._draw_column_filter
-            )
+            prefetched = self._prefetched.pop(entity_key, None)
+
+            def load_data() -> Any:
+                if prefetched is not None:
+                    return prefetched
+                return self._backend.load(
+                    self._path, entity_key, self._filter_terms, self._draw_column_filter
+                )
+
+            if self._shared is not None:
+                data = self._shared.load_or_share(entity_key, load_data)
+            else:
+                data = load_data()
             # FIXME: Under what conditions do we get None here.
             assert (
                 data is not None
             ), f"Data for {entity_key} is not available. Check your model specification."
             self._cache[entity_key] = data
+            return data
 
         return self._cache[entity_key]
 
+    def prefetch(self, entity_keys: Iterable[str], max_workers: int = 1) -> None:
+        """Reads the data for several keys ahead of time.
+
+        Prefetched data is held until it is requested with :meth:`load` or
+        the cache is cleared. Keys that are not in the artifact, that have
+        already been loaded, or that another simulation has already shared
+        are skipped.
+
+        Parameters
+        ----------
+        entity_keys
+            The keys whose data will be loaded.
+        max_workers
+            The maximum number of processes to read the data with. If 1, the
+            data is read serially in this process.
+        """
+        keys = [
+            key
+            for key in dict.fromkeys(entity_keys)
+            if key in self
+            and key not in self._cache
+            and key not in self._prefetched
+            and not (self._shared is not None and key in self._shared)
+        ]
+        load_args = [
+            (self._path, key, self._filter_terms, self._draw_column_filter) for key in keys
+        ]
+        if max_workers > 1 and len(keys) > 1:
+            with ProcessPoolExecutor(max_workers=min(max_workers, len(keys))) as executor:
+                data = list(executor.map(self._backend.load, *zip(*load_args)))
+        else:
+            data = [self._backend.load(*args) for args in load_args]
+        self._prefetched.update(
+            {key: value for key, value in zip(keys, data) if value is not None}
+        )
+
     def write(self, entity_key: str, data: Any) -> None:
         """Writes data into the artifact and binds it to the provided key.
 
@@ -135,8 +277,9 @@ class Artifact:
         elif data is None:
             raise ArtifactException(f"Attempting to write to key {entity_key} with no data.")
         else:
-            hdf.write(self._path, entity_key, data)
-            self._keys.append(entity_key)
+            self._backend.write(self._path, entity_key, data)
+            self._keys.append(entity_key, _get_key_info(data))
+            self._shared = self._get_shared_data()
 
     def remove(self, entity_key: str) -> None:
         """Removes data associated with the provided key from the artifact.
@@ -157,9 +300,10 @@ class Artifact:
             )
 
         self._keys.remove(entity_key)
-        if entity_key in self._cache:
-            self._cache.pop(entity_key)
-        hdf.remove(self._path, entity_key)
+        self._cache.pop(entity_key, None)
+        self._prefetched.pop(entity_key, None)
+        self._backend.remove(self._path, entity_key)
+        self._shared = self._get_shared_data()
 
     def replace(self, entity_key: str, data: Any) -> None:
         """Replaces the artifact data at the provided key with the new data.
@@ -184,19 +328,115 @@ class Artifact:
         self.remove(entity_key)
         self.write(entity_key, data)
 
-    def clear_cache(self) -> None:
+    def is_shared(self, entity_key: str) -> bool:
+        """Whether the data associated with the provided key is shared with
+        other simulations through the artifact's shared directory.
+
+        Shared data is memory-mapped and read-only.
+        """
+        return self._shared is not None and entity_key in self._shared
+
+    def pin(self, entity_key: str) -> None:
+        """Keeps the data associated with the provided key in the cache.
+
+        Pinned keys are never evicted to make room for other data and are
+        kept when the cache is cleared with ``keep_pinned``.
+
+        Parameters
+        ----------
+        entity_key
+            The key to pin. It may be pinned before it is loaded.
+        """
+        self._cache.pin(entity_key)
+
+    def unpin(self, entity_key: str) -> None:
+        """Allows the data associated with the provided key to be evicted again.
+
+        Parameters
+        ----------
+        entity_key
+            The key to unpin.
+        """
+        self._cache.unpin(entity_key)
+
+    def acquire_handle(self) -> None:
+        """Holds the artifact file open for reading.
+
+        Until the handle is released, every load from the artifact reuses the
+        same open file rather than opening it again. Calls may be nested, and
+        the file is closed once each has been matched by a call to
+        :meth:`release_handle`. Parquet artifacts store each key in its own
+        file, so there is no file to hold open and this does nothing.
+        """
+        if self._handle is not None:
+            self._handle.acquire()
+
+    def release_handle(self) -> None:
+        """Releases a hold on the artifact file acquired with :meth:`acquire_handle`."""
+        if self._handle is not None:
+            self._handle.release()
+
+    def close(self) -> None:
+        """Closes the artifact file, even if holds on it acquired with
+        :meth:`acquire_handle` have not been released."""
+        if self._handle is not None:
+            self._handle.close()
+
+    def clear_cache(self, keep_pinned: bool = False) -> None:
         """Clears the artifact's cache.
 
         The artifact will cache data in memory to improve performance for
         repeat access.
+
+        Parameters
+        ----------
+        keep_pinned
+            Whether to keep the data for pinned keys in the cache.
         """
-        self._cache = {}
+        if keep_pinned:
+            self._cache.release()
+        else:
+            self._cache.clear()
+        self._prefetched = {}
+
+    def get_cache_memory_usage(self) -> dict[str, int]:
+        """Gets the number of bytes used by each key in the artifact's cache.
+
+        Prefetched data that has not been loaded yet is included.
+
+        Returns
+        -------
+            A mapping from cached keys to the bytes used by their data.
+        """
+        return {
+            **self._cache.get_memory_usage(),
+            **{key: get_nbytes(data) for key, data in self._prefetched.items()},
+        }
+
+    def rebuild_key_index(self) -> None:
+        """Records information about the data at every key in the key index.
+
+        This loads the data for every key, so it is only needed for artifacts
+        written before they kept an index.
+        """
+        for key in self.keys:
+            if key != Keys.keyspace_node:
+                data = self._backend.load(self._path, key, None, None)
+                self._keys.index[key] = _get_key_info(data)
+        self._keys.write_index()
+
+    def _get_shared_data(self) -> SharedArtifactData | None:
+        # Shared data is tied to the current contents of the artifact file, so
+        # this is called again whenever the artifact is modified.
+        if self._shared_directory is None:
+            return None
+        return SharedArtifactData(self._shared_directory, self._path, self._filter_terms)
 
     def __iter__(self) -> Iterator[str]:
         return iter(self.keys)
 
     def __contains__(self, item: str) -> bool:
-        return item in self.keys
+        return item in self._keys
 
     def __repr__(self) -> str:
         return f"Artifact(keys={self.keys})"
@@ -213,6 +453,47 @@ class Artifact:
         return out
 
 
+def convert_artifact(source: str | Path, destination: str | Path) -> Artifact:
+    """Copies the data for every key in an artifact into a new artifact.
+
+    The storage format of each artifact is chosen by the suffix of its path,
+    so this converts between formats, e.g. from an existing ``.hdf`` artifact
+    to a ``.parquet`` artifact.
+
+    Parameters
+    ----------
+    source
+        The path to the artifact to copy.
+    destination
+        The path to write the new artifact to.
+
+    Returns
+    -------
+        The new artifact.
+
+    Raises
+    ------
+    ArtifactException
+        If there is already an artifact at the destination.
+    """
+    if Path(destination).exists():
+        raise ArtifactException(f"An artifact already exists at {destination}.")
+    # Don't hold the data for every key in memory while copying.
+    source_artifact = Artifact(source, cache_size=0)
+    with warnings.catch_warnings():
+        warnings.filterwarnings("ignore", message="No artifact found")
+        destination_artifact = Artifact(destination)
+
+    source_artifact.acquire_handle()
+    try:
+        for key in source_artifact:
+            if key != Keys.keyspace_node:
+                destination_artifact.write(key, source_artifact.load(key))
+    finally:
+        source_artifact.release_handle()
+    return destination_artifact
+
+
 def _to_tree(keys: list[str]) -> dict[str, dict[str, list[str]]]:
     out: defaultdict[str, dict[str, list[str]]] = defaultdict(lambda: defaultdict(list))
     for k in keys:
@@ -234,26 +515,56 @@ class Keys:
     """
 
     keyspace_node = "metadata.keyspace"
+    index_node = "metadata.key_index"
 
     def __init__(self, artifact_path: Path):
         self._path = artifact_path
-        self._keys = [str(k) for k in hdf.load(self._path, "metadata.keyspace", None, None)]
+        self._backend = get_backend(artifact_path)
+        self._keys = [
+            str(k) for k in self._backend.load(self._path, "metadata.keyspace", None, None)
+        ]
+        self._key_set = set(self._keys)
+        self._index: dict[str, dict[str, Any]] | None = None
 
-    def append(self, new_key: str) -> None:
+    @property
+    def index(self) -> dict[str, dict[str, Any]]:
+        """Information about the data at each key, read from the artifact the
+        first time it is needed."""
+        if self._index is None:
+            index = None
+            if self._backend.contains(self._path, self.index_node):
+                index = self._backend.load(self._path, self.index_node, None, None)
+            self._index = dict(index) if index else {}
+        return self._index
+
+    def append(self, new_key: str, info: dict[str, Any] | None = None) -> None:
         """Whenever the artifact gets a new key and new data, append is called to
-        remove the old keyspace and to write the updated keyspace"""
+        remove the old keyspace and to write the updated keyspace and key index"""
 
         self._keys.append(new_key)
-        hdf.remove(self._path, self.keyspace_node)
-        hdf.write(self._path, self.keyspace_node, self._keys)
+        self._key_set.add(new_key)
+        self._backend.remove(self._path, self.keyspace_node)
+        self._backend.write(self._path, self.keyspace_node, self._keys)
+        if info is not None:
+            self.index[new_key] = info
+            self.write_index()
 
     def remove(self, removing_key: str) -> None:
         """Whenever the artifact removes a key and data, remove is called to
-        remove the key from keyspace and write the updated keyspace."""
+        remove the key from keyspace and key index and write the updated ones."""
 
         self._keys.remove(removing_key)
-        hdf.remove(self._path, self.keyspace_node)
-        hdf.write(self._path, self.keyspace_node, self._keys)
+        self._key_set.discard(removing_key)
+        self._backend.remove(self._path, self.keyspace_node)
+        self._backend.write(self._path, self.keyspace_node, self._keys)
+        if self.index.pop(removing_key, None) is not None:
+            self.write_index()
+
+    def write_index(self) -> None:
+        """Writes the key index to the artifact, replacing any existing index."""
+        if self._backend.contains(self._path, self.index_node):
+            self._backend.remove(self._path, self.index_node)
+        self._backend.write(self._path, self.index_node, dict(self.index))
 
     def to_list(self) -> list[str]:
         """A list of all the entity keys in the associated artifact."""
@@ -261,7 +572,19 @@ class Keys:
         return self._keys
 
     def __contains__(self, item: str) -> bool:
-        return item in self._keys
+        return item in self._key_set
+
+
+def _get_key_info(data: Any) -> dict[str, Any]:
+    """Gets the information about a piece of artifact data kept in the key index."""
+    info: dict[str, Any] = {"type": type(data).__name__, "nbytes": int(get_nbytes(data))}
+    if isinstance(data, (pd.DataFrame, pd.Series)):
+        frame = data.to_frame() if isinstance(data, pd.Series) else data
+        info["rows"] = len(frame)
+        info["columns"] = [str(column) for column in frame.columns]
+        info["dtypes"] = {str(column): str(dtype) for column, dtype in frame.dtypes.items()}
+        info["index"] = [str(name) for name in frame.index.names]
+    return info
 
 
 def _parse_draw_filters(filter_terms: list[str] | None) -> list[str] | None:
@@ -0,0 +1,136 @@
+"""
+==============
+Artifact Cache
+==============
+
+A size-bounded, least-recently-used cache for data loaded from an artifact.
+
+"""
+from __future__ import annotations
+
+from collections import OrderedDict
+from collections.abc import Iterator, MutableMapping
+from typing import Any
+
+from vivarium.framework.utilities import get_nbytes
+
+
+class ArtifactCache(MutableMapping[str, Any]):
+    """A mapping from artifact keys to loaded data bounded by its size in bytes.
+
+    When adding data would make the cache larger than its maximum size, the
+    least recently used keys are evicted until it fits again. Pinned keys are
+    never evicted, so the cache may grow past its maximum size if the pinned
+    data alone does not fit. Data that is larger than the maximum size by
+    itself is not cached unless its key is pinned.
+
+    Sizes are estimated with :func:`~vivarium.framework.utilities.get_nbytes`
+    when data is added to the cache.
+    """
+
+    def __init__(self, max_bytes: int | None = None) -> None:
+        """
+        Parameters
+        ----------
+        max_bytes
+            The maximum number of bytes of data to hold. If None, the cache
+            is unbounded.
+        """
+        self.max_bytes = max_bytes
+        self._data: OrderedDict[str, Any] = OrderedDict()
+        self._nbytes: dict[str, int] = {}
+        self._pinned: set[str] = set()
+        self._total_nbytes = 0
+
+    @property
+    def nbytes(self) -> int:
+        """The number of bytes of data held in the cache."""
+        return self._total_nbytes
+
+    @property
+    def pinned(self) -> set[str]:
+        """The keys that will not be evicted from the cache."""
+        return set(self._pinned)
+
+    def pin(self, key: str) -> None:
+        """Prevents a key from being evicted from the cache.
+
+        Keys may be pinned before their data has been added to the cache.
+
+        Parameters
+        ----------
+        key
+            The key to pin.
+        """
+        self._pinned.add(key)
+
+    def unpin(self, key: str) -> None:
+        """Allows a pinned key to be evicted from the cache again.
+
+        Parameters
+        ----------
+        key
+            The key to unpin.
+        """
+        self._pinned.discard(key)
+        self._evict()
+
+    def release(self) -> None:
+        """Evicts every key that is not pinned."""
+        for key in list(self._data):
+            if key not in self._pinned:
+                del self[key]
+
+    def get_memory_usage(self) -> dict[str, int]:
+        """Gets the number of bytes used by each key in the cache.
+
+        Returns
+        -------
+            A mapping from cached keys to the bytes used by their data.
+        """
+        return dict(self._nbytes)
+
+    def _evict(self) -> None:
+        if self.max_bytes is None:
+            return
+        for key in list(self._data):
+            if self._total_nbytes <= self.max_bytes:
+                break
+            if key not in self._pinned:
+                del self[key]
+
+    def __getitem__(self, key: str) -> Any:
+        data = self._data[key]
+        self._data.move_to_end(key)
+        return data
+
+    def __setitem__(self, key: str, data: Any) -> None:
+        nbytes = get_nbytes(data)
+        if key in self._data:
+            del self[key]
+        if self.max_bytes is not None and nbytes > self.max_bytes and key not in self._pinned:
+            return
+        self._data[key] = data
+        self._nbytes[key] = nbytes
+        self._total_nbytes += nbytes
+        self._evict()
+
+    def __delitem__(self, key: str) -> None:
+        del self._data[key]
+        self._total_nbytes -= self._nbytes.pop(key)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._data
+
+    def __iter__(self) -> Iterator[str]:
+        # Iterate over a copy, since reading an item moves it to the end.
+        return iter(list(self._data))
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __repr__(self) -> str:
+        return (
+            f"ArtifactCache(max_bytes={self.max_bytes}, nbytes={self.nbytes}, "
+            f"keys={list(self._data)})"
+        )
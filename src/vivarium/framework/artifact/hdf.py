@@ -9,7 +9,7 @@ A convenience wrapper around the `tables <https://www.pytables.org>`_ and
 Public Interface
 ----------------
 
-The public interface consists of 5 functions:
+The public interface consists of 6 functions:
 
 .. list-table:: HDF Public Interface
    :widths: 20 60
@@ -27,6 +27,16 @@ The public interface consists of 5 functions:
      - Clears data from a key in an HDF file.
    * - :func:`get_keys`
      - Gets all available HDF keys from an HDF file.
+   * - :func:`contains`
+     - Checks whether there is data at a key in an HDF file.
+
+Reads made by :func:`load` and :func:`get_keys` go through a shared
+:class:`ReadHandle` for the file, available from :func:`get_read_handle`.
+Acquiring the handle keeps the file open so that subsequent reads reuse it
+rather than opening the file again. The handle is only shared for as long as
+something, e.g. an :class:`~vivarium.framework.artifact.artifact.Artifact`,
+holds a reference to it, and the file is closed if the handle is discarded
+while it is open.
 
 Contracts
 +++++++++
@@ -42,7 +52,11 @@ Contracts
 from __future__ import annotations
 
 import json
+import os
 import re
+import weakref
+from collections.abc import Iterator
+from contextlib import contextmanager
 from pathlib import Path
 from typing import Any, Literal
 
@@ -73,9 +87,9 @@ def touch(path: Path | str) -> None:
 
     """
     path = _get_valid_hdf_path(path)
-
-    with tables.open_file(str(path), mode="w"):
-        pass
+    with get_read_handle(path).closed_for_writing():
+        with tables.open_file(str(path), mode="w"):
+            pass
 
 
 def write(path: Path | str, entity_key: str, data: Any) -> None:
@@ -105,11 +119,11 @@ def write(path: Path | str, entity_key: str, data: Any) -> None:
     """
     hdf_path: Path = _get_valid_hdf_path(path)
     entity_key = EntityKey(entity_key)
-
-    if isinstance(data, (pd.DataFrame, pd.Series)):
-        _write_pandas_data(hdf_path, entity_key, data)
-    else:
-        _write_json_blob(hdf_path, entity_key, data)
+    with get_read_handle(hdf_path).closed_for_writing():
+        if isinstance(data, (pd.DataFrame, pd.Series)):
+            _write_pandas_data(hdf_path, entity_key, data)
+        else:
+            _write_json_blob(hdf_path, entity_key, data)
 
 
 def load(
@@ -146,28 +160,34 @@ def load(
     path = _get_valid_hdf_path(path)
     entity_key = EntityKey(entity_key)
 
-    with tables.open_file(str(path)) as file:
-        node = file.get_node(entity_key.path)
+    with get_read_handle(path).open() as store:
+        node = store.get_node(entity_key.path)  # type: ignore [operator]
         if isinstance(node, tables.earray.EArray):
             # This should be a json encoded document rather than a pandas dataframe
             with filenode.open_node(node) as file_node:
                 data = json.load(file_node)
         else:
-            filter_terms = _get_valid_filter_terms(filter_terms, node.table.colnames)
-            with pd.HDFStore(str(path), complevel=9, mode="r") as store:
-                metadata = store.get_storer(  # type: ignore [operator]
-                    entity_key.path
-                ).attrs.metadata  # NOTE: must use attrs. write this up
+            storer = store.get_storer(entity_key.path)  # type: ignore [operator]
+            metadata = storer.attrs.metadata  # NOTE: must use attrs. write this up
+            # Selecting with a where clause mishandles categorical columns, so
+            # terms that reference them are applied after the data is read.
+            categorical_columns = _get_categorical_columns(storer)
+            where = _get_valid_filter_terms(
+                filter_terms,
+                [c for c in node.table.colnames if c not in categorical_columns],
+            )
 
             if metadata.get("is_empty", False):
-                data = pd.read_hdf(path, entity_key.path, where=filter_terms)  # type: ignore [arg-type]
+                data = store.select(entity_key.path, where=where)  # type: ignore [arg-type]
                 data = data.set_index(
                     list(data.columns)
                 )  # undoing transform performed on write
             else:
-                data = pd.read_hdf(
-                    path, entity_key.path, where=filter_terms, columns=column_filters  # type: ignore [arg-type]
+                data = store.select(
+                    entity_key.path, where=where, columns=column_filters  # type: ignore [arg-type]
                 )
+            remaining_terms = [t for t in filter_terms or [] if t not in (where or [])]
+            data = _apply_filter_terms(data, remaining_terms)
 
     return data
 
@@ -189,9 +209,9 @@ def remove(path: Path | str, entity_key: str) -> None:
     """
     path = _get_valid_hdf_path(path)
     entity_key = EntityKey(entity_key)
-
-    with tables.open_file(str(path), mode="a") as file:
-        file.remove_node(entity_key.path, recursive=True)
+    with get_read_handle(path).closed_for_writing():
+        with tables.open_file(str(path), mode="a") as file:
+            file.remove_node(entity_key.path, recursive=True)
 
 
 def get_keys(path: Path | str) -> list[str]:
@@ -207,11 +227,165 @@ def get_keys(path: Path | str) -> list[str]:
         A list of key representations of the internal paths in the HDF.
     """
     path = _get_valid_hdf_path(path)
-    with tables.open_file(str(path)) as file:
-        keys = _get_keys(file.root)
+    with get_read_handle(path).open() as store:
+        keys = _get_keys(store.get_node("/"))  # type: ignore [operator]
     return keys
 
 
+def contains(path: Path | str, entity_key: str) -> bool:
+    """Checks whether there is data at a key in an HDF file.
+
+    Unlike checking the keys from :func:`get_keys`, this looks up a single
+    node rather than walking the whole file.
+
+    Parameters
+    ----------
+    path
+        The path to the HDF file.
+    entity_key
+        A representation of the internal HDF path where the data would be located.
+
+    Returns
+    -------
+        Whether there is data at the key.
+    """
+    path = _get_valid_hdf_path(path)
+    entity_key = EntityKey(entity_key)
+    with get_read_handle(path).open() as store:
+        return store.get_node(entity_key.path) is not None  # type: ignore [operator]
+
+
+def get_read_handle(path: Path | str) -> ReadHandle:
+    """Gets the shared read-only handle to an HDF file.
+
+    Every call with the same file returns the same handle while a reference
+    to it is held, so a handle acquired by one caller is reused by all reads
+    of the file. Once every reference is dropped, the handle is discarded and
+    the next call returns a new one.
+
+    Parameters
+    ----------
+    path
+        The path to the HDF file.
+
+    Returns
+    -------
+        The read-only handle to the HDF file.
+    """
+    path = _get_valid_hdf_path(path).resolve()
+    handle = _READ_HANDLES.get(path)
+    if handle is None:
+        handle = ReadHandle(path)
+        _READ_HANDLES[path] = handle
+    return handle
+
+
+class ReadHandle:
+    """A reference-counted, read-only handle to an HDF file.
+
+    The file is opened when the handle is first acquired and closed when
+    every acquisition has been released, so nested reads share a single open
+    file. Writing to a file that is open for reading is not allowed, so the
+    write functions in this module close the file while they write and then
+    reopen it, so that the store held by anyone who acquired the handle can
+    still be read from, including the newly written data.
+
+    """
+
+    def __init__(self, path: Path) -> None:
+        """
+        Parameters
+        ----------
+        path
+            The path to the HDF file.
+        """
+        self.path = path
+        self._store: pd.HDFStore | None = None
+        self._pid: int | None = None
+        self._count = 0
+        self._finalizer: weakref.finalize[[pd.HDFStore, int], ReadHandle] | None = None
+
+    @property
+    def is_open(self) -> bool:
+        """Whether the file is currently open."""
+        return self._store is not None and self._pid == os.getpid()
+
+    @property
+    def count(self) -> int:
+        """The number of unreleased acquisitions of the handle."""
+        return self._count
+
+    def acquire(self) -> pd.HDFStore:
+        """Opens the file if necessary and holds it open until released.
+
+        Returns
+        -------
+            The open store.
+        """
+        if not self.is_open:
+            if self._pid != os.getpid():
+                # A forked process inherits the parent's handle, which is not
+                # safe to use, so it starts a fresh one.
+                self._count = 0
+            self._store = pd.HDFStore(str(self.path), mode="r")
+            self._pid = os.getpid()
+            # Close the file if the handle is discarded while it is open, e.g.
+            # when a simulation fails during setup.
+            self._finalizer = weakref.finalize(self, _close_store, self._store, self._pid)
+        self._count += 1
+        assert self._store is not None
+        return self._store
+
+    def release(self) -> None:
+        """Releases an acquisition of the handle, closing the file if it was
+        the last one."""
+        self._count = max(self._count - 1, 0)
+        if self._count == 0:
+            self.close()
+
+    def close(self) -> None:
+        """Closes the file, even if the handle has unreleased acquisitions."""
+        if self.is_open:
+            assert self._finalizer is not None
+            self._finalizer()
+        self._store = None
+
+    @contextmanager
+    def closed_for_writing(self) -> Iterator[None]:
+        """Closes the file for the duration of a ``with`` block so that it can be
+        written.
+
+        If the file was open, the same store is reopened at the end of the
+        block.
+        """
+        if not self.is_open:
+            yield
+            return
+        assert self._store is not None
+        self._store.close()
+        try:
+            yield
+        finally:
+            self._store.open(mode="r")
+
+    @contextmanager
+    def open(self) -> Iterator[pd.HDFStore]:
+        """Acquires the handle for the duration of a ``with`` block.
+
+        Yields
+        ------
+            The open store.
+        """
+        store = self.acquire()
+        try:
+            yield store
+        finally:
+            self.release()
+
+    def __repr__(self) -> str:
+        return f"ReadHandle(path={self.path}, count={self._count})"
+
+
 class EntityKey(str):
     """A convenience wrapper that translates artifact keys.
 
@@ -315,6 +489,15 @@ class EntityKey(str):
 # Private utilities #
 #####################
 
+_READ_HANDLES: weakref.WeakValueDictionary[Path, ReadHandle] = weakref.WeakValueDictionary()
+
+
+def _close_store(store: pd.HDFStore, owner_pid: int) -> None:
+    # A forked process inherits the handle, but the open file belongs to the
+    # process that opened it.
+    if os.getpid() == owner_pid:
+        store.close()
+
 
 def _get_valid_hdf_path(path: Path | str) -> Path:
     valid_suffixes = [".hdf", ".h5"]
@@ -419,13 +602,36 @@ def _get_valid_filter_terms(
         return None
     valid_terms = filter_terms.copy()
     for term in filter_terms:
-        # first strip out all the parentheses - the where in read_hdf
-        # requires all references to be valid
-        sub_term = re.sub("[()]", "", term)
-        # then split each condition out
-        split: list[str] = re.split("[&|]", sub_term)
-        # get the unique columns referenced by this term
-        term_columns = set([re.split(r"[<=>\s]", i.strip())[0] for i in split])
-        if not term_columns.issubset(colnames):
+        # the where in read_hdf requires all references to be valid
+        if not _get_filter_term_columns(term).issubset(colnames):
             valid_terms.remove(term)
     return valid_terms if valid_terms else None
+
+
+def _get_filter_term_columns(term: str) -> set[str]:
+    """Gets the unique columns referenced by a filter term."""
+    # first strip out all the parentheses
+    sub_term = re.sub("[()]", "", term)
+    # then split each condition out
+    split: list[str] = re.split("[&|]", sub_term)
+    return set([re.split(r"[<=>\s]", i.strip())[0] for i in split])
+
+
+def _get_categorical_columns(storer: Any) -> list[str]:
+    """Gets the names of the categorical columns in a stored table."""
+    return [axis.name for axis in storer.values_axes if axis.meta == "category"]
+
+
+def _apply_filter_terms(data: Any, filter_terms: list[str]) -> Any:
+    """Filters loaded data with the terms that reference only its columns and
+    index levels, all in a single query."""
+    names = set(data.columns) | set(data.index.names)
+    terms = [
+        # Like the where argument of pandas.read_hdf, accept = in place of ==.
+        re.sub(r"(?<![=!<>])=(?!=)", "==", term)
+        for term in filter_terms
+        if _get_filter_term_columns(term).issubset(names)
+    ]
+    if terms:
+        data = data.query(" & ".join(f"({term})" for term in terms))
+    return data
@@ -55,5 +55,38 @@ class ArtifactInterface(Interface):
         """
         return self._manager.load(entity_key, **column_filters)
 
+    def prefetch(self, entity_keys: Sequence[str]) -> None:
+        """Reads the data for several entity keys ahead of time.
+
+        Components that load many keys can declare them up front so that the
+        data is read concurrently, rather than one key at a time. Subsequent
+        calls to :meth:`load` for these keys are served from the prefetched
+        data. Keys used as ``data_sources`` in the configuration are
+        prefetched automatically before any component is set up.
+
+        The number of processes used to read the data is set with the
+        ``input_data.artifact_prefetch_workers`` configuration key.
+
+        Parameters
+        ----------
+        entity_keys
+            The keys whose data will be loaded.
+        """
+        self._manager.prefetch(entity_keys)
+
+    def retain(self, entity_key: str) -> None:
+        """Keeps the raw data for an entity key in memory after setup.
+
+        Raw artifact data is cached while it is loaded during setup and
+        released once setup is complete. Retaining a key keeps its data cached
+        and protects it from being evicted when the cache is full.
+
+        Parameters
+        ----------
+        entity_key
+            The key associated with the data to retain.
+        """
+        self._manager.retain(entity_key)
+
     def __repr__(self) -> str:
         return "ArtifactManagerInterface()"
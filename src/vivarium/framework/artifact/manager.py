@@ -14,6 +14,8 @@ from collections.abc import Sequence
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
+import numpy as np
+import numpy.typing as npt
 import pandas as pd
 from layered_config_tree.main import LayeredConfigTree
 
@@ -24,6 +26,7 @@ from vivarium.manager import Manager
 
 if TYPE_CHECKING:
     from vivarium.framework.engine import Builder
+    from vivarium.framework.event import Event
 
 
 class ArtifactManager(Manager):
@@ -34,11 +37,18 @@ class ArtifactManager(Manager):
             "artifact_path": None,
             "artifact_filter_term": None,
             "input_draw_number": None,
+            "artifact_cache_size": None,
+            "artifact_prefetch_workers": 1,
+            "artifact_shared_directory": None,
         }
     }
 
     def __init__(self) -> None:
         self._default_value_column = "value"
+        self.artifact: Artifact | None = None
+        # The positions of the rows with each value of the filtered columns of
+        # each loaded key, so repeated filtered loads of a key don't rescan it.
+        self._category_indices: dict[str, CategoryIndex] = {}
 
     @property
     def name(self) -> str:
@@ -47,20 +57,51 @@ class ArtifactManager(Manager):
     def setup(self, builder: Builder) -> None:
         """Performs this component's simulation setup."""
         self.logger = builder.logging.get_logger(self.name)
-        # because not all columns are accessible via artifact filter terms, apply config filters separately
         self.config_filter_term = validate_filter_term(
             builder.configuration.input_data.artifact_filter_term
         )
+        self.prefetch_workers = builder.configuration.input_data.artifact_prefetch_workers
         self.artifact = self._load_artifact(builder.configuration)
+        if self.artifact is not None:
+            # Hold the artifact file open so loads during setup share a single handle.
+            self.artifact.acquire_handle()
+            try:
+                self.prefetch(get_configured_artifact_keys(builder.configuration))
+            except BaseException:
+                self.artifact.release_handle()
+                raise
         builder.lifecycle.add_constraint(self.load, allow_during=[lifecycle_states.SETUP])
+        builder.lifecycle.add_constraint(self.retain, allow_during=[lifecycle_states.SETUP])
+        builder.lifecycle.add_constraint(self.prefetch, allow_during=[lifecycle_states.SETUP])
+        builder.event.register_listener(lifecycle_states.POST_SETUP, self.on_post_setup)
+        builder.event.register_listener(
+            lifecycle_states.SIMULATION_END, self.on_simulation_end
+        )
+
+    def on_post_setup(self, event: Event) -> None:
+        """Releases the cached artifact data for every key that was not retained
+        and closes the artifact file.
+
+        Data can only be loaded during setup, by which point components have
+        copied what they need into lookup tables or their own attributes.
+        """
+        if self.artifact is not None:
+            self.artifact.clear_cache(keep_pinned=True)
+            self.artifact.release_handle()
+        self._category_indices = {}
+
+    def on_simulation_end(self, event: Event) -> None:
+        """Closes the artifact file if anything has left it open."""
+        if self.artifact is not None:
+            self.artifact.close()
 
     def _load_artifact(self, configuration: LayeredConfigTree) -> Artifact | None:
         """Loads artifact data.
 
-        Looks up the path to the artifact hdf file, builds a default filter,
-        and generates the data artifact. Stores any configuration specified filter
-        terms separately to be applied on loading, because not all columns are
-        available via artifact filter terms.
+        Looks up the path to the artifact file, builds a default filter, and
+        generates the data artifact. Any configuration specified filter term is
+        added to the artifact's filter terms so that it is applied as the data
+        is read.
 
         Parameters
         ----------
@@ -78,7 +119,15 @@ class ArtifactManager(Manager):
         self.logger.info(f"Running simulation from artifact located at {artifact_path}.")
         self.logger.info(f"Artifact base filter terms are {base_filter_terms}.")
         self.logger.info(f"Artifact additional filter terms are {self.config_filter_term}.")
-        return Artifact(artifact_path, base_filter_terms)
+        filter_terms = base_filter_terms + (
+            [self.config_filter_term] if self.config_filter_term else []
+        )
+        return Artifact(
+            artifact_path,
+            filter_terms,
+            cache_size=configuration.input_data.artifact_cache_size,
+            shared_directory=configuration.input_data.artifact_shared_directory,
+        )
 
     def load(self, entity_key: str, **column_filters: int | str | Sequence[int | str]) -> Any:
         """Loads data associated with the given entity key.
@@ -95,44 +144,156 @@ class ArtifactManager(Manager):
         Returns
         -------
             The data associated with the given key, filtered down to the
-            requested subset if the data is a dataframe.
+            requested subset if the data is a dataframe. Data shared with
+            other simulations is returned without copying wherever possible,
+            so its columns are read-only.
         """
         if self.artifact is None:
             raise ArtifactException("No artifact defined for simulation.")
 
         data = self.artifact.load(entity_key)
         if isinstance(data, pd.DataFrame):  # could be metadata dict
-            data = data.reset_index()
+            # Shared data is memory-mapped once for the whole node, so copying
+            # it would give this process its own copy again.
+            copy = not self.artifact.is_shared(entity_key)
+            data = data.reset_index() if copy else _reset_index_without_copy(data)
             draw_col = [c for c in data.columns if "draw" in c]
             if draw_col:
-                data = data.rename(columns={draw_col[0]: self._default_value_column})
+                data.columns = pd.Index(
+                    [self._default_value_column if c == draw_col[0] else c for c in data]
+                )
 
-            data = filter_data(data, self.config_filter_term, **column_filters)
+            # The configuration filter term was applied when the artifact was read.
+            category_index = self._category_indices.setdefault(entity_key, {})
+            data = _filter_data(data, None, column_filters, category_index, copy=copy)
 
         return data
 
+    def prefetch(self, entity_keys: Sequence[str]) -> None:
+        """Reads the data for several entity keys ahead of time.
+
+        The data is read concurrently by up to ``input_data.artifact_prefetch_workers``
+        processes and served by subsequent calls to :meth:`load`.
+
+        Parameters
+        ----------
+        entity_keys
+            The keys whose data will be loaded.
+        """
+        if self.artifact is None:
+            raise ArtifactException("No artifact defined for simulation.")
+        self.artifact.prefetch(entity_keys, max_workers=self.prefetch_workers)
+
+    def retain(self, entity_key: str) -> None:
+        """Keeps the raw data for the given entity key in memory after setup.
+
+        Parameters
+        ----------
+        entity_key
+            The key associated with the data to retain.
+        """
+        if self.artifact is None:
+            raise ArtifactException("No artifact defined for simulation.")
+        self.artifact.pin(entity_key)
+
+    def get_memory_usage(self) -> dict[str, int]:
+        """Gets the number of bytes used by each key in the artifact's cache.
+
+        Returns
+        -------
+            A mapping from cached artifact keys to the bytes used by their data.
+        """
+        if self.artifact is None:
+            return {}
+        return self.artifact.get_cache_memory_usage()
+
     def __repr__(self) -> str:
         return "ArtifactManager()"
 
 
+CategoryIndex = dict[str, dict[Any, npt.NDArray[np.intp]]]
+"""A mapping from column names to the positions of the rows with each value in the column."""
+
+
 def filter_data(
     data: pd.DataFrame,
     config_filter_term: str | None = None,
     **column_filters: int | str | Sequence[int | str],
 ) -> pd.DataFrame:
-    """Uses the provided column filters and age_group conditions to subset the raw data."""
-    data = _config_filter(data, config_filter_term)
-    data = _subset_rows(data, **column_filters)
-    data = _subset_columns(data, **column_filters)
-    return data
+    """Uses the provided column filters and age_group conditions to subset the raw data.
+
+    The filters are combined into a single row mask, so the data is copied once.
+    """
+    return _filter_data(data, config_filter_term, column_filters)
+
+
+def _filter_data(
+    data: pd.DataFrame,
+    config_filter_term: str | None,
+    column_filters: dict[str, int | str | Sequence[int | str]],
+    category_index: CategoryIndex | None = None,
+    copy: bool = True,
+) -> pd.DataFrame:
+    """Subsets the rows and columns of the data in a single take.
+
+    If a category index is provided, the rows matching the column filters are
+    looked up in it, and it is updated with any filtered columns it is missing.
+    If ``copy`` is False and the matching rows are contiguous, the subset is a
+    view of the data rather than a copy.
+    """
+    mask = _get_column_filter_mask(data, column_filters, category_index)
+    config_mask = _get_config_filter_mask(data, config_filter_term)
+    if config_mask is not None:
+        mask = config_mask if mask is None else mask & config_mask
+    columns = _get_columns_to_keep(data, column_filters)
+    rows = None if copy else _get_row_slice(mask)
+    if rows is not None:
+        data = data.iloc[rows]
+        # Building the frame from its columns, unlike selecting them, doesn't
+        # copy them into a single block.
+        return pd.DataFrame({column: data[column] for column in columns}, copy=False)
+    if mask is None:
+        return data if len(columns) == len(data.columns) else data[columns]
+    return data.loc[mask, columns]
+
+
+def _reset_index_without_copy(data: pd.DataFrame) -> pd.DataFrame:
+    """Moves the index of the data into columns like :meth:`pandas.DataFrame.reset_index`,
+    without copying the data's columns."""
+    if any(name is None or name in data.columns for name in data.index.names):
+        return data.reset_index()
+    columns: dict[Any, Any] = {
+        name: data.index.get_level_values(name).array for name in data.index.names
+    }
+    columns.update({column: data[column].array for column in data.columns})
+    return pd.DataFrame(columns, index=pd.RangeIndex(len(data)), copy=False)
+
+
+def _get_row_slice(mask: npt.NDArray[np.bool_] | None) -> slice | None:
+    """Gets the slice of rows selected by a mask, or None if they are not contiguous."""
+    if mask is None:
+        return slice(None)
+    positions = np.flatnonzero(mask)
+    if len(positions) == 0:
+        return slice(0, 0)
+    if positions[-1] - positions[0] + 1 != len(positions):
+        return None
+    return slice(int(positions[0]), int(positions[-1]) + 1)
 
 
 def _config_filter(data: pd.DataFrame, config_filter_term: str | None) -> pd.DataFrame:
+    mask = _get_config_filter_mask(data, config_filter_term)
+    return data if mask is None else data[mask]
+
+
+def _get_config_filter_mask(
+    data: pd.DataFrame, config_filter_term: str | None
+) -> npt.NDArray[np.bool_] | None:
     if config_filter_term:
         filter_column = re.split("[<=>]", config_filter_term.split()[0])[0]
         if filter_column in data.columns:
-            data = data.query(config_filter_term)
-    return data
+            return np.asarray(data.eval(config_filter_term), dtype=bool)
+    return None
 
 
 def validate_filter_term(config_filter_term: str | None) -> str | None:
@@ -150,32 +311,114 @@ def _subset_rows(
     data: pd.DataFrame, **column_filters: int | str | Sequence[int | str]
 ) -> pd.DataFrame:
     """Filters out unwanted rows from the data using the provided filters."""
+    mask = _get_column_filter_mask(data, column_filters)
+    return data if mask is None else data[mask]
+
+
+def _get_column_filter_mask(
+    data: pd.DataFrame,
+    column_filters: dict[str, int | str | Sequence[int | str]],
+    category_index: CategoryIndex | None = None,
+) -> npt.NDArray[np.bool_] | None:
+    """Gets a mask of the rows that match every column filter.
+
+    Parameters
+    ----------
+    data
+        The data to filter.
+    column_filters
+        A mapping from column names to the value or values to keep.
+    category_index
+        The positions of the rows with each value in the data's columns, if
+        they should be looked up rather than found by scanning the columns.
+
+    Returns
+    -------
+        The mask, or None if there are no column filters.
+
+    Raises
+    ------
+    ValueError
+        If any of the filtered columns are not in the data.
+    """
     extra_filters = set(column_filters.keys()) - set(data.columns)
     if extra_filters:
         raise ValueError(
             f"Filtering by non-existent columns: {extra_filters}. "
             f"Available columns: {data.columns}"
         )
+    if not column_filters:
+        return None
 
+    mask = np.ones(len(data), dtype=bool)
     for column, condition in column_filters.items():
-        if isinstance(condition, (str, int)):
-            condition = [condition]
-        mask = pd.Series(False, index=data.index)
-        for c in condition:
-            mask |= data[f"{column}"] == c
-        row_indexer = data[mask].index
-        data = data.loc[row_indexer, :]
-
-    return data
+        values = [condition] if isinstance(condition, (str, int)) else list(condition)
+        if category_index is None:
+            column_mask = _isin(data[column], values)
+        else:
+            if column not in category_index:
+                category_index[column] = data.groupby(  # type: ignore [assignment]
+                    column, observed=True, sort=False
+                ).indices
+            positions = [category_index[column].get(value) for value in values]
+            column_mask = np.zeros(len(data), dtype=bool)
+            for value_positions in positions:
+                if value_positions is not None:
+                    column_mask[value_positions] = True
+        mask &= column_mask
+    return mask
+
+
+def _isin(column: pd.Series[Any], values: list[Any]) -> npt.NDArray[np.bool_]:
+    """Gets a mask of the elements of a column that are in the values, comparing
+    the codes of categorical columns rather than their values."""
+    if isinstance(column.dtype, pd.CategoricalDtype):
+        codes = pd.Categorical(values, categories=column.cat.categories).codes
+        # Look up whether each code is kept in a table with an extra False entry
+        # at the end for missing values, whose code is -1.
+        keep: npt.NDArray[np.bool_] = np.zeros(len(column.cat.categories) + 1, dtype=bool)
+        keep[codes[codes >= 0]] = True
+        return np.take(keep, column.cat.codes.to_numpy())
+    return np.asarray(column.isin(values), dtype=bool)
 
 
 def _subset_columns(
     data: pd.DataFrame, **column_filters: int | str | Sequence[int | str]
 ) -> pd.DataFrame:
     """Filters out unwanted columns and default columns from the data using provided filters."""
+    return data[_get_columns_to_keep(data, column_filters)]
+
+
+def _get_columns_to_keep(
+    data: pd.DataFrame, column_filters: dict[str, int | str | Sequence[int | str]]
+) -> list[str]:
     columns_to_remove = set(list(column_filters.keys()) + ["draw"])
-    columns_to_remove = columns_to_remove.intersection(data.columns)
-    return data.drop(columns=list(columns_to_remove))
+    return [c for c in data.columns if c not in columns_to_remove]
+
+
+def get_configured_artifact_keys(configuration: LayeredConfigTree) -> list[str]:
+    """Gets the artifact keys used as data sources in the configuration.
+
+    Parameters
+    ----------
+    configuration
+        The simulation configuration.
+
+    Returns
+    -------
+        Every string data source in a component's ``data_sources`` block that
+        does not refer to a method (i.e. does not contain '::').
+    """
+    keys: list[str] = []
+    for config in configuration.values():
+        if isinstance(config, LayeredConfigTree) and "data_sources" in config:
+            data_sources = config.get_tree("data_sources").to_dict().values()
+            keys.extend(
+                source
+                for source in data_sources
+                if isinstance(source, str) and "::" not in source
+            )
+    return keys
 
 
 def get_base_filter_terms(configuration: LayeredConfigTree) -> list[str]:
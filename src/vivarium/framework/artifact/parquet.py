@@ -0,0 +1,386 @@
+"""
+=================
+Parquet Interface
+=================
+
+A columnar artifact storage format built on
+`Apache Parquet <https://parquet.apache.org>`_ and :mod:`pyarrow`.
+
+A Parquet artifact is a directory with a ``.parquet`` suffix. The data for
+each key is stored in its own file in that directory, named for the key, so
+that loading a key reads only that key's file. :mod:`pandas` data is stored
+as a Parquet file and any other python object is stored as json.
+
+Compared to the :mod:`HDF interface <vivarium.framework.artifact.hdf>`,
+reads are memory-mapped and decompressed with multiple threads, filter terms
+are pushed down into the read so that only the row groups that can match
+them are decoded, and column filters are applied before any data is
+converted to :mod:`pandas`.
+
+Public Interface
+----------------
+
+The public interface matches that of the
+:mod:`HDF interface <vivarium.framework.artifact.hdf>` and consists of 6
+functions:
+
+.. list-table:: Parquet Public Interface
+   :widths: 20 60
+   :header-rows: 1
+
+   * - Function
+     - Description
+   * - :func:`touch`
+     - Creates a Parquet artifact, wiping an existing artifact if necessary.
+   * - :func:`write`
+     - Stores data at a key in a Parquet artifact.
+   * - :func:`load`
+     - Loads (potentially filtered) data from a key in a Parquet artifact.
+   * - :func:`remove`
+     - Clears data from a key in a Parquet artifact.
+   * - :func:`get_keys`
+     - Gets all available keys from a Parquet artifact.
+   * - :func:`contains`
+     - Checks whether there is data at a key in a Parquet artifact.
+
+Contracts
++++++++++
+
+- All functions in the public interface accept both :class:`pathlib.Path` and
+  normal Python :class:`str` objects for paths.
+- All functions in the public interface accept only :class:`str` objects
+  as representations of the keys in the artifact.  The strings must be
+  formatted as ``"type.name.measure"`` or ``"type.measure"``.
+- Filter terms must be comparisons between a column and a literal value,
+  optionally combined with ``&``, ``|``, and ``~``, e.g.
+  ``"(draw == 0) & (location in ['Kenya', 'Uganda'])"``.
+
+"""
+
+from __future__ import annotations
+
+import ast
+import json
+import re
+import shutil
+from pathlib import Path
+from typing import Any
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+
+from vivarium.framework.artifact.hdf import EntityKey
+
+SUFFIX = ".parquet"
+"""The suffix of a Parquet artifact directory."""
+
+####################
+# Public interface #
+####################
+
+
+def touch(path: Path | str) -> None:
+    """Creates a Parquet artifact, wiping an existing artifact if necessary.
+
+    Parameters
+    ----------
+    path
+        The path to the Parquet artifact directory.
+
+    Raises
+    ------
+    ValueError
+        If the path does not have a ``.parquet`` suffix.
+    """
+    path = _get_valid_parquet_path(path)
+
+    if path.is_dir():
+        shutil.rmtree(path)
+    path.mkdir(parents=True)
+
+
+def write(path: Path | str, entity_key: str, data: Any) -> None:
+    """Writes data to the Parquet artifact at the given path to the given key.
+
+    Parameters
+    ----------
+    path
+        The path to the Parquet artifact to write to.
+    entity_key
+        A string representation of the key where we want to write the data.
+        The key must be formatted as ``"type.name.measure"`` or ``"type.measure"``.
+    data
+        The data to write. If it is a :mod:`pandas` object, it will be written
+        as a Parquet file. If it is some other kind of python object, it will be
+        encoded as json with :func:`json.dumps`.
+
+    Raises
+    ------
+    ValueError
+        If the path or entity_key are improperly formatted.
+    """
+    path = _get_valid_parquet_path(path)
+    entity_key = EntityKey(entity_key)
+
+    if isinstance(data, (pd.DataFrame, pd.Series)):
+        _write_pandas_data(path, entity_key, data)
+    else:
+        with _get_json_path(path, entity_key).open("w") as f:
+            json.dump(data, f)
+
+
+def load(
+    path: Path | str,
+    entity_key: str,
+    filter_terms: list[str] | None,
+    column_filters: list[str] | None,
+) -> Any:
+    """Loads data from a Parquet artifact.
+
+    Parameters
+    ----------
+    path
+        The path to the Parquet artifact to load the data from.
+    entity_key
+        A representation of the key where the data is located.
+    filter_terms
+        An optional list of terms used to filter the rows in the data. Only
+        filters applying to existing columns in the data are used.
+    column_filters
+        An optional list of columns to load from the data. Index columns are
+        always loaded.
+
+    Returns
+    -------
+        The data stored at the given key in the Parquet artifact.
+
+    Raises
+    ------
+    ValueError
+        If the path or entity_key are improperly formatted.
+    FileNotFoundError
+        If there is no data for the key in the artifact.
+    """
+    path = _get_valid_parquet_path(path)
+    entity_key = EntityKey(entity_key)
+
+    json_path = _get_json_path(path, entity_key)
+    if json_path.is_file():
+        with json_path.open() as f:
+            return json.load(f)
+
+    data_path = _get_data_path(path, entity_key)
+    schema = pq.read_schema(data_path, memory_map=True)
+    metadata = json.loads(schema.metadata.get(_METADATA_KEY, b"{}"))
+    columns = None
+    if column_filters is not None and not metadata.get("is_series", False):
+        columns = [c for c in column_filters if c in schema.names]
+    table = pq.read_table(
+        data_path,
+        columns=columns,
+        filters=_get_filter_expression(filter_terms, schema.names),
+        memory_map=True,
+        use_threads=True,
+        use_pandas_metadata=True,
+    )
+    data = table.to_pandas()
+
+    if metadata.get("is_series", False):
+        data = data.iloc[:, 0].rename(metadata["name"])
+    return data
+
+
+def remove(path: Path | str, entity_key: str) -> None:
+    """Removes a piece of data from a Parquet artifact.
+
+    Parameters
+    ----------
+    path
+        The path to the Parquet artifact to remove the data from.
+    entity_key
+        A representation of the key where the data is located.
+
+    Raises
+    ------
+    ValueError
+        If the path or entity_key are improperly formatted.
+    FileNotFoundError
+        If there is no data for the key in the artifact.
+    """
+    path = _get_valid_parquet_path(path)
+    entity_key = EntityKey(entity_key)
+
+    json_path = _get_json_path(path, entity_key)
+    if json_path.is_file():
+        json_path.unlink()
+    else:
+        _get_data_path(path, entity_key).unlink()
+
+
+def get_keys(path: Path | str) -> list[str]:
+    """Gets all keys in a Parquet artifact.
+
+    Parameters
+    ----------
+    path
+        The path to the Parquet artifact.
+
+    Returns
+    -------
+        A list of the keys in the artifact.
+    """
+    path = _get_valid_parquet_path(path)
+    return [p.stem for p in sorted(path.iterdir()) if p.suffix in [SUFFIX, ".json"]]
+
+
+def contains(path: Path | str, entity_key: str) -> bool:
+    """Checks whether there is data at a key in a Parquet artifact.
+
+    Parameters
+    ----------
+    path
+        The path to the Parquet artifact.
+    entity_key
+        A representation of the key where the data would be located.
+
+    Returns
+    -------
+        Whether there is data at the key.
+    """
+    path = _get_valid_parquet_path(path)
+    entity_key = EntityKey(entity_key)
+    return (
+        _get_json_path(path, entity_key).is_file()
+        or _get_data_path(path, entity_key).is_file()
+    )
+
+
+#####################
+# Private utilities #
+#####################
+
+_METADATA_KEY = b"vivarium"
+
+
+def _get_valid_parquet_path(path: Path | str) -> Path:
+    path = Path(path)
+    if path.suffix != SUFFIX:
+        raise ValueError(
+            f"{str(path)} has an invalid Parquet artifact suffix {path.suffix}."
+            f" Parquet artifacts must have {SUFFIX} as a path suffix."
+        )
+    return path
+
+
+def _get_data_path(path: Path, entity_key: EntityKey) -> Path:
+    return path / f"{entity_key}{SUFFIX}"
+
+
+def _get_json_path(path: Path, entity_key: EntityKey) -> Path:
+    return path / f"{entity_key}.json"
+
+
+def _write_pandas_data(
+    path: Path, entity_key: EntityKey, data: pd.DataFrame | pd.Series[Any]
+) -> None:
+    """Writes a pandas object to a Parquet file.
+
+    Series are stored as single column dataframes and restored on load. The
+    index is stored as columns, so filter terms may reference index levels.
+    """
+    if isinstance(data, pd.Series):
+        metadata = {"is_series": True, "name": data.name}
+        data = data.to_frame(name="value")
+    else:
+        metadata = {"is_series": False}
+
+    table = pa.Table.from_pandas(data, preserve_index=True)
+    table = table.replace_schema_metadata(
+        {**(table.schema.metadata or {}), _METADATA_KEY: json.dumps(metadata).encode()}
+    )
+    pq.write_table(table, _get_data_path(path, entity_key), compression="zstd")
+
+
+def _get_filter_expression(
+    filter_terms: list[str] | None, colnames: list[str]
+) -> pc.Expression | None:
+    """Combines the filter terms that reference existing columns into a single
+    expression that pyarrow can push down into the read.
+
+    Parameters
+    ----------
+    filter_terms
+        A list of filter terms, e.g. ``["draw == 0", "location == 'Kenya'"]``.
+    colnames
+        The names of the columns, including index columns, in the data.
+
+    Returns
+    -------
+        The conjunction of the valid filter terms, or None if there are none.
+
+    Raises
+    ------
+    ValueError
+        If a filter term cannot be parsed.
+    """
+    expression = None
+    for term in filter_terms or []:
+        # Like pandas, accept ``=`` as a substitute for ``==``.
+        expression_string = re.sub(r"(?<![=!<>])=(?!=)", "==", term.strip())
+        try:
+            tree = ast.parse(expression_string, mode="eval")
+        except SyntaxError:
+            raise ValueError(f"Unsupported filter term: {term}")
+        names = {node.id for node in ast.walk(tree) if isinstance(node, ast.Name)}
+        if not names.issubset(colnames):
+            continue
+        term_expression = _to_expression(tree.body, term)
+        expression = term_expression if expression is None else expression & term_expression
+    return expression
+
+
+_COMPARISONS = {
+    ast.Eq: lambda field, value: field == value,
+    ast.NotEq: lambda field, value: field != value,
+    ast.Lt: lambda field, value: field < value,
+    ast.LtE: lambda field, value: field <= value,
+    ast.Gt: lambda field, value: field > value,
+    ast.GtE: lambda field, value: field >= value,
+    ast.In: lambda field, value: field.isin(value),
+    ast.NotIn: lambda field, value: ~field.isin(value),
+}
+
+
+def _to_expression(node: ast.expr, term: str) -> pc.Expression:
+    """Recursively converts a parsed filter term into a pyarrow expression."""
+    if isinstance(node, ast.BinOp) and isinstance(node.op, (ast.BitAnd, ast.BitOr)):
+        left, right = _to_expression(node.left, term), _to_expression(node.right, term)
+        return left & right if isinstance(node.op, ast.BitAnd) else left | right
+    if isinstance(node, ast.BoolOp):
+        expressions = [_to_expression(value, term) for value in node.values]
+        expression = expressions[0]
+        for other in expressions[1:]:
+            expression = (
+                expression & other if isinstance(node.op, ast.And) else expression | other
+            )
+        return expression
+    if isinstance(node, ast.UnaryOp) and isinstance(node.op, (ast.Invert, ast.Not)):
+        return ~_to_expression(node.operand, term)
+    if (
+        isinstance(node, ast.Compare)
+        and len(node.ops) == 1
+        and type(node.ops[0]) in _COMPARISONS
+        and isinstance(node.left, ast.Name)
+    ):
+        try:
+            value = ast.literal_eval(node.comparators[0])
+        except ValueError:
+            raise ValueError(f"Unsupported value in filter term: {term}")
+        if isinstance(node.ops[0], (ast.In, ast.NotIn)) and not isinstance(
+            value, (list, tuple, set)
+        ):
+            value = [value]
+        return _COMPARISONS[type(node.ops[0])](pc.field(node.left.id), value)  # type: ignore [no-untyped-call]
+    raise ValueError(f"Unsupported filter term: {term}")
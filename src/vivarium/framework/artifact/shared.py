@@ -0,0 +1,244 @@
+"""
+====================
+Shared Artifact Data
+====================
+
+Tools for sharing artifact data between simulations running on the same node.
+
+Many simulations of the same model, e.g. one per draw and random seed, each
+load the same draw-invariant artifact data, like the population structure and
+age bins. When an artifact is given a shared directory, the first simulation
+to load a draw-invariant key writes it to an uncompressed Arrow file in that
+directory. Every simulation, including the first, then memory-maps that file
+rather than holding its own copy of the data, so the operating system keeps a
+single copy in memory for the whole node. Numeric columns are read without
+copying and are read-only, and the
+:class:`~vivarium.framework.artifact.manager.ArtifactManager` hands them to
+components without copying them wherever the requested rows are contiguous.
+
+The shared directory should be on a local, memory-backed file system such as
+``/dev/shm``. Each simulation registers itself as a user of its artifact's
+subdirectory when it starts sharing data and unregisters when it is done, and
+the last user removes the subdirectory. Data that is still memory-mapped stays
+readable after its file is removed.
+
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import re
+import shutil
+import uuid
+import weakref
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any
+
+import pandas as pd
+import pyarrow as pa
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - not available on Windows
+    fcntl = None  # type: ignore [assignment]
+
+
+class SharedArtifactData:
+    """Draw-invariant artifact data shared between processes through
+    memory-mapped Arrow files."""
+
+    def __init__(
+        self,
+        directory: str | Path,
+        artifact_path: str | Path,
+        filter_terms: list[str] | None = None,
+    ) -> None:
+        """
+        Parameters
+        ----------
+        directory
+            The directory to share data in. The data for each artifact is
+            kept in its own subdirectory.
+        artifact_path
+            The path to the artifact whose data is shared.
+        filter_terms
+            The artifact's filter terms. Only simulations whose filter terms
+            other than draw filters match share data.
+        """
+        root = Path(directory)
+        root.mkdir(parents=True, exist_ok=True)
+        self.directory = root / _get_artifact_id(artifact_path, filter_terms)
+        user_path = self.directory / f"{os.getpid()}.{uuid.uuid4().hex}{_USER_SUFFIX}"
+        # The last user removes the directory, so registering a user and
+        # removing the directory are done under a lock on the root directory.
+        with _lock_directory(root):
+            self.directory.mkdir(exist_ok=True)
+            user_path.touch()
+        self._finalizer = weakref.finalize(
+            self, _unregister_user, root, user_path, os.getpid()
+        )
+
+    def __contains__(self, entity_key: str) -> bool:
+        return self._get_path(entity_key).is_file()
+
+    def load(self, entity_key: str) -> Any:
+        """Memory-maps the shared data for a key.
+
+        Parameters
+        ----------
+        entity_key
+            The key of the data to load.
+
+        Returns
+        -------
+            The data, backed by the shared memory wherever possible.
+        """
+        # The table keeps the memory map open for as long as its buffers are used.
+        source = pa.memory_map(str(self._get_path(entity_key)))
+        table = pa.ipc.open_file(source).read_all()
+        data = table.to_pandas(split_blocks=True)
+        metadata = json.loads((table.schema.metadata or {}).get(_METADATA_KEY, b"{}"))
+        if metadata.get("is_series", False):
+            data = data.iloc[:, 0].rename(metadata["name"])
+        return data
+
+    def load_or_share(self, entity_key: str, loader: Callable[[], Any]) -> Any:
+        """Loads the shared data for a key, sharing it first if necessary.
+
+        If no other process has shared the key yet, the data is loaded with
+        the loader and, if it is draw-invariant, shared. Processes sharing the
+        same key at the same time wait for each other, so it is only loaded
+        once.
+
+        Parameters
+        ----------
+        entity_key
+            The key of the data to load.
+        loader
+            A function that loads the data from the artifact.
+
+        Returns
+        -------
+            The shared data, or the loaded data if it could not be shared.
+        """
+        if entity_key in self:
+            return self.load(entity_key)
+        with self._lock(entity_key):
+            if entity_key in self:
+                return self.load(entity_key)
+            data = loader()
+            if not is_draw_invariant(data):
+                return data
+            self._share(entity_key, data)
+        return self.load(entity_key)
+
+    def _share(self, entity_key: str, data: pd.DataFrame | pd.Series[Any]) -> None:
+        if isinstance(data, pd.Series):
+            metadata = {"is_series": True, "name": data.name}
+            data = data.to_frame(name="value")
+        else:
+            metadata = {"is_series": False}
+        table = pa.Table.from_pandas(data, preserve_index=True)
+        table = table.replace_schema_metadata(
+            {**(table.schema.metadata or {}), _METADATA_KEY: json.dumps(metadata).encode()}
+        )
+        # Write to a temporary file first so readers never see a partial file.
+        path = self._get_path(entity_key)
+        temporary_path = path.with_suffix(f".{os.getpid()}.tmp")
+        with pa.OSFile(str(temporary_path), "wb") as sink:
+            with pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+        os.replace(temporary_path, path)
+
+    @contextmanager
+    def _lock(self, entity_key: str) -> Iterator[None]:
+        with open(self._get_path(entity_key).with_suffix(".lock"), "a") as lock_file:
+            if fcntl is not None:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _get_path(self, entity_key: str) -> Path:
+        return self.directory / f"{entity_key}.arrow"
+
+    def __repr__(self) -> str:
+        return f"SharedArtifactData(directory={self.directory})"
+
+
+def is_draw_invariant(data: Any) -> bool:
+    """Checks whether artifact data is the same for every draw.
+
+    Parameters
+    ----------
+    data
+        The artifact data to check.
+
+    Returns
+    -------
+        Whether the data is a :mod:`pandas` object with no draw columns or
+        index levels.
+    """
+    if not isinstance(data, (pd.DataFrame, pd.Series)):
+        return False
+    columns: list[Any] = list(data.columns) if isinstance(data, pd.DataFrame) else [data.name]
+    names = [str(name) for name in columns + list(data.index.names)]
+    return not any(name == "draw" or name.startswith("draw_") for name in names)
+
+
+_METADATA_KEY = b"vivarium"
+_USER_SUFFIX = ".user"
+
+
+@contextmanager
+def _lock_directory(directory: Path) -> Iterator[None]:
+    """Holds an exclusive lock on a directory for the duration of a ``with``
+    block."""
+    if fcntl is None:
+        yield
+        return
+    descriptor = os.open(directory, os.O_RDONLY)
+    try:
+        fcntl.flock(descriptor, fcntl.LOCK_EX)
+        yield
+    finally:
+        os.close(descriptor)
+
+
+def _unregister_user(root: Path, user_path: Path, owner_pid: int) -> None:
+    """Unregisters a user of a shared directory, removing the directory if
+    it was the last one."""
+    # A forked process inherits the shared data, but the registration belongs
+    # to the process that made it.
+    if os.getpid() != owner_pid or not root.is_dir():
+        return
+    with _lock_directory(root):
+        user_path.unlink(missing_ok=True)
+        if not any(user_path.parent.glob(f"*{_USER_SUFFIX}")):
+            shutil.rmtree(user_path.parent, ignore_errors=True)
+
+
+def _get_artifact_id(artifact_path: str | Path, filter_terms: list[str] | None) -> str:
+    """Gets an identifier for an artifact's shared data.
+
+    The identifier changes if the artifact file is modified, and ignores
+    filter terms that only reference draws, since those do not change
+    draw-invariant data.
+    """
+    path = Path(artifact_path).resolve()
+    stat = path.stat()
+    non_draw_terms = sorted(term for term in filter_terms or [] if not _is_draw_filter(term))
+    description = json.dumps([str(path), stat.st_mtime_ns, stat.st_size, non_draw_terms])
+    return hashlib.sha256(description.encode()).hexdigest()[:16]
+
+
+def _is_draw_filter(term: str) -> bool:
+    """Checks whether every condition in a filter term is on the draw."""
+    conditions = re.split("[&|]", re.sub("[()~]", "", term))
+    return all(re.split(r"[\s<=>!]", c.strip())[0] == "draw" for c in conditions)
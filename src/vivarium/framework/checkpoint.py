@@ -0,0 +1,199 @@
+"""
+===========
+Checkpoints
+===========
+
+Tools for writing and reading checkpoints of a running simulation.
+
+A checkpoint holds the state a simulation accumulates while it runs: the
+private columns of the population, the clock, the common random number index
+map, and the raw results of each observation. Everything else, e.g. the
+components, lookup tables, and value pipelines, is rebuilt by setting the
+simulation up again from its model specification, which is saved alongside
+that state. Components must therefore keep any state they track for
+individual simulants, e.g. when a simulant may next transition out of a
+:class:`~vivarium.framework.state_machine.State`, in private columns rather
+than in their own attributes, or it is lost when the simulation is restored.
+See :meth:`SimulationContext.write_backup
+<vivarium.framework.engine.SimulationContext.write_backup>` and
+:meth:`SimulationContext.load_from_backup
+<vivarium.framework.engine.SimulationContext.load_from_backup>`.
+
+A checkpoint is a directory. Each table of state is written to its own
+uncompressed Arrow file named by a hash of its contents, and a manifest lists
+the file holding each table. Writing a checkpoint to a directory that already
+holds one only writes the tables that have changed since, e.g. the private
+columns updated in the last few time steps. The manifest is replaced last, so
+a checkpoint that is interrupted part way through leaves the previous one
+intact.
+
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import yaml
+
+from vivarium.exceptions import VivariumError
+
+FORMAT_VERSION = 1
+"""The version of the checkpoint format written by this module."""
+
+
+@dataclass(frozen=True)
+class Checkpoint:
+    """A snapshot of the state of a simulation.
+
+    The tables in a checkpoint must not be modified once it is created, since
+    it may still be being written by a
+    :class:`~vivarium.framework.writer.BackgroundWriter`.
+    """
+
+    model_specification: dict[str, Any]
+    """The model specification of the simulation, used to set it up again."""
+    tables: dict[str, dict[str, pd.DataFrame]]
+    """The tables of state of each manager, keyed by manager and table name."""
+
+
+def write_checkpoint(directory: str | Path, checkpoint: Checkpoint) -> None:
+    """Writes a checkpoint to a directory.
+
+    Parameters
+    ----------
+    directory
+        The directory to write the checkpoint to. A checkpoint already in the
+        directory is replaced, reusing any of its tables that are unchanged.
+    checkpoint
+        The checkpoint to write.
+    """
+    directory = Path(directory)
+    tables_directory = directory / _TABLES_DIRECTORY
+    tables_directory.mkdir(parents=True, exist_ok=True)
+
+    files: dict[str, dict[str, str]] = {}
+    for manager, tables in checkpoint.tables.items():
+        files[manager] = {}
+        for name, table in tables.items():
+            file_name = f"{_hash_table(table)}.arrow"
+            if not (tables_directory / file_name).exists():
+                _write_table(tables_directory / file_name, table)
+            files[manager][name] = file_name
+
+    _replace(
+        directory / _SPECIFICATION_FILE, yaml.dump(checkpoint.model_specification).encode()
+    )
+    _replace(
+        directory / _MANIFEST_FILE,
+        json.dumps({"format_version": FORMAT_VERSION, "tables": files}).encode(),
+    )
+
+    referenced = {file_name for tables in files.values() for file_name in tables.values()}
+    for path in tables_directory.iterdir():
+        if path.name not in referenced:
+            path.unlink()
+
+
+def read_checkpoint(directory: str | Path) -> Checkpoint:
+    """Reads a checkpoint from a directory.
+
+    Parameters
+    ----------
+    directory
+        The directory the checkpoint was written to.
+
+    Returns
+    -------
+        The checkpoint.
+
+    Raises
+    ------
+    VivariumError
+        If the directory does not hold a checkpoint in a format this version
+        of ``vivarium`` can read.
+    """
+    directory = Path(directory)
+    if directory.is_file():
+        raise VivariumError(
+            f"{directory} is a file rather than a checkpoint directory. Backups "
+            "pickled by vivarium 4.1 and earlier can no longer be read."
+        )
+    manifest_path = directory / _MANIFEST_FILE
+    if not manifest_path.is_file():
+        raise VivariumError(f"No checkpoint found in {directory}.")
+    manifest = json.loads(manifest_path.read_text())
+    if manifest["format_version"] != FORMAT_VERSION:
+        raise VivariumError(
+            f"Checkpoint in {directory} has format version {manifest['format_version']}, "
+            f"but only version {FORMAT_VERSION} can be read."
+        )
+
+    with open(directory / _SPECIFICATION_FILE) as f:
+        model_specification = yaml.full_load(f)
+    tables = {
+        manager: {
+            name: _read_table(directory / _TABLES_DIRECTORY / file_name)
+            for name, file_name in files.items()
+        }
+        for manager, files in manifest["tables"].items()
+    }
+    return Checkpoint(model_specification, tables)
+
+
+_MANIFEST_FILE = "checkpoint.json"
+_SPECIFICATION_FILE = "model_specification.yaml"
+_TABLES_DIRECTORY = "tables"
+
+
+def _hash_table(table: pd.DataFrame) -> str:
+    """Hashes the contents of a table, including its dtypes and index."""
+    hasher = hashlib.blake2b(digest_size=16)
+    hasher.update(repr([list(table.columns), list(table.dtypes)]).encode())
+    if isinstance(table.index, pd.RangeIndex):
+        hasher.update(repr(table.index).encode())
+    else:
+        hasher.update(repr([list(table.index.names), table.index.dtype]).encode())
+        hasher.update(_hash_values(table.index))
+    if len(table.columns):
+        hasher.update(_hash_values(table))
+    return hasher.hexdigest()
+
+
+def _hash_values(data: pd.DataFrame | pd.Index[Any]) -> bytes:
+    hashes = pd.util.hash_pandas_object(data, index=False)
+    return np.ascontiguousarray(hashes.to_numpy()).tobytes()
+
+
+def _write_table(path: Path, table: pd.DataFrame) -> None:
+    # Range indexes are stored as metadata, but other indexes are stored as
+    # columns, since pyarrow can mistake a level of a multi-index for a range.
+    preserve_index = None if isinstance(table.index, pd.RangeIndex) else True
+    arrow_table = pa.Table.from_pandas(table, preserve_index=preserve_index)
+    temporary_path = path.with_suffix(".tmp")
+    with pa.OSFile(str(temporary_path), "wb") as sink:
+        with pa.ipc.new_file(sink, arrow_table.schema) as writer:
+            writer.write_table(arrow_table)
+    os.replace(temporary_path, path)
+
+
+def _read_table(path: Path) -> pd.DataFrame:
+    with pa.OSFile(str(path), "rb") as source:
+        arrow_table = pa.ipc.open_file(source).read_all()
+    # Copy the data out of the Arrow buffers so the restored state is writable.
+    table: pd.DataFrame = arrow_table.to_pandas().copy()
+    return table
+
+
+def _replace(path: Path, contents: bytes) -> None:
+    """Writes a file through a temporary file so readers never see a partial one."""
+    temporary_path = path.with_suffix(".tmp")
+    temporary_path.write_bytes(contents)
+    os.replace(temporary_path, path)
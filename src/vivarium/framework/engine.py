@@ -26,7 +26,6 @@ from pprint import pformat
 from time import time
 from typing import Any
 
-import dill
 import numpy as np
 import pandas as pd
 from layered_config_tree.exceptions import ConfigurationKeyError
@@ -35,6 +34,7 @@ from layered_config_tree.main import LayeredConfigTree
 from vivarium import Component
 from vivarium.exceptions import VivariumError
 from vivarium.framework.artifact import ArtifactInterface, ArtifactManager
+from vivarium.framework.checkpoint import Checkpoint, read_checkpoint, write_checkpoint
 from vivarium.framework.components import (
     ComponentConfigError,
     ComponentInterface,
@@ -56,8 +56,12 @@ from vivarium.framework.resource import ResourceInterface, ResourceManager
 from vivarium.framework.results import ResultsInterface, ResultsManager
 from vivarium.framework.time import SimulationClock, TimeInterface
 from vivarium.framework.values import ValuesInterface, ValuesManager
+from vivarium.framework.writer import BackgroundWriter
 from vivarium.types import ClockTime
 
+_RESULTS_WRITER_THREADS = 4
+"""The number of threads to write results in."""
+
 
 class SimulationContext:
     _created_simulation_contexts: set[str] = set()
@@ -224,6 +228,9 @@ class SimulationContext:
         self._lifecycle.add_constraint(
             self.add_components, allow_during=[lifecycle_states.INITIALIZATION]
         )
+        self._lifecycle.add_constraint(
+            self.branch, allow_during=[lifecycle_states.POPULATION_CREATION]
+        )
 
         self.add_components(components_list)
 
@@ -277,31 +284,128 @@ class SimulationContext:
         self._clock.step_forward(self.get_population_index())
 
     def step(self) -> None:
+        """Takes a single time step, emitting each of the main loop events.
+
+        The simulants active on this step are found once and the same index
+        is used as the event index for every main loop event, so listeners can
+        cache work keyed on it across the step. It is only recomputed if the
+        population grows or the clock changes during the step.
+        """
         self._logger.info(self.current_time)
+        pop_to_update: pd.Index[int] | None = None
+        population_size: int | None = None
+        event_time: ClockTime | None = None
         for event in self.time_step_events:
             self._logger.debug(f"Event: {event}")
             self._lifecycle.set_state(event)
-            pop_to_update = self._clock.get_active_simulants(
-                self.get_population_index(),
-                self._clock.event_time,
-            )
+            population_index = self.get_population_index()
+            if (
+                pop_to_update is None
+                or len(population_index) != population_size
+                or self._clock.event_time != event_time
+            ):
+                population_size = len(population_index)
+                event_time = self._clock.event_time
+                pop_to_update = self._clock.get_active_simulants(population_index, event_time)
             self._logger.debug(f"Updating: {len(pop_to_update)}")
             self.time_step_emitters[event](pop_to_update, None)
         self._clock.step_forward(self.get_population_index())
 
+    def branch(self, overrides: dict[str, Any]) -> None:
+        """Applies a scenario's configuration overrides to a simulation that has
+        been set up and has created its initial population.
+
+        The overrides are layered over a copy of the simulation configuration,
+        and the configuration of every branchable component, i.e. every
+        component that overrides :meth:`~vivarium.component.Component.on_branch`,
+        is rebuilt from it before its ``on_branch`` method is called. Other
+        components have already used their configuration during setup, so the
+        overrides may only change the configuration of branchable components.
+        The simulation configuration itself is unchanged. Private columns
+        stored in memory-mapped files are copied to files of the branch's own,
+        so a branch in a forked process does not change the population of the
+        simulation it was forked from.
+
+        Parameters
+        ----------
+        overrides
+            Nested configuration overrides for the scenario.
+
+        Raises
+        ------
+        ComponentConfigError
+            If an override is not part of the configuration of a branchable
+            component.
+        """
+        configuration = LayeredConfigTree(
+            self.configuration.to_dict(), layers=["base", "branch"]
+        )
+        configuration.update(overrides, layer="branch", source="branch")
+        configuration.freeze()
+
+        branchable = [
+            component
+            for component in self._component_manager.list_components().values()
+            if isinstance(component, Component)
+            and type(component).on_branch != Component.on_branch
+        ]
+        original_configuration = self._builder.configuration
+        self._builder.configuration = configuration
+        try:
+            component_configurations = [
+                c.get_configuration(self._builder) for c in branchable
+            ]
+        finally:
+            self._builder.configuration = original_configuration
+
+        branchable_trees = {id(tree) for tree in component_configurations}
+        for key in _get_dotted_keys(overrides):
+            *parents, _ = key.split(".")
+            tree = configuration
+            for parent in parents:
+                tree = tree[parent]
+                if id(tree) in branchable_trees:
+                    break
+            else:
+                raise ComponentConfigError(
+                    f"Cannot branch on configuration key {key}, since it is not part "
+                    "of the configuration of a branchable component."
+                )
+
+        self._population.copy_column_store()
+        for component, component_configuration in zip(branchable, component_configurations):
+            component.configuration = component_configuration
+            component.on_branch()
+
     def run(
         self,
         backup_path: Path | None = None,
         backup_freq: int | float | None = None,
     ) -> None:
+        """Runs the main loop of the simulation until the clock reaches its stop time.
+
+        Parameters
+        ----------
+        backup_path
+            The directory to write checkpoints of the simulation to, as with
+            :meth:`write_backup`.
+        backup_freq
+            The number of seconds between checkpoints. Checkpoints are written
+            by a :class:`~vivarium.framework.writer.BackgroundWriter` while the
+            simulation keeps running. If the last checkpoint is still being
+            written when the next one is due, the next one is taken after the
+            following time step instead.
+        """
         if backup_freq and backup_path:
-            time_to_save = time() + backup_freq
-            while self.current_time < self._clock.stop_time:  # type: ignore [operator]
-                self.step()
-                if time() >= time_to_save:
-                    self._logger.debug(f"Writing Simulation Backup to {backup_path}")
-                    self.write_backup(backup_path)
-                    time_to_save = time() + backup_freq
+            # Successive checkpoints to the same directory must not overlap.
+            with BackgroundWriter(max_workers=1) as writer:
+                time_to_save = time() + backup_freq
+                while self.current_time < self._clock.stop_time:  # type: ignore [operator]
+                    self.step()
+                    if time() >= time_to_save and not writer.is_full:
+                        self._logger.debug(f"Writing Simulation Backup to {backup_path}")
+                        writer.submit(write_checkpoint, backup_path, self.get_checkpoint())
+                        time_to_save = time() + backup_freq
         else:
             while self.current_time < self._clock.stop_time:  # type: ignore [operator]
                 self.step()
@@ -315,7 +419,18 @@ class SimulationContext:
                 f"Some configuration keys not used during run: {unused_config_keys}."
             )
 
-    def report(self, print_results: bool = True) -> None:
+    def report(self, print_results: bool = True, write_results: bool = True) -> None:
+        """Emits the report event and logs and writes the simulation results.
+
+        Parameters
+        ----------
+        print_results
+            Whether to log the results and performance metrics.
+        write_results
+            Whether to write the results to the configured results directory.
+            Callers that collect the results with :meth:`get_results`
+            themselves can skip this.
+        """
         self._lifecycle.set_state(lifecycle_states.REPORT)
         self.report_emitter(self.get_population_index(), None)
         results = self.get_results()
@@ -328,21 +443,90 @@ class SimulationContext:
                 float_format=lambda x: f"{x:.2f}",
             )
             self._logger.info("\n" + performance_metrics_str)
-        self._write_results(results)
+        if write_results:
+            self._write_results(results)
 
     def _write_results(self, results: dict[str, pd.DataFrame]) -> None:
-        """Iterates through the measures and writes out the formatted results."""
+        """Writes out the formatted results of each measure.
+
+        The measures are serialized and compressed in parallel by a
+        :class:`~vivarium.framework.writer.BackgroundWriter`.
+        """
         try:
             results_dir = self.configuration.output_data.results_directory
-            for measure, df in results.items():
-                output_file = Path(results_dir) / f"{measure}.parquet"
-                df.to_parquet(output_file, index=False)
         except ConfigurationKeyError:
             self._logger.info("No results directory set; results are not written to disk.")
+            return
+        with BackgroundWriter(max_workers=_RESULTS_WRITER_THREADS) as writer:
+            for measure, df in results.items():
+                output_file = Path(results_dir) / f"{measure}.parquet"
+                writer.submit(df.to_parquet, output_file, index=False)
 
     def write_backup(self, backup_path: Path) -> None:
-        with open(backup_path, "wb") as f:
-            dill.dump(self, f, protocol=dill.HIGHEST_PROTOCOL)
+        """Writes a checkpoint of the simulation to a directory.
+
+        The checkpoint holds the model specification and the state the
+        simulation has accumulated: its private columns, clock, common random
+        number index map, and raw results. Writing a checkpoint to a directory
+        that already holds one only rewrites the state that has changed. See
+        :mod:`vivarium.framework.checkpoint` for details.
+
+        Parameters
+        ----------
+        backup_path
+            The directory to write the checkpoint to.
+        """
+        write_checkpoint(backup_path, self.get_checkpoint())
+
+    def get_checkpoint(self) -> Checkpoint:
+        """Takes a snapshot of the state of the simulation.
+
+        Returns
+        -------
+            A checkpoint holding copies of the simulation state, which can be
+            written to disk while the simulation keeps running.
+        """
+        model_specification = self.model_specification.to_dict()
+        if self._data.artifact is not None:
+            # Relative artifact paths are resolved against the file they were
+            # configured in, which the checkpoint does not keep.
+            model_specification["configuration"]["input_data"][
+                "artifact_path"
+            ] = self._data.artifact.path
+        tables = {
+            name: manager.get_checkpoint_data()
+            for name, manager in self._get_checkpointed_managers().items()
+        }
+        return Checkpoint(model_specification, tables)
+
+    def restore(self, checkpoint: Checkpoint) -> None:
+        """Restores the state of the simulation from a checkpoint.
+
+        This takes the place of :meth:`initialize_simulants` for a simulation
+        set up with the same model specification and components as the one
+        the checkpoint was taken from. Components are set up again, but their
+        population initializers are not run, so components must keep all of
+        their simulant state in private columns. Any other state they build
+        while creating simulants is not restored.
+
+        Parameters
+        ----------
+        checkpoint
+            The checkpoint to restore.
+        """
+        self._lifecycle.set_state(lifecycle_states.POPULATION_CREATION)
+        for name, manager in self._get_checkpointed_managers().items():
+            manager.restore_checkpoint_data(checkpoint.tables.get(name, {}))
+
+    def _get_checkpointed_managers(
+        self,
+    ) -> dict[str, PopulationManager | SimulationClock | RandomnessManager | ResultsManager]:
+        return {
+            "population": self._population,
+            "clock": self._clock,
+            "randomness": self._randomness,
+            "results": self._results,
+        }
 
     def get_performance_metrics(self) -> pd.DataFrame:
         timing_dict = self._lifecycle.timings
@@ -362,6 +546,49 @@ class SimulationContext:
         performance_metrics = pd.DataFrame(records)
         return performance_metrics
 
+    def get_profiling_metrics(self) -> pd.DataFrame:
+        """Gets call counts and timings for the simulation's hot paths.
+
+        Calls to event listeners, value pipelines, lookup tables, and
+        randomness streams are only recorded if the ``profiling.enabled``
+        configuration key is set.
+
+        Returns
+        -------
+            A dataframe with the number of calls to and the time spent in each
+            profiled function, sorted by total time.
+        """
+        return self._lifecycle.profiler.to_frame()
+
+    def get_memory_metrics(self) -> pd.DataFrame:
+        """Gets the number of bytes used by the simulation's largest data structures.
+
+        This reports the bytes used by each private column, each lookup table
+        (including the copies of its data held by its interpolation), the
+        common random number index map, the raw results of each observation,
+        and each key in the artifact cache. If :mod:`tracemalloc` is tracing,
+        it also reports the peak traced memory in each life cycle state.
+
+        Returns
+        -------
+            A dataframe with the type, name, and number of bytes of each
+            measured data structure and life cycle state.
+        """
+        memory_usage = {
+            "private_column": self._population.get_memory_usage(),
+            "lookup_table": self._tables.get_memory_usage(),
+            "randomness": self._randomness.get_memory_usage(),
+            "results": self._results.get_memory_usage(),
+            "artifact_cache": self._data.get_memory_usage(),
+            "lifecycle_peak": self._lifecycle.peak_memory,
+        }
+        records = [
+            {"Type": category, "Name": name, "Bytes": nbytes}
+            for category, usage in memory_usage.items()
+            for name, nbytes in usage.items()
+        ]
+        return pd.DataFrame(records, columns=["Type", "Name", "Bytes"])
+
     def add_components(self, component_list: list[Component]) -> None:
         """Adds new components to the simulation."""
         self._component_manager.add_components(component_list)
@@ -373,11 +600,35 @@ class SimulationContext:
         return self._clock.time_steps_remaining
 
     @classmethod
-    def load_from_backup(cls, backup_path: Path) -> "SimulationContext":
-        """Loads a simulation context from a backup file."""
-        with open(backup_path, "rb") as f:
-            backup: SimulationContext = dill.load(f)
-        return backup
+    def load_from_backup(
+        cls, backup_path: Path, components: list[Component] | None = None
+    ) -> SimulationContext:
+        """Loads a simulation from a checkpoint written by :meth:`write_backup`.
+
+        The simulation is set up from the model specification saved in the
+        checkpoint and its state is then restored with :meth:`restore`, so it
+        can continue running from where the checkpoint was taken.
+
+        Parameters
+        ----------
+        backup_path
+            The directory the checkpoint was written to.
+        components
+            Components the original simulation was given directly as
+            objects, rather than through its model specification.
+
+        Returns
+        -------
+            The restored simulation.
+        """
+        checkpoint = read_checkpoint(backup_path)
+        sim = cls(
+            model_specification=LayeredConfigTree(checkpoint.model_specification),
+            components=components,
+        )
+        sim.setup()
+        sim.restore(checkpoint)
+        return sim
 
 
 class Builder:
@@ -450,3 +701,13 @@ class Builder:
 
     def __repr__(self) -> str:
         return "Builder()"
+
+
+def _get_dotted_keys(overrides: dict[str, Any], prefix: str = "") -> list[str]:
+    keys = []
+    for key, value in overrides.items():
+        if isinstance(value, dict):
+            keys.extend(_get_dotted_keys(value, f"{prefix}{key}."))
+        else:
+            keys.append(f"{prefix}{key}")
+    return keys
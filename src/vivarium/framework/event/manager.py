@@ -13,6 +13,20 @@ event name, e.g., ``time_step_prepare``) corresponds to an
 :class:`EventChannel`, which tracks listeners to that event in prioritized
 levels and passes on the event to those listeners when emitted.
 
+Listeners within a priority level may optionally be run concurrently in a
+thread pool by setting the ``event.parallel_listeners`` configuration key. This
+is only done for the events emitted during each time step, and only for the
+listeners of components that declare the attributes their listeners read and
+the private columns they write through :attr:`Component.listener_reads
+<vivarium.component.Component.listener_reads>` and
+:attr:`Component.listener_writes <vivarium.component.Component.listener_writes>`.
+Listeners whose declarations conflict, once the attributes read are traced
+back to the private columns they are produced from through the
+:mod:`resource system <vivarium.framework.resource>`, are run one after
+another, as are all other listeners. The declarations are not checked, so
+listeners that read or write more than they declare may give results that
+depend on the order in which threads are scheduled.
+
 For more information, see the associated event :ref:`concept note <event_concept>`.
 
 """
@@ -20,14 +34,16 @@ For more information, see the associated event :ref:`concept note <event_concept
 
 from __future__ import annotations
 
+import inspect
 from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor, wait
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from typing import TYPE_CHECKING, Any
 
 import pandas as pd
 
-from vivarium.framework.lifecycle import ConstraintError, lifecycle_states
+from vivarium.framework.lifecycle import ConstraintError, Profiler, lifecycle_states
 from vivarium.manager import Manager
 from vivarium.types import ClockStepSize, ClockTime
 
@@ -90,6 +106,8 @@ class EventChannel:
         self.name = f"event_channel_{event_name}"
         self.manager = manager
         self.listeners: list[list[Callable[[Event], None]]] = [[] for _ in range(10)]
+        self.parallel = False
+        """Whether listeners within a priority level may be run concurrently."""
 
     def emit(self, index: pd.Index[int], user_data: dict[str, Any] | None = None) -> Event:
         """Notifies all listeners to this channel that an event has occurred.
@@ -129,9 +147,13 @@ class EventChannel:
             step_size,
         )
 
-        for priority_bucket in self.listeners:
-            for listener in priority_bucket:
-                listener(e)
+        if self.parallel:
+            for stage in self.manager.get_listener_stages(self):
+                self.manager.run_concurrently(stage, e)
+        else:
+            for priority_bucket in self.listeners:
+                for listener in priority_bucket:
+                    listener(e)
         return e
 
     def __repr__(self) -> str:
@@ -149,8 +171,27 @@ class EventManager(Manager):
 
     """
 
+    CONFIGURATION_DEFAULTS = {
+        "event": {
+            "parallel_listeners": False,
+            "max_workers": None,
+        }
+    }
+
+    PARALLEL_EVENTS = (
+        lifecycle_states.TIME_STEP_PREPARE,
+        lifecycle_states.TIME_STEP,
+        lifecycle_states.TIME_STEP_CLEANUP,
+        lifecycle_states.COLLECT_METRICS,
+    )
+    """The events whose listeners may be run concurrently."""
+
     def __init__(self) -> None:
         self._event_types: dict[str, EventChannel] = {}
+        self._parallel_listeners = False
+        self._max_workers: int | None = None
+        self._executor: ThreadPoolExecutor | None = None
+        self._listener_stages: dict[str, list[list[Callable[[Event], None]]]] = {}
 
     @property
     def name(self) -> str:
@@ -172,8 +213,15 @@ class EventManager(Manager):
         """
         self.clock = builder.time.clock()
         self.step_size = builder.time.step_size()
+        self._parallel_listeners = builder.configuration.event.parallel_listeners
+        self._max_workers = builder.configuration.event.max_workers
+        self._get_columns_read = builder.resources.get_columns_read
+        self._profiler = builder.lifecycle.get_profiler()
 
         builder.event.register_listener(lifecycle_states.POST_SETUP, self.on_post_setup)
+        builder.event.register_listener(
+            lifecycle_states.SIMULATION_END, self.on_simulation_end, priority=9
+        )
         self.add_handlers = builder.lifecycle.add_handlers
         self.add_constraint = builder.lifecycle.add_constraint
 
@@ -190,8 +238,129 @@ class EventManager(Manager):
         )
 
     def on_post_setup(self, event: Event) -> None:
+        if self._profiler.enabled:
+            for channel in self._event_types.values():
+                for listeners in channel.listeners:
+                    listeners[:] = [
+                        self._profiler.wrap("listener", Profiler.get_name(listener), listener)
+                        for listener in listeners
+                    ]
         for name, channel in self._event_types.items():
             self.add_handlers(name, [h for level in channel.listeners for h in level])
+        if self._parallel_listeners:
+            for name in self.PARALLEL_EVENTS:
+                self.get_channel(name).parallel = True
+
+    def on_simulation_end(self, event: Event) -> None:
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def get_listener_stages(
+        self, channel: EventChannel
+    ) -> list[list[Callable[[Event], None]]]:
+        """Gets the groups of listeners to a channel that may run concurrently.
+
+        The groups are found the first time an event is emitted on the channel,
+        once the resource graph used to find conflicting listeners is complete.
+
+        Parameters
+        ----------
+        channel
+            The channel whose listeners are to be grouped.
+
+        Returns
+        -------
+            The groups of listeners, in the order they must be run.
+        """
+        if channel.event_name not in self._listener_stages:
+            self._listener_stages[channel.event_name] = [
+                stage for bucket in channel.listeners for stage in self._get_stages(bucket)
+            ]
+        return self._listener_stages[channel.event_name]
+
+    def run_concurrently(
+        self, listeners: list[Callable[[Event], None]], event: Event
+    ) -> None:
+        """Passes an event to several listeners at once.
+
+        Parameters
+        ----------
+        listeners
+            The listeners to run. The first is run on the calling thread and
+            the rest in the thread pool.
+        event
+            The event to pass to the listeners.
+
+        Raises
+        ------
+        Exception
+            The first exception raised by any of the listeners, once all of
+            them have finished.
+        """
+        if len(listeners) == 1:
+            listeners[0](event)
+            return
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self._max_workers, thread_name_prefix="vivarium_event"
+            )
+        futures = [self._executor.submit(listener, event) for listener in listeners[1:]]
+        try:
+            listeners[0](event)
+        finally:
+            wait(futures)
+        for future in futures:
+            future.result()
+
+    def _get_stages(
+        self, listeners: list[Callable[[Event], None]]
+    ) -> list[list[Callable[[Event], None]]]:
+        """Groups listeners at the same priority level into stages that can run concurrently.
+
+        Listeners are greedily added to the first stage none of whose listeners
+        conflict with them. Listeners that do not declare what they read and
+        write are put in a stage by themselves.
+        """
+        stages: list[list[Callable[[Event], None]]] = []
+        stage_access: list[list[tuple[set[str], set[str]]] | None] = []
+        for listener in listeners:
+            access = self._get_listener_access(listener)
+            if access is None:
+                stages.append([listener])
+                stage_access.append(None)
+                continue
+            for stage, accesses in zip(stages, stage_access):
+                if accesses is not None and not any(
+                    _conflict(access, other) for other in accesses
+                ):
+                    stage.append(listener)
+                    accesses.append(access)
+                    break
+            else:
+                stages.append([listener])
+                stage_access.append([access])
+        return stages
+
+    def _get_listener_access(
+        self, listener: Callable[[Event], None]
+    ) -> tuple[set[str], set[str]] | None:
+        """Gets the private columns read and written by the component owning a
+        listener, or None if they are not declared."""
+        from vivarium import Component
+
+        component = getattr(inspect.unwrap(listener), "__self__", None)
+        if not isinstance(component, Component):
+            return None
+        reads, writes = component.listener_reads, component.listener_writes
+        if reads is None or writes is None:
+            return None
+        return self._get_columns_read(reads), set(writes)
+
+    def __getstate__(self) -> dict[str, Any]:
+        state = self.__dict__.copy()
+        state["_executor"] = None
+        return state
 
     def get_emitter(
         self, event_name: str
@@ -274,3 +443,10 @@ class EventManager(Manager):
 
     def __repr__(self) -> str:
         return "EventManager()"
+
+
+def _conflict(access: tuple[set[str], set[str]], other: tuple[set[str], set[str]]) -> bool:
+    """Whether either of two listeners writes a column the other reads or writes."""
+    reads, writes = access
+    other_reads, other_writes = other
+    return bool(writes & (other_reads | other_writes) or other_writes & reads)
@@ -16,6 +16,7 @@ from vivarium.manager import Interface
 if TYPE_CHECKING:
     from vivarium.framework.event import Event
     from vivarium.framework.lifecycle.manager import LifeCycleManager
+    from vivarium.framework.lifecycle.profiler import Profiler
 
 
 class LifeCycleInterface(Interface):
@@ -85,3 +86,12 @@ class LifeCycleInterface(Interface):
             A callable that returns the current simulation lifecycle state.
         """
         return lambda: self._manager.current_state
+
+    def get_profiler(self) -> Profiler:
+        """Gets the profiler that counts and times calls on the simulation's hot paths.
+
+        Returns
+        -------
+            The simulation's profiler.
+        """
+        return self._manager.profiler
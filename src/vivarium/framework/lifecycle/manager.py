@@ -9,6 +9,7 @@ Manager of ordering- and constraint-based contracts in the simulation
 from __future__ import annotations
 
 import time
+import tracemalloc
 from collections import defaultdict
 from collections.abc import Callable
 from typing import TYPE_CHECKING, Any
@@ -17,21 +18,31 @@ from vivarium.framework.lifecycle.constraint_maker import ConstraintMaker
 from vivarium.framework.lifecycle.entities import LifeCycle
 from vivarium.framework.lifecycle.exceptions import InvalidTransitionError, LifeCycleError
 from vivarium.framework.lifecycle.lifecycle_states import INITIALIZATION
+from vivarium.framework.lifecycle.profiler import Profiler
 from vivarium.manager import Manager
 
 if TYPE_CHECKING:
+    from vivarium.framework.engine import Builder
     from vivarium.framework.event import Event
 
 
 class LifeCycleManager(Manager):
     """Manages ordering- and constraint-based contracts in the simulation."""
 
+    CONFIGURATION_DEFAULTS = {
+        "profiling": {
+            "enabled": False,
+        }
+    }
+
     def __init__(self) -> None:
         self.lifecycle = LifeCycle()
         self._current_state = self.lifecycle.get_state(INITIALIZATION)
         self._current_state_start_time = time.time()
         self._timings: defaultdict[str, list[float]] = defaultdict(list)
+        self._peak_memory: dict[str, int] = {}
         self._make_constraint = ConstraintMaker(self)
+        self.profiler = Profiler()
 
     @property
     def name(self) -> str:
@@ -47,6 +58,21 @@ class LifeCycleManager(Manager):
     def timings(self) -> dict[str, list[float]]:
         return self._timings
 
+    @property
+    def peak_memory(self) -> dict[str, int]:
+        """The peak traced memory, in bytes, in each life cycle state.
+
+        The peak is the largest amount of memory traced by :mod:`tracemalloc`
+        while the simulation was in the state, across every visit to it. The
+        peak is reset each time the state changes, so each state only reports
+        the memory it used itself. Peaks are only recorded while
+        :mod:`tracemalloc` is tracing.
+        """
+        return self._peak_memory
+
+    def setup(self, builder: Builder) -> None:
+        self.profiler.enabled = builder.configuration.profiling.enabled
+
     def add_phase(self, phase_name: str, states: list[str], loop: bool = False) -> None:
         """Add a new phase to the lifecycle.
 
@@ -91,6 +117,12 @@ class LifeCycleManager(Manager):
             self._timings[self._current_state.name].append(
                 time.time() - self._current_state_start_time
             )
+            if tracemalloc.is_tracing():
+                _, peak_memory = tracemalloc.get_traced_memory()
+                tracemalloc.reset_peak()
+                self._peak_memory[self._current_state.name] = max(
+                    self._peak_memory.get(self._current_state.name, 0), peak_memory
+                )
             new_state.enter()
             self._current_state = new_state
             self._current_state_start_time = time.time()
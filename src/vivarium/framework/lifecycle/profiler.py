@@ -0,0 +1,121 @@
+"""
+========
+Profiler
+========
+
+Tools for counting and timing calls to the functions on a simulation's hot
+paths: event listeners, value pipelines, lookup tables, and randomness streams.
+
+Profiling is enabled with the ``profiling.enabled`` configuration key. When it
+is, the event, values, lookup table, and randomness systems wrap their listeners,
+pipelines, tables, and streams with :meth:`Profiler.wrap` at the end of setup.
+When it is not, nothing is wrapped, so profiling has no cost in ordinary runs.
+
+"""
+from __future__ import annotations
+
+import functools
+import threading
+import time
+from collections import defaultdict
+from collections.abc import Callable
+from typing import Any, TypeVar
+
+import pandas as pd
+
+T = TypeVar("T")
+
+
+class Profiler:
+    """Collects call counts and timings for functions on a simulation's hot paths.
+
+    Times are measured with :func:`time.perf_counter` and include the time spent
+    in any nested profiled calls, e.g. a pipeline's time includes the time spent
+    in the lookup tables and randomness streams its source and modifiers use.
+    """
+
+    def __init__(self) -> None:
+        self.enabled = False
+        """Whether calls to wrapped functions should be timed."""
+        self._calls: defaultdict[tuple[str, str], int] = defaultdict(int)
+        self._times: defaultdict[tuple[str, str], float] = defaultdict(float)
+        # Listeners may be run concurrently, so records are updated under a lock.
+        self._lock = threading.Lock()
+
+    def wrap(self, category: str, name: str, function: Callable[..., T]) -> Callable[..., T]:
+        """Wraps a function so that calls to it are counted and timed.
+
+        Parameters
+        ----------
+        category
+            The kind of function being wrapped, e.g. "listener" or "pipeline".
+        name
+            The name to record the function's calls under.
+        function
+            The function to wrap.
+
+        Returns
+        -------
+            The wrapped function, or the function itself if profiling is disabled.
+        """
+        if not self.enabled:
+            return function
+        key = (category, name)
+
+        @functools.wraps(function)
+        def timed(*args: Any, **kwargs: Any) -> T:
+            start = time.perf_counter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                elapsed = time.perf_counter() - start
+                with self._lock:
+                    self._calls[key] += 1
+                    self._times[key] += elapsed
+
+        return timed
+
+    @staticmethod
+    def get_name(function: Callable[..., Any]) -> str:
+        """Gets a readable name for a function, including the name of its owner.
+
+        Parameters
+        ----------
+        function
+            The function to name.
+
+        Returns
+        -------
+            The name of the function, prefixed with the name of the component
+            or manager it is bound to, if any.
+        """
+        owner = getattr(function, "__self__", None)
+        function_name = getattr(function, "__name__", type(function).__name__)
+        if owner is not None and isinstance(getattr(owner, "name", None), str):
+            return f"{owner.name}.{function_name}"
+        return str(getattr(function, "__qualname__", function_name))
+
+    def to_frame(self) -> pd.DataFrame:
+        """Gets the recorded call counts and timings.
+
+        Returns
+        -------
+            A dataframe with a row for each profiled function that has been
+            called, sorted by the total time spent in the function.
+        """
+        records = [
+            {
+                "Type": category,
+                "Name": name,
+                "Calls": self._calls[(category, name)],
+                "Total time (s)": total_time,
+                "Mean time (s)": total_time / self._calls[(category, name)],
+            }
+            for (category, name), total_time in self._times.items()
+        ]
+        columns = ["Type", "Name", "Calls", "Total time (s)", "Mean time (s)"]
+        profile = pd.DataFrame(records, columns=columns)
+        return profile.sort_values("Total time (s)", ascending=False, ignore_index=True)
+
+    def __repr__(self) -> str:
+        return f"Profiler(enabled={self.enabled})"
@@ -12,6 +12,8 @@ from collections.abc import Hashable, Sequence
 import numpy as np
 import pandas as pd
 
+from vivarium.framework.utilities import get_nbytes
+
 _SubTablesType = list[tuple[tuple[Hashable, ...] | Hashable | None, pd.DataFrame]]
 
 
@@ -132,6 +134,12 @@ class Interpolation:
 
         return result
 
+    def nbytes(self) -> int:
+        """The number of bytes used by the interpolation's copies of its data."""
+        return get_nbytes(self.data) + sum(
+            interpolation.nbytes() for interpolation in self.interpolations.values()
+        )
+
     def __repr__(self) -> str:
         return "Interpolation()"
 
@@ -380,3 +388,7 @@ class Order0Interp:
             index
         )
         return interp_vals[self.value_columns]
+
+    def nbytes(self) -> int:
+        """The number of bytes used by the sub-table's data and parameter bins."""
+        return get_nbytes(self.data) + get_nbytes(self.parameter_bins)
@@ -64,6 +64,7 @@ class LookupTableManager(Manager):
         self._add_resource = builder.resources.add_resource
         self._add_constraint = builder.lifecycle.add_constraint
         self._get_current_component = builder.components.get_current_component
+        self._profiler = builder.lifecycle.get_profiler()
 
         builder.lifecycle.add_constraint(
             self.build_table, allow_during=[lifecycle_states.SETUP]
@@ -87,6 +88,12 @@ class LookupTableManager(Manager):
                         f" table '{table_name}' during setup."
                     )
 
+        if self._profiler.enabled:
+            for table in self.tables.values():
+                table._call = self._profiler.wrap(  # type: ignore [method-assign]
+                    "lookup_table", table.name, table._call
+                )
+
     @overload
     def build_table(
         self,
@@ -159,5 +166,15 @@ class LookupTableManager(Manager):
 
         return table
 
+    def get_memory_usage(self) -> dict[str, int]:
+        """Gets the number of bytes used by each lookup table.
+
+        Returns
+        -------
+            A mapping from lookup table names to the bytes used by their data
+            and the copies of it held by their interpolations.
+        """
+        return {name: table.nbytes() for name, table in self.tables.items()}
+
     def __repr__(self) -> str:
         return "LookupTableManager()"
@@ -24,6 +24,7 @@ from vivarium.component import Component
 from vivarium.framework.lookup.interpolation import Interpolation
 from vivarium.framework.population.population_view import PopulationView
 from vivarium.framework.resource import Resource
+from vivarium.framework.utilities import get_nbytes
 from vivarium.types import LookupTableData
 
 if TYPE_CHECKING:
@@ -208,6 +209,13 @@ class LookupTable(Resource, Generic[T]):
                     )
             return self.interpolation(pop)
 
+    def nbytes(self) -> int:
+        """The number of bytes used by the table's data and interpolation."""
+        nbytes = get_nbytes(self.data)
+        if self.interpolation is not None:
+            nbytes += self.interpolation.nbytes()
+        return nbytes
+
     def __repr__(self) -> str:
         return "LookupTable()"
 
@@ -6,6 +6,7 @@ Population Manager
 """
 from __future__ import annotations
 
+import threading
 from collections.abc import Callable, Sequence
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any, Literal, overload
@@ -18,10 +19,13 @@ from vivarium.framework.event import Event
 from vivarium.framework.lifecycle import lifecycle_states
 from vivarium.framework.population.exceptions import PopulationError
 from vivarium.framework.population.population_view import PopulationView
+from vivarium.framework.population.storage import STORAGE_BACKENDS, MemmapColumnStore
 from vivarium.framework.resource import Resource
 from vivarium.manager import Manager
 
 if TYPE_CHECKING:
+    from layered_config_tree import LayeredConfigTree
+
     from vivarium.framework.engine import Builder
     from vivarium.types import ClockStepSize, ClockTime
 
@@ -56,6 +60,11 @@ class PopulationManager(Manager):
     CONFIGURATION_DEFAULTS = {
         "population": {
             "population_size": 100,
+            "compact_dtypes": False,
+            "storage": {
+                "backend": "memory",
+                "scratch_directory": None,
+            },
         },
     }
 
@@ -74,24 +83,59 @@ class PopulationManager(Manager):
         columns created for the simulation, but also serves as the simulant
         index for the entire population. Even if no private columns are created,
         this dataframe will exist and all simulants will be represented by its index.
+
+        When private columns are stored in memory-mapped files, accessing this
+        property reads every stored column into memory.
         """
         if self._private_columns is None:
             raise PopulationError("Population has not been initialized.")
+        if self._column_store is not None:
+            return pd.concat(
+                [
+                    self._private_columns,
+                    self._column_store.to_frame(self._private_columns.index),
+                ],
+                axis=1,
+            )
         return self._private_columns
 
+    @property
+    def pipeline_evaluation_depth(self) -> int:
+        """How deeply nested the attribute pipeline evaluation on this thread is.
+
+        The depth is tracked separately for each thread so that event listeners
+        run concurrently do not suppress each other's tracked queries.
+        """
+        return self._pipeline_evaluation_depths.get(threading.get_ident(), 0)
+
+    @pipeline_evaluation_depth.setter
+    def pipeline_evaluation_depth(self, depth: int) -> None:
+        thread_id = threading.get_ident()
+        if depth:
+            self._pipeline_evaluation_depths[thread_id] = depth
+        else:
+            self._pipeline_evaluation_depths.pop(thread_id, None)
+
     ############################
     # Normal Component Methods #
     ############################
 
     def __init__(self) -> None:
         self._private_columns: pd.DataFrame | None = None
+        self._column_store: MemmapColumnStore | None = None
+        self._use_compact_dtypes = False
+        self._compact_dtypes: dict[str, Any] = {}
+        self._compact_dtype_savings: dict[str, int] = {}
         self._private_column_metadata: defaultdict[str, list[str]] = defaultdict(list)
         self._registered_initializers: list[Callable[[SimulantData], None]] = []
         self.creating_initial_population = False
         self.adding_simulants = False
         self._last_id = -1
         self.tracked_queries: list[str] = []
-        self.pipeline_evaluation_depth: int = 0
+        self._pipeline_evaluation_depths: dict[int, int] = {}
+        # Guards the private columns against concurrent reads and writes from
+        # event listeners run in parallel.
+        self._lock = threading.RLock()
 
     def setup(self, builder: Builder) -> None:
         """Registers the population manager with other vivarium systems."""
@@ -107,6 +151,8 @@ class PopulationManager(Manager):
             builder.components.get_current_component_or_manager
         )
         self.get_current_state = builder.lifecycle.current_state()
+        self._column_store = self._get_column_store(builder.configuration.population.storage)
+        self._use_compact_dtypes = builder.configuration.population.compact_dtypes
 
         builder.lifecycle.add_constraint(
             self.get_view,
@@ -141,6 +187,41 @@ class PopulationManager(Manager):
     def __repr__(self) -> str:
         return "PopulationManager()"
 
+    @staticmethod
+    def _get_column_store(storage_config: LayeredConfigTree) -> MemmapColumnStore | None:
+        """Builds the store for private columns that are not held in memory.
+
+        Parameters
+        ----------
+        storage_config
+            The ``population.storage`` configuration block.
+
+        Returns
+        -------
+            A memory-mapped column store if the ``"memmap"`` backend is configured,
+            otherwise None.
+
+        Raises
+        ------
+        PopulationError
+            If the backend is unknown or if the ``"memmap"`` backend is requested
+            without a scratch directory.
+        """
+        backend = storage_config.backend
+        if backend not in STORAGE_BACKENDS:
+            raise PopulationError(
+                f"Unknown population storage backend '{backend}'. "
+                f"Must be one of {STORAGE_BACKENDS}."
+            )
+        if backend == "memory":
+            return None
+        if not storage_config.scratch_directory:
+            raise PopulationError(
+                "A scratch directory must be provided in the configuration at "
+                "'population.storage.scratch_directory' to use the 'memmap' backend."
+            )
+        return MemmapColumnStore(storage_config.scratch_directory)
+
     ###########################
     # Builder API and helpers #
     ###########################
@@ -169,6 +250,102 @@ class PopulationManager(Manager):
             return
         self.tracked_queries.append(query)
 
+    @property
+    def compact_dtype_savings(self) -> dict[str, int]:
+        """The number of bytes saved in each private column by compacting its dtype.
+
+        Only populated when the ``population.compact_dtypes`` configuration option
+        is enabled. The savings are measured when each column is first created.
+        """
+        return self._compact_dtype_savings
+
+    def get_memory_usage(self) -> dict[str, int]:
+        """Gets the number of bytes used by each private column.
+
+        Columns stored in memory-mapped files are measured by the size of
+        their data on disk.
+
+        Returns
+        -------
+            A mapping from private column names to the bytes they use.
+        """
+        if self._private_columns is None:
+            return {}
+        memory_usage = {
+            str(column): int(nbytes)
+            for column, nbytes in self._private_columns.memory_usage(
+                index=False, deep=True
+            ).items()
+        }
+        if self._column_store is not None:
+            for column in self._column_store.columns:
+                memory_usage[column] = self._column_store.nbytes(column)
+        return memory_usage
+
+    def copy_column_store(self) -> None:
+        """Moves private columns stored in memory-mapped files to new files.
+
+        The files are shared with any process forked from the one that created
+        them, so a simulation branched in a forked process must copy them
+        before it changes the population. Does nothing if private columns are
+        held in memory.
+        """
+        with self._lock:
+            if self._column_store is not None:
+                self._column_store = self._column_store.copy()
+
+    def get_checkpoint_data(self) -> dict[str, pd.DataFrame]:
+        """Gets a copy of the private columns for a checkpoint.
+
+        Each private column is copied to its own table, so a checkpoint only
+        needs to rewrite the columns that have changed since the last one.
+
+        Returns
+        -------
+            A table holding the population index and a table for each private
+            column, keyed by ``"column.<name>"``.
+        """
+        with self._lock:
+            if self._private_columns is None:
+                raise PopulationError("Population has not been initialized.")
+            columns = list(self._private_columns.columns)
+            if self._column_store is not None:
+                columns += self._column_store.columns
+            data = {"index": pd.DataFrame(index=self._private_columns.index)}
+            # Reading private columns copies them, so the tables are unaffected
+            # by later updates to the population.
+            for column in columns:
+                data[f"column.{column}"] = self._get_private_column_data([column])
+            return data
+
+    def restore_checkpoint_data(self, data: dict[str, pd.DataFrame]) -> None:
+        """Replaces the population with the private columns from a checkpoint.
+
+        Parameters
+        ----------
+        data
+            The tables returned by :meth:`get_checkpoint_data` when the
+            checkpoint was taken.
+
+        Raises
+        ------
+        PopulationError
+            If the checkpoint has no population index.
+        """
+        if "index" not in data:
+            raise PopulationError(
+                "The checkpoint has no population index. It may be incomplete "
+                "or taken before the population was initialized."
+            )
+        with self._lock:
+            index = data["index"].index
+            self._private_columns = pd.DataFrame(index=index)
+            if self._column_store is not None:
+                self._column_store.resize(len(index))
+            columns = [table for name, table in data.items() if name.startswith("column.")]
+            if columns:
+                self.__update(pd.concat(columns, axis=1))
+
     def get_private_column_names(self, component_name: str) -> list[str]:
         """Gets the names of private columns created by a given component.
 
@@ -276,14 +453,43 @@ class PopulationManager(Manager):
                         f"private columns to which it does not have access: {missing_cols}."
                     )
                 returned_cols = columns
-        private_columns = self.private_columns[returned_cols]
+        private_columns = self._get_private_column_data(returned_cols, index)
         if squeeze:
             private_columns = private_columns.squeeze(axis=1)
-        return private_columns.loc[index] if index is not None else private_columns
+        return private_columns
+
+    def _get_private_column_data(
+        self, columns: list[str], index: pd.Index[int] | None = None
+    ) -> pd.DataFrame:
+        """Reads private columns from wherever they are stored."""
+        with self._lock:
+            if self._private_columns is None:
+                raise PopulationError("Population has not been initialized.")
+            if self._column_store is None:
+                if index is None:
+                    return self._private_columns[columns]
+                return self._private_columns.loc[index, columns]
+
+            index = index if index is not None else self._private_columns.index
+            stored_columns = set(self._column_store.columns)
+            data = self._private_columns.loc[
+                index, [column for column in columns if column not in stored_columns]
+            ]
+            for column in columns:
+                if column in stored_columns:
+                    data[column] = self._column_store.read(column, index)
+            return data[columns]
+
+    def _has_private_column(self, column: str) -> bool:
+        if self._column_store is not None and column in self._column_store.columns:
+            return True
+        return self._private_columns is not None and column in self._private_columns
 
     def get_population_index(self) -> pd.Index[int]:
         """Gets the index of the current population."""
-        return self.private_columns.index
+        if self._private_columns is None:
+            raise PopulationError("Population has not been initialized.")
+        return self._private_columns.index
 
     def get_view(self, component: Component | None = None) -> PopulationView:
         """Gets a time-varying view of the population state table.
@@ -347,6 +553,12 @@ class PopulationManager(Manager):
 
     def _create_simulants(
         self, count: int, population_configuration: dict[str, Any] | None = None
+    ) -> pd.Index[int]:
+        with self._lock:
+            return self.__create_simulants(count, population_configuration)
+
+    def __create_simulants(
+        self, count: int, population_configuration: dict[str, Any] | None
     ) -> pd.Index[int]:
         population_configuration = (
             population_configuration if population_configuration else {}
@@ -359,17 +571,24 @@ class PopulationManager(Manager):
         new_population = self._private_columns.reindex(new_index)
         index = new_population.index.difference(self._private_columns.index)
         self._private_columns = new_population
+        if self._column_store is not None:
+            self._column_store.resize(len(new_population))
         self.adding_simulants = True
         for initializer in self.resources.get_population_initializers():
             initializer(
                 SimulantData(index, population_configuration, self.clock(), self.step_size())
             )
+        if self.creating_initial_population and self._compact_dtype_savings:
+            self.logger.info(
+                "Compacting private column dtypes saved "
+                f"{sum(self._compact_dtype_savings.values()) / 1e6:.2f} MB."
+            )
         self.creating_initial_population = False
         self.adding_simulants = False
 
         missing = {}
         for component, cols_created in self._private_column_metadata.items():
-            missing_cols = [col for col in cols_created if col not in self._private_columns]
+            missing_cols = [col for col in cols_created if not self._has_private_column(col)]
             if missing_cols:
                 missing[component] = missing_cols
         if missing:
@@ -742,9 +961,7 @@ class PopulationManager(Manager):
             if name in requested_attributes and pipeline.is_simple
         ]
         if simple_attributes:
-            if self._private_columns is None:
-                raise PopulationError("Population has not been initialized.")
-            attributes_list.append(self._private_columns.loc[idx, simple_attributes])
+            attributes_list.append(self._get_private_column_data(simple_attributes, idx))
 
         # handle remaining non-simple attributes one by one
         remaining_attributes = [
@@ -794,5 +1011,69 @@ class PopulationManager(Manager):
 
         return df
 
+    def conform_to_compact_dtypes(self, update: pd.DataFrame) -> pd.DataFrame:
+        """Casts an update to the compact dtypes chosen for the updated columns.
+
+        Parameters
+        ----------
+        update
+            The updated values for one or more private columns.
+
+        Returns
+        -------
+            The update with each compacted column cast to its compact dtype.
+        """
+        compacted = [column for column in update.columns if column in self._compact_dtypes]
+        if not compacted:
+            return update
+        update = update.copy()
+        for column in compacted:
+            update[column] = pop_utils.conform_dtype(
+                update[column], self._compact_dtypes[column]
+            )
+            self._compact_dtypes[column] = update[column].dtype
+        return update
+
+    def _compact_new_columns(self, update: pd.DataFrame) -> pd.DataFrame:
+        """Chooses compact dtypes for columns that are being created."""
+        if self._private_columns is None:
+            raise PopulationError("Population has not been initialized.")
+        new_columns = [
+            column for column in update.columns if not self._has_private_column(column)
+        ]
+        if not new_columns:
+            return update
+        update = update.copy()
+        for column in new_columns:
+            original_size = update[column].memory_usage(index=False, deep=True)
+            update[column] = pop_utils.compact_dtype(update[column])
+            compact_size = update[column].memory_usage(index=False, deep=True)
+            self._compact_dtypes[column] = update[column].dtype
+            self._compact_dtype_savings[column] = original_size - compact_size
+        return update
+
     def update(self, update: pd.DataFrame) -> None:
-        self.private_columns[update.columns] = update
+        with self._lock:
+            self.__update(update)
+
+    def __update(self, update: pd.DataFrame) -> None:
+        if self._private_columns is None:
+            raise PopulationError("Population has not been initialized.")
+        if self._use_compact_dtypes:
+            update = self._compact_new_columns(update)
+        if self._column_store is not None:
+            stored_columns = [
+                column
+                for column in update.columns
+                if column in self._column_store.columns
+                or (
+                    column not in self._private_columns
+                    and self._column_store.can_store(update[column].dtype)
+                )
+            ]
+            for column in stored_columns:
+                self._column_store.write(column, update[column])
+            update = update.drop(columns=stored_columns)
+            if update.columns.empty:
+                return
+        self._private_columns[update.columns] = update
@@ -369,6 +369,7 @@ class PopulationView:
             new_columns = list(set(data_df.columns).difference(existing.columns))
             self._manager.update(data_df[new_columns])
         elif not data_df.empty:
+            data_df = self._manager.conform_to_compact_dtypes(data_df)
             update_columns = list(set(data_df.columns).intersection(existing.columns))
             updated_cols_list = []
             for column in update_columns:
@@ -445,6 +446,7 @@ class PopulationView:
         result_df = self._coerce_update_result(result, column_list, current_data.index)
 
         if not result_df.empty:
+            result_df = self._manager.conform_to_compact_dtypes(result_df)
             existing_full = pd.DataFrame(current_data) if squeeze else current_data
             updated_cols_list = []
             for column in result_df.columns:
@@ -629,6 +631,14 @@ class PopulationView:
         #  to do all these sequential operations on a single underlying dataframe during
         #  the creation of new simulants besides the fact that it's the existing
         #  implementation.
+        if (
+            isinstance(existing.dtype, pd.CategoricalDtype)
+            and isinstance(update.dtype, pd.CategoricalDtype)
+            and existing.dtype != update.dtype
+            and set(existing.dtype.categories).issubset(update.dtype.categories)
+        ):
+            # The update introduced new categories to the column.
+            existing = existing.astype(update.dtype)
         update_values = update.array.copy()
         new_values = existing.array.copy()
         update_index_positional = existing.index.get_indexer(update.index)  # type: ignore [no-untyped-call]
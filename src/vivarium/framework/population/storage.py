@@ -0,0 +1,244 @@
+"""
+======================
+Private Column Storage
+======================
+
+Storage backends for the private columns of the
+:term:`population state table <Population State Table>`.
+
+By default, private columns live in an in-memory :class:`pandas.DataFrame` owned
+by the :class:`~vivarium.framework.population.manager.PopulationManager`. For
+populations that do not fit in memory, the ``"memmap"`` backend stores every
+fixed-width column (booleans, integers, floats, datetimes, and timedeltas) in a
+:class:`numpy.memmap` file in a scratch directory so that the operating system
+can page cold columns out to disk. Columns with object, string, or categorical
+dtypes cannot be memory-mapped and remain in memory.
+
+"""
+from __future__ import annotations
+
+import os
+import shutil
+import tempfile
+import weakref
+from pathlib import Path
+from typing import Any, Literal
+
+import numpy as np
+import numpy.typing as npt
+import pandas as pd
+
+from vivarium.framework.population.exceptions import PopulationError
+
+STORAGE_BACKENDS = ("memory", "memmap")
+"""The valid values for the ``population.storage.backend`` configuration key."""
+
+
+class MemmapColumnStore:
+    """A collection of private columns backed by memory-mapped files.
+
+    Each column is stored in its own file in a unique subdirectory of the
+    scratch directory. Files are allocated with spare capacity and grown
+    geometrically as simulants are added so that adding simulants does not
+    require rewriting every column.
+
+    The store assumes, as the rest of the population system does, that the
+    population index is a range index, i.e. that simulant index labels are
+    also positions in the underlying arrays.
+
+    Rows that have not been written hold a missing value (``NaN`` or ``NaT``)
+    in float, complex, datetime, and timedelta columns. Boolean and integer
+    columns have no missing value, so their unwritten rows hold zero, where
+    the in-memory backend would convert the column to hold missing values.
+
+    Notes
+    -----
+    The subdirectory is removed when the store that created it is garbage
+    collected or the interpreter exits. Pickling a store flushes the mapped
+    arrays to disk and records only the file locations, so a store restored
+    from a pickle can only be used while the original store is alive.
+    Checkpoints written by :meth:`SimulationContext.write_backup
+    <vivarium.framework.engine.SimulationContext.write_backup>` copy the
+    column data instead and do not depend on the scratch directory.
+
+    The files are mapped in shared mode, so a process forked from the one
+    that created the store writes to the same files. A forked process that
+    changes the population must first switch to its own files with
+    :meth:`copy`.
+    """
+
+    def __init__(self, scratch_directory: str | Path) -> None:
+        """
+        Parameters
+        ----------
+        scratch_directory
+            The directory in which to create the memory-mapped column files.
+        """
+        scratch_directory = Path(scratch_directory)
+        scratch_directory.mkdir(parents=True, exist_ok=True)
+        self._directory = Path(tempfile.mkdtemp(prefix="population_", dir=scratch_directory))
+        self._finalizer = weakref.finalize(
+            self, _remove_directory, self._directory, os.getpid()
+        )
+        self._size = 0
+        self._capacity = 0
+        self._arrays: dict[str, np.memmap[Any, Any]] = {}
+        self._files: dict[str, Path] = {}
+
+    @property
+    def directory(self) -> Path:
+        """The directory holding the memory-mapped column files."""
+        return self._directory
+
+    @property
+    def columns(self) -> list[str]:
+        """The names of the columns held by this store."""
+        return list(self._arrays)
+
+    @staticmethod
+    def can_store(dtype: Any) -> bool:
+        """Whether data of the given dtype can be held in a memory-mapped file."""
+        return isinstance(dtype, np.dtype) and dtype.kind in "biufcmM"
+
+    def resize(self, size: int) -> None:
+        """Sets the number of simulants represented in the store.
+
+        Parameters
+        ----------
+        size
+            The new number of simulants. Must not be smaller than the current size.
+        """
+        if size < self._size:
+            raise PopulationError("The population cannot shrink.")
+        if size > self._capacity:
+            self._capacity = max(size, 2 * self._capacity)
+            for column in self._arrays:
+                self._arrays[column] = self._open(column, self._arrays[column].dtype)
+        self._size = size
+
+    def read(self, column: str, index: pd.Index[int]) -> pd.Series[Any]:
+        """Reads the values of a column for the simulants in the index.
+
+        Parameters
+        ----------
+        column
+            The name of the column to read.
+        index
+            The simulants whose values should be read.
+
+        Returns
+        -------
+            An in-memory copy of the requested values.
+        """
+        values: npt.NDArray[Any] = self._arrays[column][: self._size][index.to_numpy()]
+        series: pd.Series[Any] = pd.Series(values, index=index, name=column)
+        return series
+
+    def write(self, column: str, values: pd.Series[Any]) -> None:
+        """Writes values to a column, creating the column file if necessary.
+
+        Parameters
+        ----------
+        column
+            The name of the column to write.
+        values
+            The new values, indexed by the simulants to update. If the dtype
+            of the values differs from the stored dtype, the column is
+            rewritten with the new dtype.
+
+        Raises
+        ------
+        PopulationError
+            If the values cannot be stored in a memory-mapped file.
+        """
+        dtype = values.dtype
+        if not self.can_store(dtype) or not isinstance(dtype, np.dtype):
+            raise PopulationError(
+                f"Column '{column}' with dtype {dtype} cannot be memory-mapped."
+            )
+        if column not in self._arrays:
+            self._files[column] = self._directory / f"column_{len(self._files)}.dat"
+            self._arrays[column] = self._open(column, dtype)
+        elif self._arrays[column].dtype != dtype:
+            existing = np.asarray(self._arrays[column][: self._size]).astype(dtype)
+            self._files[column].unlink()
+            self._arrays[column] = self._open(column, dtype)
+            self._arrays[column][: self._size] = existing
+        self._arrays[column][values.index.to_numpy()] = values.to_numpy()
+
+    def copy(self) -> MemmapColumnStore:
+        """Copies the store into a new subdirectory of the same scratch directory.
+
+        Returns
+        -------
+            A store holding the same columns in files of its own.
+        """
+        self.flush()
+        store = MemmapColumnStore(self._directory.parent)
+        store._size = self._size
+        store._capacity = self._capacity
+        for column, array in self._arrays.items():
+            store._files[column] = store._directory / self._files[column].name
+            shutil.copyfile(self._files[column], store._files[column])
+            store._arrays[column] = store._open(column, array.dtype)
+        return store
+
+    def to_frame(self, index: pd.Index[int]) -> pd.DataFrame:
+        """Reads every stored column into an in-memory dataframe."""
+        return pd.DataFrame({column: self.read(column, index) for column in self._arrays})
+
+    def flush(self) -> None:
+        """Writes any pending changes in the mapped arrays to disk."""
+        for array in self._arrays.values():
+            array.flush()
+
+    def nbytes(self, column: str | None = None) -> int:
+        """The number of bytes used to represent the stored simulants.
+
+        Parameters
+        ----------
+        column
+            The column to measure. If None, all stored columns are measured.
+        """
+        arrays = self._arrays.values() if column is None else [self._arrays[column]]
+        return sum(array.dtype.itemsize * self._size for array in arrays)
+
+    def _open(self, column: str, dtype: np.dtype[Any]) -> np.memmap[Any, Any]:
+        path = self._files[column]
+        exists = path.exists()
+        written = path.stat().st_size // dtype.itemsize if exists else 0
+        mode: Literal["r+", "w+"] = "r+" if exists else "w+"
+        array: np.memmap[Any, Any] = np.memmap(
+            path, dtype=dtype, mode=mode, shape=(max(self._capacity, 1),)
+        )
+        # New files and the space added when growing a file are zero-filled.
+        # Rows that are never written hold missing values instead where the
+        # dtype has one, as they do in the in-memory backend.
+        if dtype.kind in "fc":
+            array[written:] = np.nan
+        elif dtype.kind in "mM":
+            array[written:] = np.array("NaT", dtype=dtype)
+        return array
+
+    def __getstate__(self) -> dict[str, Any]:
+        self.flush()
+        state = self.__dict__.copy()
+        state["_arrays"] = {column: array.dtype for column, array in self._arrays.items()}
+        # The original store owns the directory.
+        state["_finalizer"] = None
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        dtypes = state.pop("_arrays")
+        self.__dict__.update(state)
+        self._arrays = {column: self._open(column, dtype) for column, dtype in dtypes.items()}
+
+    def __repr__(self) -> str:
+        return f"MemmapColumnStore(directory={self._directory}, columns={self.columns})"
+
+
+def _remove_directory(directory: Path, owner_pid: int) -> None:
+    # A forked process inherits the store, but the directory belongs to the
+    # process that created it.
+    if os.getpid() == owner_pid:
+        shutil.rmtree(directory, ignore_errors=True)
@@ -4,7 +4,14 @@ Population Utility Functions
 ============================
 
 """
+from __future__ import annotations
+
 import re
+from typing import Any
+
+import numpy as np
+import pandas as pd
+import pandas.api.types as pdt
 
 
 def extract_columns_from_query(query: str) -> set[str]:
@@ -43,3 +50,60 @@ def combine_queries(*queries: str) -> str:
     Empty queries (i.e., '') are ignored.
     """
     return " and ".join([f"({query})" for query in filter(None, queries)])
+
+
+def compact_dtype(values: pd.Series[Any]) -> pd.Series[Any]:
+    """Converts a column to a more compact dtype that represents it exactly.
+
+    Columns of strings with many repeated values are converted to categoricals.
+    All other columns are returned unchanged. Numeric columns in particular are
+    never narrowed: components update them with arithmetic in the column's own
+    dtype, so a narrow integer would silently overflow and a 32-bit float
+    would silently lose precision before the update reaches the population.
+    Components that want a narrow numeric column can create it with that
+    dtype.
+
+    Parameters
+    ----------
+    values
+        The column to compact.
+
+    Returns
+    -------
+        The column with a compact dtype.
+    """
+    if values.empty or values.dtype != object:
+        return values
+    if pdt.infer_dtype(values, skipna=False) == "string":
+        if values.nunique() <= len(values) // 2:
+            return values.astype("category")
+    return values
+
+
+def conform_dtype(values: pd.Series[Any], dtype: Any) -> pd.Series[Any]:
+    """Casts a column update to a compact dtype previously chosen for the column.
+
+    Updates of a categorical column are cast to its categorical dtype, which is
+    extended with any new categories present in the update. Updates of any
+    other column are returned unchanged.
+
+    Parameters
+    ----------
+    values
+        The updated values for the column.
+    dtype
+        The compact dtype of the column.
+
+    Returns
+    -------
+        The update cast to the (possibly extended) compact dtype.
+    """
+    if values.dtype == dtype or not isinstance(dtype, pd.CategoricalDtype):
+        return values
+    new_categories = pd.Index(values.dropna().unique()).difference(dtype.categories)
+    if len(new_categories):
+        dtype = pd.CategoricalDtype(
+            np.concatenate([dtype.categories.to_numpy(), new_categories.to_numpy()])
+        )
+    categorical: pd.Series[Any] = values.astype(dtype)
+    return categorical
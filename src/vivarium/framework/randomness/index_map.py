@@ -20,6 +20,7 @@ import pandas as pd
 import pandas.api.types as pdt
 
 from vivarium.framework.randomness.exceptions import RandomnessError
+from vivarium.framework.utilities import get_nbytes
 from vivarium.types import ClockTime
 
 
@@ -266,5 +267,23 @@ class IndexMap:
     def __len__(self) -> int:
         return self._size
 
+    @property
+    def mapping(self) -> pd.Series[int] | None:
+        """The mapping from simulants and their key column values to randomness
+        indices, or None if no simulants have been added.
+
+        Adding simulants replaces the mapping rather than modifying it, so a
+        mapping that has been read is unaffected by later updates.
+        """
+        return self._map
+
+    @mapping.setter
+    def mapping(self, mapping: pd.Series[int] | None) -> None:
+        self._map = mapping
+
+    def nbytes(self) -> int:
+        """The number of bytes used by the mapping."""
+        return 0 if self._map is None else get_nbytes(self._map)
+
     def __repr__(self) -> str:
         return "IndexMap({})".format("\n         ".join(repr(self._map).split("\n")))
@@ -22,6 +22,7 @@ from vivarium.types import ClockTime
 if TYPE_CHECKING:
     from vivarium.component import Component
     from vivarium.framework.engine import Builder
+    from vivarium.framework.event import Event
     from vivarium.framework.resource import Resource
 
 
@@ -82,6 +83,8 @@ class RandomnessManager(Manager):
         self._rate_conversion_type = builder.configuration.randomness.rate_conversion_type
         self._add_constraint = builder.lifecycle.add_constraint
         self._add_resource = builder.resources.add_resource
+        self._profiler = builder.lifecycle.get_profiler()
+        builder.event.register_listener(lifecycle_states.POST_SETUP, self.on_post_setup)
 
         self._add_constraint(self.get_seed, restrict_during=[lifecycle_states.INITIALIZATION])
         self._add_constraint(
@@ -98,6 +101,13 @@ class RandomnessManager(Manager):
             ],
         )
 
+    def on_post_setup(self, event: Event) -> None:
+        if self._profiler.enabled:
+            for stream in self._decision_points.values():
+                stream.get_draw = self._profiler.wrap(  # type: ignore [method-assign]
+                    "randomness_stream", stream.key, stream.get_draw
+                )
+
     def get_randomness_stream(
         self,
         decision_point: str,
@@ -243,6 +253,44 @@ class RandomnessManager(Manager):
             )
         self._key_mapping.update(simulants.loc[:, self._key_columns], self._clock())
 
+    def get_memory_usage(self) -> dict[str, int]:
+        """Gets the number of bytes used by the common random number index map.
+
+        Returns
+        -------
+            A mapping from the name of the index map to the bytes it uses.
+        """
+        if self._key_mapping_ is None:
+            return {}
+        return {"index_map": self._key_mapping_.nbytes()}
+
+    def get_checkpoint_data(self) -> dict[str, pd.DataFrame]:
+        """Gets the common random number index map for a checkpoint.
+
+        Randomness streams draw from a hash of the decision point, clock time,
+        and seed, so the index map is the only randomness state that changes
+        as the simulation runs.
+
+        Returns
+        -------
+            A table of the index map, if common random numbers are in use and
+            simulants have been added.
+        """
+        mapping = self._key_mapping.mapping
+        return {} if mapping is None else {"index_map": mapping.to_frame(name="value")}
+
+    def restore_checkpoint_data(self, data: dict[str, pd.DataFrame]) -> None:
+        """Restores the common random number index map from a checkpoint.
+
+        Parameters
+        ----------
+        data
+            The tables returned by :meth:`get_checkpoint_data` when the
+            checkpoint was taken.
+        """
+        if "index_map" in data:
+            self._key_mapping.mapping = data["index_map"]["value"]
+
     def __str__(self) -> str:
         return "RandomnessManager()"
 
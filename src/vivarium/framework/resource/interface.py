@@ -89,3 +89,18 @@ class ResourceInterface(Interface):
         creation time.
         """
         return self._manager.get_population_initializers()
+
+    def get_columns_read(self, attributes: Iterable[str]) -> set[str]:
+        """Gets the private columns that reading some attributes reads.
+
+        Parameters
+        ----------
+        attributes
+            The names of the attributes or private columns read.
+
+        Returns
+        -------
+            The names of the private columns the attributes are produced from,
+            directly or through other resources.
+        """
+        return self._manager.get_columns_read(attributes)
@@ -194,6 +194,36 @@ class ResourceManager(Manager):
         """
         return [r.initializer for r in self.sorted_nodes if isinstance(r, Initializer)]
 
+    def get_columns_read(self, attributes: Iterable[str]) -> set[str]:
+        """Gets the private columns that reading some attributes reads.
+
+        Parameters
+        ----------
+        attributes
+            The names of the attributes or private columns read.
+
+        Returns
+        -------
+            The names of the private columns the attributes are produced from,
+            directly or through other resources.
+        """
+        from vivarium.framework.values import AttributePipeline
+
+        graph = self.get_graph()
+        columns = set()
+        for name in attributes:
+            for resource_id in [
+                Column.get_resource_id(name),
+                AttributePipeline.get_resource_id(name),
+            ]:
+                resource = self._resources.get(resource_id)
+                if resource is None or resource not in graph:
+                    continue
+                for dependency in {resource} | nx.ancestors(graph, resource):
+                    if isinstance(dependency, Column):
+                        columns.add(dependency.name)
+        return columns
+
     def __repr__(self) -> str:
         out = {
             r.resource_id: ", ".join(r.required_resources)
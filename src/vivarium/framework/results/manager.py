@@ -17,6 +17,7 @@ from vivarium.framework.lifecycle import lifecycle_states
 from vivarium.framework.results.context import ResultsContext
 from vivarium.framework.results.observation import Observation
 from vivarium.framework.results.stratification import Stratification, get_mapped_col_name
+from vivarium.framework.utilities import get_nbytes
 from vivarium.manager import Manager
 from vivarium.types import ScalarMapper, VectorMapper
 
@@ -64,6 +65,37 @@ class ResultsManager(Manager):
             formatted[name] = observation.results_formatter(name, results)
         return formatted
 
+    def get_memory_usage(self) -> dict[str, int]:
+        """Gets the number of bytes used by the raw results of each observation.
+
+        Returns
+        -------
+            A mapping from observation names to the bytes used by their raw results.
+        """
+        return {name: get_nbytes(results) for name, results in self._raw_results.items()}
+
+    def get_checkpoint_data(self) -> dict[str, pd.DataFrame]:
+        """Gets a copy of the raw results of each observation for a checkpoint.
+
+        Returns
+        -------
+            A mapping from observation names to copies of their raw results.
+        """
+        return {name: results.copy() for name, results in self._raw_results.items()}
+
+    def restore_checkpoint_data(self, data: dict[str, pd.DataFrame]) -> None:
+        """Restores the raw results of each observation from a checkpoint.
+
+        Parameters
+        ----------
+        data
+            The tables returned by :meth:`get_checkpoint_data` when the
+            checkpoint was taken.
+        """
+        for name, results in data.items():
+            if name in self._raw_results:
+                self._raw_results[name] = results
+
     # noinspection PyAttributeOutsideInit
     def setup(self, builder: "Builder") -> None:
         """Sets up the results manager."""
@@ -14,7 +14,9 @@ from enum import Enum
 from typing import TYPE_CHECKING, Any, Iterator
 
 import numpy as np
+import numpy.typing as npt
 import pandas as pd
+from scipy import sparse
 
 from vivarium import Component
 
@@ -22,7 +24,7 @@ if TYPE_CHECKING:
     from vivarium.framework.engine import Builder
     from vivarium.framework.event import Event
     from vivarium.framework.population import PopulationView, SimulantData
-    from vivarium.types import ClockTime, DataInput, NumericArray
+    from vivarium.types import ClockStepSize, ClockTime, DataInput, NumericArray
 
 
 def default_probability_function(index: pd.Index[int]) -> pd.Series[float]:
@@ -57,7 +59,25 @@ def _next_state(
 
     outputs, decisions = transition_set.choose_new_state(index)
     groups = _groupby_new_state(index, outputs, decisions)
+    _apply_transitions(groups, event_time, population_view)
 
+
+def _apply_transitions(
+    groups: list[tuple[State | str, pd.Index[int]]],
+    event_time: ClockTime,
+    population_view: PopulationView,
+) -> None:
+    """Applies the transition effects of each output state to its simulants.
+
+    Parameters
+    ----------
+    groups
+        Pairs of an output state and the simulants transitioning into it.
+    event_time
+        When this transition is occurring.
+    population_view
+        A view of the internal state of the simulation.
+    """
     if groups:
         for output, affected_index in sorted(groups, key=lambda x: str(x[0])):
             if output == "null_transition":
@@ -100,6 +120,43 @@ def _groupby_new_state(
     return [(output, pd.Index(sub_group.values)) for output, sub_group in groups]
 
 
+def _concatenate_indexes(indexes: list[pd.Index[int]]) -> pd.Index[int]:
+    if len(indexes) == 1:
+        return indexes[0]
+    concatenated: pd.Index[int] = pd.Index(
+        np.concatenate([index.to_numpy() for index in indexes])
+    )
+    return concatenated
+
+
+def _partition_codes(
+    codes: npt.NDArray[np.integer[Any]], n_groups: int
+) -> tuple[npt.NDArray[np.intp], npt.NDArray[np.intp]]:
+    """Partitions positions by integer group code in a single pass.
+
+    Parameters
+    ----------
+    codes
+        A group code in ``[0, n_groups)`` for each position, or a negative
+        code for positions belonging to no group.
+    n_groups
+        The number of groups.
+
+    Returns
+    -------
+        An ordering of the positions sorted stably by code and the bounds of
+        each group in that ordering, such that the positions in group ``i``
+        are ``order[bounds[i]:bounds[i + 1]]``.
+    """
+    order = np.argsort(codes, kind="stable")
+    bounds = np.searchsorted(codes[order], np.arange(n_groups + 1))
+    return order, bounds
+
+
+def _overrides_next_state(state: State) -> bool:
+    return type(state).next_state is not State.next_state
+
+
 class Trigger(Enum):
     NOT_TRIGGERED = 0
     START_INACTIVE = 1
@@ -196,6 +253,17 @@ class State(Component):
     transition_set
         A container for potential transitions out of this state.
 
+    Notes
+    -----
+    Simulants in a state declared absorbing, or that entered a state with a
+    minimum dwell time less than that time ago, are excluded from the
+    transition work of their :class:`Machine`. The machine records when
+    simulants may next transition in its :attr:`Machine.eligible_time_column`
+    as they enter states through its own transitions, so the state column
+    of a machine with such states should not be modified by other components.
+    Simulants initialized into a state with a minimum dwell time may leave it
+    immediately, since how long they have already spent in it is unknown.
+
     """
 
     ##############
@@ -216,6 +284,16 @@ class State(Component):
     def model(self) -> str | None:
         return self._model
 
+    @property
+    def is_absorbing(self) -> bool:
+        """Whether simulants can never leave this state."""
+        return self._absorbing
+
+    @property
+    def dwell_time(self) -> ClockStepSize | None:
+        """The minimum time simulants spend in this state before leaving it."""
+        return self._minimum_dwell_time
+
     #####################
     # Lifecycle methods #
     #####################
@@ -225,9 +303,38 @@ class State(Component):
         state_id: str,
         allow_self_transition: bool = True,
         initialization_weights: DataInput = 0.0,
+        absorbing: bool = False,
+        minimum_dwell_time: ClockStepSize | None = None,
     ) -> None:
+        """
+        Parameters
+        ----------
+        state_id
+            The name of this state.
+        allow_self_transition
+            Whether simulants may remain in this state on a time step.
+        initialization_weights
+            The weights used to initialize simulants into this state.
+        absorbing
+            Whether simulants can never leave this state. Absorbing states
+            cannot have transitions.
+        minimum_dwell_time
+            The minimum time simulants must spend in this state after
+            entering it before they can transition out of it.
+
+        Raises
+        ------
+        ValueError
+            If the state is declared absorbing and given a minimum dwell time.
+        """
+        if absorbing and minimum_dwell_time is not None:
+            raise ValueError(
+                f"State '{state_id}' cannot be absorbing and have a minimum dwell time."
+            )
         super().__init__()
         self.state_id = state_id
+        self._absorbing = absorbing
+        self._minimum_dwell_time = minimum_dwell_time
         self.transition_set = TransitionSet(
             self.state_id, allow_self_transition=allow_self_transition
         )
@@ -327,7 +434,14 @@ class State(Component):
             probability of 1.0 for all simulants in the state.
         triggered
             A flag indicating whether this transition is triggered by some event.
+
+        Raises
+        ------
+        ValueError
+            If this state is absorbing.
         """
+        if self.is_absorbing:
+            raise ValueError(f"Cannot add a transition to absorbing state '{self.state_id}'.")
         if transition is not None:
             if (
                 output_state is not None
@@ -527,6 +641,123 @@ class TransitionSet(Component):
         return hash(id(self))
 
 
+class TransitionMatrix:
+    """A sparse representation of the transitions between the states of a machine.
+
+    Transitions are stored in compressed sparse row (CSR) form over the codes
+    of the machine's states: the transitions out of the state with code ``i``
+    are ``transitions[indptr[i]:indptr[i + 1]]`` and lead to the states with
+    codes ``indices[indptr[i]:indptr[i + 1]]``. Memory is proportional to the
+    number of transitions actually defined rather than to the square of the
+    number of states.
+
+    Transition probabilities are evaluated in one batch per input state and
+    new states are drawn from each state's own :class:`TransitionSet`
+    randomness stream, so decisions are identical to those made by
+    :meth:`State.next_state`.
+
+    Attributes
+    ----------
+    states
+        The states of the machine, in code order.
+    indptr
+        The offsets of each state's transitions in ``indices`` and ``transitions``.
+    indices
+        The code of the output state of each transition.
+    transitions
+        The transitions, grouped by input state.
+    """
+
+    def __init__(self, states: Sequence[State]) -> None:
+        """
+        Parameters
+        ----------
+        states
+            The states of the machine. States that override
+            :meth:`State.next_state` are given no transitions in the matrix
+            and must be transitioned individually.
+
+        Raises
+        ------
+        ValueError
+            If a transition leads to a state that is not one of the states.
+        """
+        self.states = list(states)
+        codes = {id(state): code for code, state in enumerate(self.states)}
+        indptr = [0]
+        indices = []
+        self.transitions: list[Transition] = []
+        for state in self.states:
+            if not _overrides_next_state(state):
+                for transition in state.transition_set:
+                    if id(transition.output_state) not in codes:
+                        raise ValueError(
+                            f"Transition output state '{transition.output_state.state_id}'"
+                            f" from state '{state.state_id}' is not one of the states"
+                            " of the machine."
+                        )
+                    indices.append(codes[id(transition.output_state)])
+                    self.transitions.append(transition)
+            indptr.append(len(indices))
+        self.indptr = np.array(indptr, dtype=np.intp)
+        self.indices = np.array(indices, dtype=np.intp)
+
+    @property
+    def nnz(self) -> int:
+        """The number of transitions in the matrix."""
+        return len(self.transitions)
+
+    def to_sparse(self) -> sparse.csr_array:
+        """Returns the adjacency structure of the machine as a sparse array.
+
+        Returns
+        -------
+            A square array over state codes with a one at ``(i, j)`` for every
+            transition from state ``i`` to state ``j``.
+        """
+        n_states = len(self.states)
+        return sparse.csr_array(
+            (np.ones(self.nnz), self.indices, self.indptr), shape=(n_states, n_states)
+        )
+
+    def choose_new_states(self, state_codes: pd.Series[int]) -> pd.Series[int]:
+        """Chooses a new state for each simulant.
+
+        Parameters
+        ----------
+        state_codes
+            The code of the current state of each simulant, indexed by simulant.
+
+        Returns
+        -------
+            The code of the new state of each simulant, or -1 for simulants
+            that do not transition.
+        """
+        codes = state_codes.to_numpy()
+        new_codes = np.full(len(codes), -1, dtype=np.intp)
+        order, bounds = _partition_codes(codes, len(self.states))
+        for code, state in enumerate(self.states):
+            start, end = self.indptr[code], self.indptr[code + 1]
+            if start == end or bounds[code] == bounds[code + 1]:
+                continue
+            positions = order[bounds[code] : bounds[code + 1]]
+            index = state_codes.index[positions]
+            probabilities = np.column_stack(
+                [
+                    np.array(transition.probability(index))
+                    for transition in self.transitions[start:end]
+                ]
+            )
+            transition_set = state.transition_set
+            targets, probabilities = transition_set._normalize_probabilities(
+                list(self.indices[start:end]), probabilities
+            )
+            target_codes = np.array([-1 if t == "null_transition" else t for t in targets])
+            choices = transition_set.random.choice(index, target_codes, probabilities)
+            new_codes[positions] = choices.to_numpy()
+        return pd.Series(new_codes, index=state_codes.index)
+
+
 class Machine(Component):
     """A collection of states and transitions between those states.
 
@@ -536,6 +767,13 @@ class Machine(Component):
         The collection of states represented by this state machine.
     state_column
         A label for the piece of simulation state governed by this state machine.
+    transition_matrix
+        A sparse representation of the machine's transitions, compiled after
+        setup if the machine was created with ``sparse_transitions=True``.
+    eligible_time_column
+        A private column holding the time at which each simulant may next
+        transition. It is only created if the machine has an absorbing state
+        or a state with a minimum dwell time.
 
     """
 
@@ -556,11 +794,45 @@ class Machine(Component):
         state_column: str,
         states: Iterable[State] = (),
         initial_state: State | None = None,
+        sparse_transitions: bool = False,
+        sequential_transitions: bool = False,
     ) -> None:
+        """
+        Parameters
+        ----------
+        state_column
+            A label for the piece of simulation state governed by this state machine.
+        states
+            The states of the machine.
+        initial_state
+            The state every simulant starts in. Cannot be combined with
+            initialization weights on the states.
+        sparse_transitions
+            Whether to compile the machine's transitions into a
+            :class:`TransitionMatrix` and choose new states for all simulants
+            with array operations over state codes.
+        sequential_transitions
+            Whether to move the simulants in each state in turn, applying each
+            state's transition effects before the next state's transition
+            probabilities are evaluated, as in vivarium 4.1 and earlier. See
+            :meth:`transition`. Cannot be combined with ``sparse_transitions``.
+
+        Raises
+        ------
+        ValueError
+            If both ``sparse_transitions`` and ``sequential_transitions`` are
+            requested.
+        """
+        if sparse_transitions and sequential_transitions:
+            raise ValueError("A machine cannot use both sparse and sequential transitions.")
         super().__init__()
         self.states: list[State] = []
         self.state_column = state_column
         self._initial_state = initial_state
+        self._sparse_transitions = sparse_transitions
+        self._sequential_transitions = sequential_transitions
+        self.transition_matrix: TransitionMatrix | None = None
+        self.eligible_time_column = f"{state_column}_eligible_time"
         self.initialization_weights_pipelines: list[str] = []
 
         if states:
@@ -577,9 +849,12 @@ class Machine(Component):
 
     def setup(self, builder: Builder) -> None:
         self.randomness = builder.randomness.get_stream(self.name)
+        columns = [self.state_column]
+        if self._tracks_eligibility:
+            columns.append(self.eligible_time_column)
         builder.population.register_initializer(
             initializer=self.initialize_state,
-            columns=self.state_column,
+            columns=columns,
             required_resources=[self.randomness, *self.initialization_weights_pipelines],
         )
 
@@ -599,6 +874,8 @@ class Machine(Component):
                 "Must specify either an initial state or provide"
                 " initialization weights to states."
             )
+        if self._sparse_transitions:
+            self.transition_matrix = TransitionMatrix(self.states)
 
     def initialize_state(self, pop_data: SimulantData) -> None:
         state_ids = [s.state_id for s in self.states]
@@ -609,7 +886,20 @@ class Machine(Component):
         initial_states = self.randomness.choice(
             pop_data.index, state_ids, state_weights.to_numpy(), "initialization"
         ).rename(self.state_column)
-        self.population_view.initialize(initial_states)
+        if not self._tracks_eligibility:
+            self.population_view.initialize(initial_states)
+            return
+
+        eligible_time = pd.Series(
+            self._get_eligible_times(
+                self._encode(initial_states),
+                pop_data.creation_time,
+                include_dwell_time=False,
+            ),
+            index=pop_data.index,
+            name=self.eligible_time_column,
+        )
+        self.population_view.initialize(pd.concat([initial_states, eligible_time], axis=1))
 
     def on_time_step(self, event: Event) -> None:
         self.transition(event.index, event.time)
@@ -632,6 +922,32 @@ class Machine(Component):
     def transition(self, index: pd.Index[int], event_time: ClockTime) -> None:
         """Finds the population in each state and moves them to the next state.
 
+        The state column is partitioned once and each state's transition set
+        chooses new states for its simulants before any effects are applied,
+        so every transition probability is evaluated against the population
+        as it was at the start of the transition. Simulants are then grouped
+        by output state across all input states and each output state's
+        transition effect is applied once. If the machine has a
+        :attr:`transition_matrix`, new states are chosen through it instead of
+        through each state's transition set. States that override
+        :meth:`State.next_state` are transitioned individually afterwards.
+        Simulants in absorbing states, or that have not yet spent the minimum
+        dwell time in their state, are skipped.
+
+        Choosing every new state up front gives the same results as moving the
+        simulants in each state in turn only if no transition probability of
+        this machine depends on anything its own transition effects change in
+        the same step, e.g. the number of simulants in another of its states
+        or a column written by a transition effect. Such probabilities see
+        the population as it was before any of the machine's transitions.
+        Machines created with ``sequential_transitions=True`` instead move the
+        simulants in each state in turn with :meth:`State.next_state`, so
+        each state's probabilities see the effects of the transitions out of
+        the states before it. Different machines transition in separate
+        listeners, so a machine whose probabilities depend on another
+        machine's state sees the transitions of any machine whose listener
+        ran before its own either way.
+
         Parameters
         ----------
         index
@@ -639,27 +955,176 @@ class Machine(Component):
         event_time
             The time at which this transition occurs.
         """
-        for state, affected in self._get_state_pops(index):
-            if not affected.empty:
-                state.next_state(
-                    affected.index,
-                    event_time,
-                    self.population_view,
-                )
+        if self._tracks_eligibility:
+            eligible_time = self.population_view.get(index, self.eligible_time_column)
+            index = eligible_time.index[(eligible_time <= event_time).to_numpy()]
+
+        if self._sequential_transitions:
+            # Every state moves its own simulants, like a state that overrides
+            # next_state, in the order the states were added.
+            groups: list[tuple[State | str, pd.Index[int]]] = []
+            custom_states = [
+                (state, affected.index)
+                for state, affected in self._get_state_pops(index)
+                if not affected.empty
+            ]
+        elif self.transition_matrix is not None:
+            groups, custom_states = self._choose_transitions_from_matrix(index)
+        else:
+            groups, custom_states = self._choose_transitions_from_sets(index)
+
+        _apply_transitions(groups, event_time, self.population_view)
+        for state, state_index in custom_states:
+            state.next_state(state_index, event_time, self.population_view)
+
+        if self._tracks_eligibility:
+            self._update_eligible_time(groups, custom_states, event_time)
 
     def cleanup(self, index: pd.Index[int], event_time: ClockTime) -> None:
         for state, affected in self._get_state_pops(index):
             if not affected.empty:
                 state.cleanup_effect(affected.index, event_time)
 
+    def _choose_transitions_from_sets(
+        self, index: pd.Index[int]
+    ) -> tuple[list[tuple[State | str, pd.Index[int]]], list[tuple[State, pd.Index[int]]]]:
+        groups: dict[State | str, list[pd.Index[int]]] = {}
+        custom_states = []
+        for state, affected in self._get_state_pops(index):
+            if affected.empty:
+                continue
+            if _overrides_next_state(state):
+                custom_states.append((state, affected.index))
+                continue
+            transition_set = state.transition_set
+            if len(transition_set) == 0:
+                continue
+            outputs, decisions = transition_set.choose_new_state(affected.index)
+            for output, output_index in _groupby_new_state(
+                affected.index, outputs, decisions
+            ):
+                groups.setdefault(output, []).append(output_index)
+        return [
+            (output, _concatenate_indexes(indexes)) for output, indexes in groups.items()
+        ], custom_states
+
+    def _choose_transitions_from_matrix(
+        self, index: pd.Index[int]
+    ) -> tuple[list[tuple[State | str, pd.Index[int]]], list[tuple[State, pd.Index[int]]]]:
+        assert self.transition_matrix is not None
+        state_codes = self._get_state_codes(index)
+        new_codes = self.transition_matrix.choose_new_states(state_codes)
+        order, bounds = _partition_codes(new_codes.to_numpy(), len(self.states))
+        groups: list[tuple[State | str, pd.Index[int]]] = [
+            (state, new_codes.index[order[start:end]])
+            for state, start, end in zip(self.states, bounds[:-1], bounds[1:])
+            if start < end
+        ]
+        custom_states = []
+        for code, state in enumerate(self.states):
+            if _overrides_next_state(state):
+                state_index = state_codes.index[state_codes == code]
+                if not state_index.empty:
+                    custom_states.append((state, state_index))
+        return groups, custom_states
+
+    def _update_eligible_time(
+        self,
+        groups: list[tuple[State | str, pd.Index[int]]],
+        custom_states: list[tuple[State, pd.Index[int]]],
+        event_time: ClockTime,
+    ) -> None:
+        """Records when simulants that changed state may next transition."""
+        indexes = [index for output, index in groups if output != "null_transition"]
+        indexes.extend(index for _, index in custom_states)
+        if not indexes:
+            return
+        population = self._get_state_population(_concatenate_indexes(indexes))
+        for state, state_index in custom_states:
+            unchanged = state_index[
+                (population.loc[state_index] == state.state_id).to_numpy()
+            ]
+            population = population.drop(unchanged)
+        if not population.empty:
+            eligible_time = pd.Series(
+                self._get_eligible_times(self._encode(population), event_time),
+                index=population.index,
+            )
+            self.population_view.update(self.eligible_time_column, lambda _: eligible_time)
+
+    def _get_eligible_times(
+        self,
+        codes: npt.NDArray[np.integer[Any]],
+        entry_time: ClockTime,
+        include_dwell_time: bool = True,
+    ) -> npt.NDArray[Any]:
+        """Gets the earliest times at which simulants entering states can transition.
+
+        Parameters
+        ----------
+        codes
+            The codes of the states entered, or -1 for a state that is not
+            part of this machine.
+        entry_time
+            When the states were entered.
+        include_dwell_time
+            Whether to apply the states' minimum dwell times.
+
+        Returns
+        -------
+            The time at which each simulant becomes eligible to transition,
+            or a null value for simulants in absorbing states.
+        """
+        numeric_time = isinstance(entry_time, (int, float))
+        eligible_times: list[Any] = []
+        for state in self.states:
+            if state.is_absorbing:
+                eligible_times.append(np.nan if numeric_time else pd.NaT)
+            elif include_dwell_time and state.dwell_time is not None:
+                eligible_times.append(entry_time + state.dwell_time)  # type: ignore [operator]
+            else:
+                eligible_times.append(entry_time)
+        # Negative codes index this entry for states outside of the machine.
+        eligible_times.append(entry_time)
+        times = pd.Series(eligible_times)
+        values: npt.NDArray[Any] = (times.astype(float) if numeric_time else times).to_numpy()
+        eligible: npt.NDArray[Any] = values[codes]
+        return eligible
+
+    @property
+    def _tracks_eligibility(self) -> bool:
+        """Whether any state restricts when its simulants may transition."""
+        return any(
+            state.is_absorbing or state.dwell_time is not None for state in self.states
+        )
+
     def _get_state_pops(self, index: pd.Index[int]) -> list[tuple[State, pd.Series[Any]]]:
+        population = self._get_state_population(index)
+        # Partition the population by state in a single pass rather than
+        # comparing the state column against every state in turn.
+        order, bounds = _partition_codes(self._encode(population), len(self.states))
+        return [
+            (state, population.iloc[order[start:end]])
+            for state, start, end in zip(self.states, bounds[:-1], bounds[1:])
+        ]
+
+    def _get_state_codes(self, index: pd.Index[int]) -> pd.Series[int]:
+        population = self._get_state_population(index)
+        return pd.Series(self._encode(population), index=population.index)
+
+    def _get_state_population(self, index: pd.Index[int]) -> pd.Series[Any]:
         population = self.population_view.get(index, self.state_column)
         if not isinstance(population, pd.Series):
             raise TypeError(
                 "Expected population view to return a pandas Series for"
                 f" state column '{self.state_column}', but got: {type(population)}"
             )
-        return [(state, population[population == state.state_id]) for state in self.states]
+        return population
+
+    def _encode(self, population: pd.Series[Any]) -> npt.NDArray[np.integer[Any]]:
+        return pd.Categorical(
+            population, categories=[state.state_id for state in self.states]
+        ).codes
 
     ##################
     # Helper methods #
@@ -13,11 +13,14 @@ For more information about time in the simulation, see the associated
 
 from __future__ import annotations
 
+import heapq
 import math
+from collections.abc import Callable
 from functools import partial
 from typing import TYPE_CHECKING, Any
 
 import numpy as np
+import numpy.typing as npt
 import pandas as pd
 
 from vivarium.framework.lifecycle import lifecycle_states
@@ -29,10 +32,183 @@ if TYPE_CHECKING:
     from vivarium.framework.population import SimulantData
     from vivarium.framework.values import ValuesManager
 
-from vivarium.framework.values import list_combiner
 from vivarium.manager import Manager
 
 
+class EventTimeQueue:
+    """A calendar queue of the next event times of simulants.
+
+    Simulants are held in buckets keyed by their next event time discretized
+    to a grid of fixed width, typically the minimum step size of the clock,
+    and the occupied bucket keys are kept in a heap. Finding the simulants
+    whose next event time has been reached touches only the buckets that are
+    due, so its cost is proportional to the number of due simulants rather
+    than to the size of the population.
+
+    The queue does not store event times itself. Instead, every lookup checks
+    the simulants in a bucket against their actual next event times, and
+    simulants found in the wrong bucket are moved to the right one. A
+    simulant whose next event time was moved later without rescheduling it in
+    the queue is therefore still handled correctly.
+    """
+
+    def __init__(self, origin: ClockTime, bucket_width: ClockStepSize) -> None:
+        """
+        Parameters
+        ----------
+        origin
+            The time at which the bucket with key zero starts.
+        bucket_width
+            The width of the time interval covered by each bucket.
+        """
+        self._origin = origin
+        self._bucket_width = bucket_width
+        self._buckets: dict[int, list[pd.Index[int]]] = {}
+        self._keys: list[int] = []
+
+    def __len__(self) -> int:
+        return sum(len(index) for bucket in self._buckets.values() for index in bucket)
+
+    def push(self, index: pd.Index[int], times: pd.Series[Any]) -> None:
+        """Schedules simulants at the given event times.
+
+        Parameters
+        ----------
+        index
+            The simulants to schedule.
+        times
+            The next event time of each simulant, aligned with the index.
+        """
+        if index.empty:
+            return
+        keys = self._get_keys(times)
+        order = np.argsort(keys, kind="stable")
+        keys = keys[order]
+        starts = np.flatnonzero(np.diff(keys, prepend=keys[0] - 1))
+        ends = np.append(starts[1:], len(keys))
+        for start, end in zip(starts, ends):
+            key = int(keys[start])
+            if key not in self._buckets:
+                self._buckets[key] = []
+                heapq.heappush(self._keys, key)
+            self._buckets[key].append(index[order[start:end]])
+
+    def due(
+        self,
+        time: ClockTime,
+        get_times: Callable[[pd.Index[int]], pd.Series[Any]],
+        remove: bool = False,
+    ) -> pd.Index[int]:
+        """Finds the simulants whose next event time is at or before a time.
+
+        Parameters
+        ----------
+        time
+            The time to compare next event times against.
+        get_times
+            A function returning the actual next event times of simulants.
+        remove
+            Whether to remove the due simulants from the queue, e.g. because
+            they are about to be rescheduled.
+
+        Returns
+        -------
+            The sorted index of due simulants.
+        """
+        limit = int(self._get_keys(pd.Series([time]))[0])
+        candidates: list[pd.Index[int]] = []
+        while self._keys and self._keys[0] <= limit:
+            candidates.extend(self._buckets.pop(heapq.heappop(self._keys)))
+        if not candidates:
+            return pd.Index([], dtype=int)
+
+        index = _concatenate_indexes(candidates).unique().sort_values()
+        times = get_times(index)
+        is_due = (times <= time).to_numpy()
+        self.push(index[~is_due], times[~is_due])
+        if not remove:
+            self.push(index[is_due], times[is_due])
+        due_index: pd.Index[int] = index[is_due]
+        return due_index
+
+    def next_time(
+        self, get_times: Callable[[pd.Index[int]], pd.Series[Any]]
+    ) -> ClockTime | None:
+        """Gets the earliest next event time of any queued simulant.
+
+        Parameters
+        ----------
+        get_times
+            A function returning the actual next event times of simulants.
+
+        Returns
+        -------
+            The earliest next event time, or None if the queue is empty.
+        """
+        while self._keys:
+            key = self._keys[0]
+            bucket = self._buckets[key]
+            index = _concatenate_indexes(bucket).unique() if len(bucket) > 1 else bucket[0]
+            times = get_times(index)
+            in_bucket = self._get_keys(times) == key
+            if in_bucket.all():
+                self._buckets[key] = [index]
+                next_time: ClockTime = times.min()
+                return next_time
+            heapq.heappop(self._keys)
+            del self._buckets[key]
+            self.push(index[in_bucket], times[in_bucket])
+            self.push(index[~in_bucket], times[~in_bucket])
+        return None
+
+    def _get_keys(self, times: pd.Series[Any]) -> npt.NDArray[np.int64]:
+        offsets = pd.Index(times) - self._origin
+        return np.asarray(offsets // self._bucket_width, dtype=np.int64)
+
+
+def _minimum_step_size_combiner(
+    value: pd.Series[Any], mutator: Callable[..., Any], *args: Any, **kwargs: Any
+) -> pd.Series[Any]:
+    """Folds a modifier's step sizes into the running minimum step size.
+
+    Rather than collecting every modifier's output and reducing them all at
+    once, each modifier's proposed step sizes are compared against the
+    smallest step sizes proposed so far as the modifier returns. Modifiers
+    may propose step sizes for only part of the population.
+
+    Parameters
+    ----------
+    value
+        The smallest step size proposed so far for each simulant, or a null
+        value for simulants without a proposed step size.
+    mutator
+        A step size modifier.
+    args, kwargs
+        The same args and kwargs provided during the invocation of the
+        pipeline.
+
+    Returns
+    -------
+        The input series, updated in place with the elementwise minimum of
+        its values and the modifier's step sizes.
+    """
+    step_sizes = mutator(*args, **kwargs)
+    positions = value.index.get_indexer(step_sizes.index)  # type: ignore [no-untyped-call]
+    in_value = positions >= 0
+    positions = positions[in_value]
+    value.iloc[positions] = np.fmin(
+        value.to_numpy()[positions], step_sizes.to_numpy()[in_value]
+    )
+    return value
+
+
+def _concatenate_indexes(indexes: list[pd.Index[int]]) -> pd.Index[int]:
+    concatenated: pd.Index[int] = pd.Index(
+        np.concatenate([index.to_numpy() for index in indexes])
+    )
+    return concatenated
+
+
 class SimulationClock(Manager):
     """A time manager that includes a global clock and simulant-specific clocks."""
 
@@ -98,6 +274,7 @@ class SimulationClock(Manager):
         self._standard_step_size: ClockStepSize | None = None
         self._clock_step_size: ClockStepSize | None = None
         self._individual_clocks: pd.DataFrame | None = None
+        self._event_queue: EventTimeQueue | None = None
         self._simulant_step_size_pipeline = "simulant_step_size"
         # TODO: Delegate this functionality a better place when appropriate
         self._simulants_to_snooze = pd.Index([])
@@ -106,8 +283,8 @@ class SimulationClock(Manager):
         super().setup(builder)
         self._step_size_pipeline = builder.value.register_value_producer(
             self._simulant_step_size_pipeline,
-            source=lambda idx: [pd.Series(np.nan, index=idx).astype("timedelta64[ns]")],
-            preferred_combiner=list_combiner,
+            source=lambda idx: pd.Series(np.nan, index=idx).astype("timedelta64[ns]"),
+            preferred_combiner=_minimum_step_size_combiner,
             preferred_post_processor=self.step_size_post_processor,
         )
         self.register_step_modifier = partial(
@@ -125,6 +302,8 @@ class SimulationClock(Manager):
             # No components modify the step size, so we use the default
             # and remove the dataframe
             self._individual_clocks = None
+        else:
+            self._event_queue = EventTimeQueue(self.time, self.minimum_step_size)
 
     def initialize_individual_clock(self, pop_data: SimulantData) -> None:
         """Sets the next_event_time and step_size columns for each simulant"""
@@ -139,6 +318,10 @@ class SimulationClock(Manager):
             self._individual_clocks = pd.concat(
                 [self._individual_clocks, clocks_to_initialize]
             )
+            if self._event_queue is not None:
+                self._event_queue.push(
+                    pop_data.index, clocks_to_initialize["next_event_time"]
+                )
 
     def simulant_next_event_times(self, index: pd.Index[int]) -> pd.Series[ClockTime]:
         """The next time each simulant will be updated."""
@@ -162,7 +345,14 @@ class SimulationClock(Manager):
         """Advances the clock by the current step size, and updates aligned simulant clocks."""
         self._clock_time += self.step_size  # type: ignore [assignment, operator]
         if self._individual_clocks is not None and not index.empty:
-            update_index = self.get_active_simulants(index, self.time)
+            use_queue = self._uses_event_queue(index)
+            if use_queue:
+                assert self._event_queue is not None
+                update_index = self._event_queue.due(
+                    self.time, self.simulant_next_event_times, remove=True
+                )
+            else:
+                update_index = self.get_active_simulants(index, self.time)
             if not update_index.empty:
                 self._individual_clocks.loc[
                     update_index, "step_size"
@@ -175,20 +365,81 @@ class SimulationClock(Manager):
                 self._individual_clocks.loc[update_index, "next_event_time"] = (
                     self.time + self._individual_clocks.loc[update_index, "step_size"]
                 )
-
-            self._clock_step_size = self.simulant_next_event_times(index).min() - self.time  # type: ignore [operator]
+                if use_queue:
+                    assert self._event_queue is not None
+                    self._event_queue.push(
+                        update_index, self.simulant_next_event_times(update_index)
+                    )
+
+            if use_queue:
+                assert self._event_queue is not None
+                next_event_time = self._event_queue.next_time(self.simulant_next_event_times)
+            else:
+                next_event_time = self.simulant_next_event_times(index).min()
+            self._clock_step_size = next_event_time - self.time  # type: ignore [operator]
 
     def get_active_simulants(self, index: pd.Index[int], time: ClockTime) -> pd.Index[int]:
         """Gets population that is aligned with global clock"""
         if index.empty or self._individual_clocks is None:
             return index
+        if self._uses_event_queue(index):
+            assert self._event_queue is not None
+            return self._event_queue.due(time, self.simulant_next_event_times)
         next_event_times = self.simulant_next_event_times(index)
         return next_event_times[next_event_times <= time].index
 
+    def _uses_event_queue(self, index: pd.Index[int]) -> bool:
+        """Whether active simulants in the index can be found from the event queue.
+
+        The queue holds every simulant, so it can only answer for the whole
+        population. Other indices fall back to scanning their event times.
+        """
+        return (
+            self._event_queue is not None
+            and self._individual_clocks is not None
+            and len(index) == len(self._individual_clocks)
+        )
+
     def move_simulants_to_end(self, index: pd.Index[int]) -> None:
         if self._individual_clocks is not None and not index.empty:
             self._simulants_to_snooze = self._simulants_to_snooze.union(index)
 
+    def get_checkpoint_data(self) -> dict[str, pd.DataFrame]:
+        """Gets a copy of the clock state for a checkpoint.
+
+        Returns
+        -------
+            A table with the current time and step size and, if simulants have
+            individual clocks, a table of their next event times and step sizes.
+        """
+        data = {"clock": pd.DataFrame({"time": [self.time], "step_size": [self.step_size]})}
+        if self._individual_clocks is not None:
+            data["individual_clocks"] = self._individual_clocks.copy()
+        if not self._simulants_to_snooze.empty:
+            data["snoozed"] = pd.DataFrame(index=self._simulants_to_snooze)
+        return data
+
+    def restore_checkpoint_data(self, data: dict[str, pd.DataFrame]) -> None:
+        """Restores the clock state from a checkpoint.
+
+        Parameters
+        ----------
+        data
+            The tables returned by :meth:`get_checkpoint_data` when the
+            checkpoint was taken.
+        """
+        self._clock_time = data["clock"]["time"].tolist()[0]
+        self._clock_step_size = data["clock"]["step_size"].tolist()[0]
+        if "individual_clocks" in data and self._individual_clocks is not None:
+            self._individual_clocks = data["individual_clocks"]
+            if self._event_queue is not None:
+                self._event_queue.push(
+                    self._individual_clocks.index,
+                    self._individual_clocks["next_event_time"],
+                )
+        if "snoozed" in data:
+            self._simulants_to_snooze = data["snoozed"].index
+
     def step_size_post_processor(self, value: Any, manager: ValuesManager) -> Any:
         """Computes the largest feasible step size for each simulant.
 
@@ -203,7 +454,9 @@ class SimulationClock(Manager):
             (not used by this post processor but is required to be used by
             AttributePipelines).
         value
-            A list of step sizes
+            The smallest step size proposed for each simulant by any step size
+            modifier, or a null value for simulants no modifier has proposed
+            a step size for.
         manager
             The ValuesManager for this simulation (not used by this post processor
             but is required to be used by AttributePipelines).
@@ -214,10 +467,10 @@ class SimulationClock(Manager):
             post processor but is required to be used by AttributePipelines).
         """
 
-        min_modified = pd.DataFrame(value).min(axis=0).fillna(self.standard_step_size)
+        min_modified = value.fillna(self.standard_step_size)
         # Rescale pipeline values to global minimum step size
         discretized_step_sizes = (
-            np.floor(min_modified / self.minimum_step_size).replace(0, 1)  # type: ignore [attr-defined, operator]
+            np.floor(min_modified / self.minimum_step_size).replace(0, 1)
             * self.minimum_step_size
         )
         # Make sure we don't get zero
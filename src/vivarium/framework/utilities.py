@@ -9,6 +9,7 @@ Collection of utility functions shared by the ``vivarium`` framework.
 from __future__ import annotations
 
 import functools
+import sys
 from bdb import BdbQuit
 from collections.abc import Callable, Sequence
 from importlib import import_module
@@ -207,6 +208,36 @@ def collapse_nested_dict(
     return results
 
 
+def get_nbytes(data: Any) -> int:
+    """Estimates the number of bytes used to hold some data in memory.
+
+    Pandas objects are measured with their ``memory_usage(deep=True)`` methods
+    and numpy arrays with their ``nbytes``. Dictionaries, lists, and tuples
+    are measured by summing the sizes of their items. Anything else is
+    measured with :func:`sys.getsizeof`.
+
+    Parameters
+    ----------
+    data
+        The data to measure.
+
+    Returns
+    -------
+        The estimated number of bytes used by the data.
+    """
+    if isinstance(data, pd.DataFrame):
+        return int(data.memory_usage(deep=True).sum())
+    if isinstance(data, (pd.Series, pd.Index)):
+        return int(data.memory_usage(deep=True))
+    if isinstance(data, np.ndarray):
+        return int(data.nbytes)
+    if isinstance(data, dict):
+        return sum(get_nbytes(key) + get_nbytes(value) for key, value in data.items())
+    if isinstance(data, (list, tuple)):
+        return sum(get_nbytes(item) for item in data)
+    return sys.getsizeof(data)
+
+
 def import_by_path(path: str) -> Callable[..., Any]:
     """Imports a class or function given its absolute path.
 
@@ -66,6 +66,7 @@ class ValuesManager(Manager):
         self._add_resource = builder.resources.add_resource
         self._get_current_component = builder.components.get_current_component_or_manager
         self._add_constraint = builder.lifecycle.add_constraint
+        self._profiler = builder.lifecycle.get_profiler()
 
         builder.lifecycle.add_constraint(
             self.register_value_producer, allow_during=[lifecycle_states.SETUP]
@@ -92,6 +93,10 @@ class ValuesManager(Manager):
                 self.logger.warning(
                     f"Pipeline {pipeline.name} has no source. It will not be usable."
                 )
+            if self._profiler.enabled:
+                pipeline._call = self._profiler.wrap(  # type: ignore [method-assign]
+                    "pipeline", pipeline.name, pipeline._call
+                )
 
     def register_value_producer(
         self,
@@ -0,0 +1,135 @@
+"""
+=================
+Background Writer
+=================
+
+A writer for serializing simulation output to disk in background threads.
+
+The simulation hands the writer a snapshot of its output, e.g. a
+:class:`~vivarium.framework.checkpoint.Checkpoint` or a table of results, and
+carries on while the snapshot is serialized, compressed, and written in a
+background thread. Serialization with :mod:`pyarrow` releases the global
+interpreter lock, so it runs in parallel with the simulation.
+
+Every pending write holds its snapshot in memory until it is written, so the
+writer bounds the number of pending writes. Once the bound is reached,
+submitting another write blocks until one of the pending writes finishes,
+so memory use cannot grow without limit if the disk is slower than the
+simulation. Callers that would rather not block can check :attr:`is_full
+<BackgroundWriter.is_full>` first and skip or defer the write.
+
+"""
+
+from __future__ import annotations
+
+import threading
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from types import TracebackType
+from typing import Any
+
+
+class BackgroundWriter:
+    """Runs writes in background threads with a bounded number of pending writes.
+
+    Writes are started in the order they are submitted. Errors raised by a
+    write are raised by the next call to :meth:`submit`, :meth:`wait`, or
+    :meth:`close`.
+    """
+
+    def __init__(self, max_workers: int = 1, max_pending: int | None = None) -> None:
+        """
+        Parameters
+        ----------
+        max_workers
+            The number of threads to write in. Writes that must not overlap,
+            e.g. successive checkpoints to the same directory, need a single
+            thread.
+        max_pending
+            The maximum number of writes that can be queued or in progress at
+            once. If None, one per thread.
+        """
+        self.max_pending = max_pending if max_pending is not None else max_workers
+        if self.max_pending < 1:
+            raise ValueError("A background writer must allow at least one pending write.")
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="background_writer"
+        )
+        self._slots = threading.BoundedSemaphore(self.max_pending)
+        self._lock = threading.Lock()
+        # Writes whose outcome has not been checked yet.
+        self._futures: list[Future[Any]] = []
+
+    @property
+    def is_full(self) -> bool:
+        """Whether as many writes as allowed are pending, so that submitting
+        another would block."""
+        with self._lock:
+            return sum(not future.done() for future in self._futures) >= self.max_pending
+
+    def submit(self, write: Callable[..., Any], *args: Any, **kwargs: Any) -> None:
+        """Queues a write to run in the background.
+
+        If the maximum number of writes are already pending, this blocks until
+        one of them finishes.
+
+        Parameters
+        ----------
+        write
+            The function that writes the data.
+        args
+            Positional arguments to the write function.
+        kwargs
+            Keyword arguments to the write function.
+        """
+        self._raise_errors()
+        self._slots.acquire()
+        try:
+            future = self._executor.submit(write, *args, **kwargs)
+        except BaseException:
+            self._slots.release()
+            raise
+        future.add_done_callback(lambda _: self._slots.release())
+        with self._lock:
+            self._futures.append(future)
+
+    def wait(self) -> None:
+        """Waits for every pending write to finish."""
+        with self._lock:
+            futures = list(self._futures)
+        wait(futures)
+        self._raise_errors()
+
+    def close(self) -> None:
+        """Waits for every pending write to finish and stops the writer."""
+        try:
+            self.wait()
+        finally:
+            self._executor.shutdown()
+
+    def _raise_errors(self) -> None:
+        """Raises the first error raised by a finished write, if any."""
+        with self._lock:
+            finished: list[Future[Any]] = []
+            pending: list[Future[Any]] = []
+            for future in self._futures:
+                (finished if future.done() else pending).append(future)
+            self._futures = pending
+        for future in finished:
+            error = future.exception()
+            if error is not None:
+                raise error
+
+    def __enter__(self) -> BackgroundWriter:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def __repr__(self) -> str:
+        return f"BackgroundWriter(max_pending={self.max_pending})"
@@ -0,0 +1,377 @@
+"""
+============
+Batch Runner
+============
+
+Tools for running many simulations of the same model, e.g. for several input
+draws, random seeds, and scenarios, in a pool of processes on a single node.
+
+The model specification is parsed and the components it names are imported
+once, before the worker processes are started, so that on platforms that
+support it the workers inherit both by forking. Unless the batch is given one
+already, the runs share a temporary
+:mod:`artifact shared directory <vivarium.framework.artifact.shared>`, so
+draw-invariant artifact data is loaded once for the whole batch.
+
+Scenarios that differ only in the configuration of
+:meth:`branchable <vivarium.component.Component.on_branch>` components can
+instead be run with :func:`run_branches`, which sets up a simulation and
+creates its initial population once and then forks a copy-on-write child
+process to run the main loop of each scenario.
+
+As each run finishes, its worker appends the run's results to a combined
+Parquet dataset for each measure, partitioned by the configuration keys that
+vary between runs. The datasets can be read with :func:`pandas.read_parquet`
+on the measure's directory.
+
+"""
+
+from __future__ import annotations
+
+import itertools
+import multiprocessing
+import shutil
+import tempfile
+import traceback
+from collections.abc import Callable, Mapping, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from time import time
+from typing import Any
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+from layered_config_tree.main import LayeredConfigTree
+from loguru import logger
+
+from vivarium.exceptions import VivariumError
+from vivarium.framework.configuration import build_model_specification
+from vivarium.framework.engine import SimulationContext
+from vivarium.framework.plugins import PluginManager
+
+
+def get_run_configurations(
+    grid: Mapping[str, Sequence[Any]] | None = None,
+    branches: Sequence[Mapping[str, Any]] | None = None,
+) -> list[dict[str, Any]]:
+    """Gets the configuration overrides for every run in a batch.
+
+    Parameters
+    ----------
+    grid
+        A mapping from dotted configuration keys, e.g.
+        ``"randomness.random_seed"``, to the values to run with. Every
+        combination of values is run.
+    branches
+        Scenario branches, each a nested mapping of configuration overrides.
+        Every branch is run with every combination of values in the grid.
+
+    Returns
+    -------
+        The configuration overrides for each run, as mappings from dotted
+        configuration keys to values. Keys set by only some branches are set
+        to None in the others.
+    """
+    grid = grid or {}
+    flat_branches = [_flatten(branch) for branch in branches or [{}]]
+    branch_keys = list(dict.fromkeys(key for branch in flat_branches for key in branch))
+    overlap = set(grid).intersection(branch_keys)
+    if overlap:
+        raise ValueError(
+            f"Configuration keys {sorted(overlap)} are in both the grid and branches."
+        )
+
+    run_configurations = []
+    for branch in flat_branches:
+        for values in itertools.product(*grid.values()):
+            run_configuration = dict(zip(grid, values))
+            run_configuration.update({key: branch.get(key) for key in branch_keys})
+            run_configurations.append(run_configuration)
+    return run_configurations
+
+
+def run_batch(
+    model_specification: str | Path,
+    results_directory: str | Path,
+    grid: Mapping[str, Sequence[Any]] | None = None,
+    branches: Sequence[Mapping[str, Any]] | None = None,
+    configuration: dict[str, Any] | None = None,
+    max_workers: int | None = None,
+) -> pd.DataFrame:
+    """Runs a simulation for every configuration in a grid and set of branches.
+
+    Parameters
+    ----------
+    model_specification
+        The path to the model specification file shared by every run.
+    results_directory
+        The directory to write results to. The results for each measure are
+        written to a Parquet dataset in ``results/<measure>`` within it,
+        partitioned by the configuration keys in the grid and branches, and a
+        summary of the runs is written to ``runs.parquet``.
+    grid
+        A mapping from dotted configuration keys to the values to run with.
+        See :func:`get_run_configurations`.
+    branches
+        Scenario branches, each a nested mapping of configuration overrides.
+        See :func:`get_run_configurations`.
+    configuration
+        Configuration overrides applied to every run.
+    max_workers
+        The maximum number of processes to run simulations in. If None, as
+        many as there are CPUs.
+
+    Returns
+    -------
+        A summary of the runs, with the configuration of each run, its run
+        time, and the error it raised, if any.
+    """
+    results_root = Path(results_directory)
+    (results_root / "results").mkdir(parents=True, exist_ok=True)
+    run_configurations = get_run_configurations(grid, branches)
+
+    specification = build_model_specification(
+        model_specification, configuration=configuration
+    )
+    input_data = specification.configuration.to_dict().get("input_data", {})
+    shared_directory = None
+    if input_data.get("artifact_path") and not input_data.get("artifact_shared_directory"):
+        shared_directory = tempfile.mkdtemp(
+            prefix="vivarium_shared_", dir="/dev/shm" if Path("/dev/shm").is_dir() else None
+        )
+        specification.configuration.update(
+            {"input_data": {"artifact_shared_directory": shared_directory}},
+            layer="override",
+            source="batch_runner",
+        )
+    _import_components(specification)
+
+    logger.info(f"Running {len(run_configurations)} simulations.")
+    try:
+        with ProcessPoolExecutor(
+            max_workers=max_workers,
+            mp_context=_get_multiprocessing_context(),
+            initializer=_initialize_worker,
+            initargs=(specification, results_root),
+        ) as executor:
+            summaries = list(
+                executor.map(_run, range(len(run_configurations)), run_configurations)
+            )
+    finally:
+        if shared_directory is not None:
+            shutil.rmtree(shared_directory, ignore_errors=True)
+
+    return _summarize_runs(summaries, results_root)
+
+
+def run_branches(
+    simulation: SimulationContext,
+    results_directory: str | Path,
+    branches: Sequence[Mapping[str, Any]],
+    max_workers: int | None = None,
+) -> pd.DataFrame:
+    """Runs the main loop of a simulation once for each of several scenarios.
+
+    The simulation must already be set up and have created its initial
+    population, as an :class:`~vivarium.interface.interactive.InteractiveContext`
+    is when it is constructed. A child process is forked from this process
+    for each scenario, so each starts from a copy-on-write copy of the
+    simulation rather than repeating setup. The child applies the scenario
+    with :meth:`~vivarium.framework.engine.SimulationContext.branch` and runs
+    the simulation to the end. The simulation in this process is unchanged.
+
+    Parameters
+    ----------
+    simulation
+        The set up simulation to branch from.
+    results_directory
+        The directory to write results to, laid out as for :func:`run_batch`.
+    branches
+        Scenario branches, each a nested mapping of configuration overrides
+        for branchable components.
+    max_workers
+        The maximum number of scenarios to run at once. If None, as many as
+        there are CPUs.
+
+    Returns
+    -------
+        A summary of the runs, with the configuration of each run, its run
+        time, and the error it raised, if any.
+
+    Raises
+    ------
+    VivariumError
+        If this platform cannot fork processes.
+    """
+    if "fork" not in multiprocessing.get_all_start_methods():
+        raise VivariumError("Branching a simulation requires forking processes.")
+    results_root = Path(results_directory)
+    (results_root / "results").mkdir(parents=True, exist_ok=True)
+    run_configurations = get_run_configurations(branches=branches)
+
+    logger.info(f"Running {len(run_configurations)} branches of {simulation.name}.")
+    # Replacing each worker after a single task forks every branch afresh from
+    # the simulation in this process.
+    with multiprocessing.get_context("fork").Pool(
+        max_workers,
+        initializer=_initialize_branch_worker,
+        initargs=(simulation, results_root),
+        maxtasksperchild=1,
+    ) as pool:
+        summaries = pool.starmap(_run_branch, enumerate(run_configurations), chunksize=1)
+    return _summarize_runs(summaries, results_root)
+
+
+##################
+# Worker process #
+##################
+
+# The model specification or simulation to branch from and the results
+# directory, set once per worker process.
+_WORKER_STATE: dict[str, Any] = {}
+
+
+def _initialize_worker(specification: LayeredConfigTree, results_root: Path) -> None:
+    _WORKER_STATE["specification"] = specification
+    _WORKER_STATE["results_root"] = results_root
+
+
+def _initialize_branch_worker(simulation: SimulationContext, results_root: Path) -> None:
+    _WORKER_STATE["simulation"] = simulation
+    _WORKER_STATE["results_root"] = results_root
+
+
+def _run(run_id: int, run_configuration: dict[str, Any]) -> dict[str, Any]:
+    """Runs a single simulation and writes its results, returning a summary."""
+
+    def start_simulation() -> SimulationContext:
+        sim = SimulationContext(
+            model_specification=_WORKER_STATE["specification"],
+            configuration=_unflatten(run_configuration),
+        )
+        sim.setup()
+        sim.initialize_simulants()
+        return sim
+
+    return _finish_run(run_id, run_configuration, start_simulation)
+
+
+def _run_branch(run_id: int, run_configuration: dict[str, Any]) -> dict[str, Any]:
+    """Runs a branch of the inherited simulation and writes its results,
+    returning a summary."""
+
+    def start_simulation() -> SimulationContext:
+        sim: SimulationContext = _WORKER_STATE["simulation"]
+        sim.branch(_unflatten(run_configuration))
+        return sim
+
+    return _finish_run(run_id, run_configuration, start_simulation)
+
+
+def _finish_run(
+    run_id: int,
+    run_configuration: dict[str, Any],
+    start_simulation: Callable[[], SimulationContext],
+) -> dict[str, Any]:
+    """Runs a started simulation to the end and writes its results, returning
+    a summary."""
+    start = time()
+    summary: dict[str, Any] = {"run_id": run_id, **run_configuration}
+    try:
+        sim = start_simulation()
+        sim.run()
+        sim.finalize()
+        sim.report(print_results=False, write_results=False)
+        _write_results(
+            _WORKER_STATE["results_root"] / "results",
+            sim.get_results(),
+            run_id,
+            run_configuration,
+        )
+    except Exception:
+        logger.exception(
+            f"Simulation {run_id} with configuration {run_configuration} failed."
+        )
+        summary["error"] = traceback.format_exc()
+    else:
+        summary["error"] = None
+    summary["run_time"] = time() - start
+    return summary
+
+
+def _write_results(
+    results_directory: Path,
+    results: dict[str, pd.DataFrame],
+    run_id: int,
+    run_configuration: dict[str, Any],
+) -> None:
+    """Appends a run's results to the partitioned dataset for each measure.
+
+    Configuration values that are not scalars, e.g. lists, are written as
+    strings, since they cannot be used as partition values.
+    """
+    partition_values = {
+        key: value if value is None or pd.api.types.is_scalar(value) else str(value)
+        for key, value in run_configuration.items()
+    }
+    for measure, data in results.items():
+        data = data.assign(**partition_values)
+        pq.write_to_dataset(
+            pa.Table.from_pandas(data, preserve_index=False),
+            root_path=results_directory / measure,
+            partition_cols=list(run_configuration) or None,
+            basename_template=f"run_{run_id}_{{i}}.parquet",
+        )
+
+
+#####################
+# Private utilities #
+#####################
+
+
+def _summarize_runs(summaries: list[dict[str, Any]], results_root: Path) -> pd.DataFrame:
+    runs = pd.DataFrame(summaries)
+    runs.to_parquet(results_root / "runs.parquet", index=False)
+    failed = runs["error"].notna().sum()
+    logger.info(
+        f"Finished {len(runs) - failed} of {len(runs)} simulations.\n"
+        f"Results written to {str(results_root)}"
+    )
+    return runs
+
+
+def _get_multiprocessing_context() -> multiprocessing.context.BaseContext:
+    # Forked workers inherit the parsed model specification and imported modules.
+    if "fork" in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("fork")
+    return multiprocessing.get_context()
+
+
+def _import_components(specification: LayeredConfigTree) -> None:
+    """Imports the modules of the components in a model specification."""
+    parser = PluginManager(specification.plugins).get_component_config_parser()
+    parser.get_components(specification.components)
+
+
+def _flatten(overrides: Mapping[str, Any], prefix: str = "") -> dict[str, Any]:
+    flat = {}
+    for key, value in overrides.items():
+        if isinstance(value, Mapping):
+            flat.update(_flatten(value, f"{prefix}{key}."))
+        else:
+            flat[f"{prefix}{key}"] = value
+    return flat
+
+
+def _unflatten(overrides: Mapping[str, Any]) -> dict[str, Any]:
+    nested: dict[str, Any] = {}
+    for key, value in overrides.items():
+        if value is None:
+            continue
+        *parents, name = key.split(".")
+        level = nested
+        for parent in parents:
+            level = level.setdefault(parent, {})
+        level[name] = value
+    return nested
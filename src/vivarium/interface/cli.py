@@ -4,7 +4,7 @@ Vivarium Command Line Tools
 ===========================
 
 ``vivarium`` provides the tool :command:`simulate` for running simulations
-from the command line.  It provides three subcommands:
+from the command line.  It provides four subcommands:
 
 .. list-table:: ``simulate`` sub-commands
     :header-rows: 1
@@ -17,6 +17,12 @@ from the command line.  It provides three subcommands:
     *   - | **test**
         - | Runs an example simulation that comes packaged with ``vivarium``.
           | Useful as an installation test.
+    *   - | **profile**
+        - | Profiles a simulation run from a model specification file and
+          | writes machine-readable timing and memory summaries.
+    *   - | **batch**
+        - | Runs a simulation from a model specification file for every
+          | configuration in a grid of input draws, random seeds, and scenarios.
 
 For more information, see the :ref:`tutorial <cli_tutorial>` on running
 simulations from the command line.
@@ -27,7 +33,11 @@ simulations from the command line.
 
 """
 
+import cProfile
+import json
 import os
+import pstats
+import tracemalloc
 from pathlib import Path
 from time import time
 
@@ -42,6 +52,7 @@ from vivarium.framework.logging import (
     configure_logging_to_terminal,
 )
 from vivarium.framework.utilities import handle_exceptions
+from vivarium.interface.batch import run_batch
 from vivarium.interface.utilities import get_output_root
 
 
@@ -50,8 +61,9 @@ def simulate() -> None:
     """A command line utility for running a single simulation.
 
     You may initiate a new run with the ``run`` sub-command, initiate a test
-    run of a provided model specification with the ``test`` subcommand, or
-    profile a simulation run with the ``profile`` subcommand.
+    run of a provided model specification with the ``test`` subcommand,
+    profile a simulation run with the ``profile`` subcommand, or run many
+    simulations of a model with the ``batch`` subcommand.
     """
     pass
 
@@ -167,3 +179,231 @@ def test() -> None:
 
     click.echo()
     click.secho("Installation test successful!", fg="green")
+
+
+@simulate.command()
+@click.argument(
+    "model_specification", type=click.Path(exists=True, dir_okay=False, resolve_path=True)
+)
+@click.option(
+    "--artifact_path",
+    "-i",
+    type=click.Path(resolve_path=True),
+    help="The path to the artifact data file.",
+)
+@click.option(
+    "--results_directory",
+    "-o",
+    type=click.Path(resolve_path=True),
+    default=Path("~/vivarium_results/").expanduser(),
+    help="The directory to write the profile to. A folder will be created "
+    "in this directory with the same name as the configuration file.",
+)
+@click.option(
+    "--steps",
+    "-n",
+    type=click.IntRange(min=1),
+    default=None,
+    help="The number of time steps to run. Runs the full simulation if not provided.",
+)
+@click.option(
+    "--skip_processing",
+    is_flag=True,
+    help="Skip writing a human-readable report of the cProfile output.",
+)
+@click.option(
+    "--trace_memory",
+    is_flag=True,
+    help="Trace memory allocations to report peak memory. This slows the run "
+    "and inflates the cProfile timings.",
+)
+def profile(
+    model_specification: Path,
+    artifact_path: Path,
+    results_directory: Path,
+    steps: int | None,
+    skip_processing: bool,
+    trace_memory: bool,
+) -> None:
+    """Profile a simulation run from the command line.
+
+    The simulation defined by the given MODEL_SPECIFICATION yaml file is run
+    under :mod:`cProfile`, for the given number of time steps or to the end of
+    the simulation, with framework profiling enabled. As with ``run``, the
+    output is written to a subdirectory of the results directory named after
+    the MODEL_SPECIFICATION and the start time of the run. It contains:
+
+    \b
+    - ``profile.stats``: the raw cProfile output, which can be read with
+      :class:`pstats.Stats`.
+    - ``profile.txt``: the cProfile output sorted by cumulative time, unless
+      ``--skip_processing`` is given.
+    - ``framework_profile.parquet``: the calls to and time spent in each
+      event listener, pipeline, lookup table, and randomness stream.
+    - ``performance.json``: the number of steps taken, the run time, the time
+      spent in each lifecycle state, and the bytes used by the simulation's
+      largest data structures.
+
+    With ``--trace_memory``, memory allocations are traced with
+    :mod:`tracemalloc` and ``performance.json`` also reports the peak traced
+    memory overall and in each lifecycle state. Tracing adds overhead to
+    every allocation, which slows the run and inflates the cProfile timings,
+    so profile time and memory in separate runs.
+    """
+    configure_logging_to_terminal(verbosity=1, long_format=False)
+
+    results_root = get_output_root(results_directory, model_specification, artifact_path)
+    _ = os.umask(0o002)
+    results_root.mkdir(parents=True, exist_ok=False)
+    configure_logging_to_file(output_directory=results_root)
+
+    input_data = {}
+    if artifact_path:
+        input_data["artifact_path"] = artifact_path
+    override_configuration = {"input_data": input_data, "profiling": {"enabled": True}}
+    sim = SimulationContext(
+        model_specification=model_specification, configuration=override_configuration
+    )
+
+    profiler = cProfile.Profile()
+    main = handle_exceptions(_run_steps, logger, with_debugger=False)
+    peak_memory: int | None = None
+    if trace_memory:
+        tracemalloc.start()
+    start = time()
+    try:
+        steps_taken = profiler.runcall(main, sim, steps)
+    finally:
+        run_time = time() - start
+        if trace_memory:
+            _, peak_memory = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+
+    stats_file = results_root / "profile.stats"
+    profiler.dump_stats(stats_file)
+    if not skip_processing:
+        with open(results_root / "profile.txt", "w") as f:
+            stats = pstats.Stats(str(stats_file), stream=f)
+            stats.sort_stats("cumulative").print_stats()
+
+    sim.get_profiling_metrics().to_parquet(
+        results_root / "framework_profile.parquet", index=False
+    )
+    memory = sim.get_memory_metrics()
+    if peak_memory is not None:
+        # The peak is reset on every life cycle state change, so the overall
+        # peak is the largest of the per-state peaks.
+        lifecycle_peaks = memory.loc[memory["Type"] == "lifecycle_peak", "Bytes"]
+        peak_memory = int(max(peak_memory, *lifecycle_peaks))
+    performance = {
+        "model_specification": str(model_specification),
+        "steps": steps_taken,
+        "simulation_run_time": run_time,
+        "peak_memory_bytes": peak_memory,
+        "lifecycle_timings": sim.get_performance_metrics().to_dict(orient="records"),
+        "memory": memory.to_dict(orient="records"),
+    }
+    with open(results_root / "performance.json", "w") as f:
+        json.dump(performance, f, indent=2)
+
+    logger.info(f"Profiling finished.\nProfile written to {str(results_root)}")
+
+
+@simulate.command()
+@click.argument(
+    "model_specification", type=click.Path(exists=True, dir_okay=False, resolve_path=True)
+)
+@click.argument("batch_specification", type=click.Path(exists=True, dir_okay=False))
+@click.option(
+    "--artifact_path",
+    "-i",
+    type=click.Path(resolve_path=True),
+    help="The path to the artifact data file.",
+)
+@click.option(
+    "--results_directory",
+    "-o",
+    type=click.Path(resolve_path=True),
+    default=Path("~/vivarium_results/").expanduser(),
+    help="The directory to write results to. A folder will be created "
+    "in this directory with the same name as the configuration file.",
+)
+@click.option(
+    "--max_workers",
+    "-w",
+    type=click.IntRange(min=1),
+    default=None,
+    help="The number of processes to run simulations in. Defaults to the number of CPUs.",
+)
+def batch(
+    model_specification: Path,
+    batch_specification: Path,
+    artifact_path: Path,
+    results_directory: Path,
+    max_workers: int | None,
+) -> None:
+    """Run a batch of simulations from the command line.
+
+    Every simulation is defined by the given MODEL_SPECIFICATION yaml file,
+    with the configuration overrides in the BATCH_SPECIFICATION yaml file. It
+    may have two keys: ``grid``, a mapping from dotted configuration keys to
+    lists of values, every combination of which is run, and ``branches``, a
+    list of nested configuration overrides, each of which is run with every
+    combination of values in the grid. For example:
+
+    \b
+        grid:
+            input_data.input_draw_number: [0, 1, 2]
+            randomness.random_seed: [0, 1]
+        branches:
+            - intervention: {coverage: 0.0}
+            - intervention: {coverage: 0.5}
+
+    As with ``run``, the output is written to a subdirectory of the results
+    directory named after the MODEL_SPECIFICATION and the start time of the
+    batch. The results for each measure are written to a Parquet dataset in
+    ``results/<measure>``, partitioned by the keys in the batch specification,
+    and a summary of the runs is written to ``runs.parquet``.
+    """
+    configure_logging_to_terminal(verbosity=1, long_format=False)
+
+    results_root = get_output_root(results_directory, model_specification, artifact_path)
+    _ = os.umask(0o002)
+    results_root.mkdir(parents=True, exist_ok=False)
+    configure_logging_to_file(output_directory=results_root)
+
+    with open(batch_specification) as f:
+        batch_config = yaml.safe_load(f) or {}
+    unknown_keys = set(batch_config) - {"grid", "branches"}
+    if unknown_keys:
+        raise click.UsageError(
+            f"Unknown keys {sorted(unknown_keys)} in the batch specification. "
+            "Only 'grid' and 'branches' are allowed."
+        )
+    with open(results_root / "batch_specification.yaml", "w") as f:
+        yaml.dump(batch_config, f)
+
+    configuration = {"input_data": {"artifact_path": artifact_path}} if artifact_path else {}
+    runs = run_batch(
+        model_specification,
+        results_root,
+        grid=batch_config.get("grid"),
+        branches=batch_config.get("branches"),
+        configuration=configuration,
+        max_workers=max_workers,
+    )
+    failed = runs["error"].notna().sum()
+    if failed:
+        raise click.ClickException(f"{failed} of {len(runs)} simulations failed.")
+
+
+def _run_steps(sim: SimulationContext, steps: int | None) -> int:
+    """Runs a simulation for a number of steps, returning the number of steps taken."""
+    sim.setup()
+    sim.initialize_simulants()
+    steps_taken = 0
+    while sim.get_number_of_steps_remaining() > 0 and (steps is None or steps_taken < steps):
+        sim.step()
+        steps_taken += 1
+    sim.finalize()
+    return steps_taken
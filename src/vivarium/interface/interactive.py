@@ -16,10 +16,14 @@ from __future__ import annotations
 
 from collections.abc import Callable
 from math import ceil
+from pathlib import Path
 from typing import Any, overload
 
 import pandas as pd
+from layered_config_tree.main import LayeredConfigTree
 
+from vivarium import Component
+from vivarium.framework.checkpoint import read_checkpoint
 from vivarium.framework.engine import SimulationContext
 from vivarium.framework.event import Event
 from vivarium.framework.values import Pipeline
@@ -46,6 +50,28 @@ class InteractiveContext(SimulationContext):
         self.initialize_simulants()
         self._population_view = self._builder.population.get_view()
 
+    @classmethod
+    def load_from_backup(
+        cls, backup_path: Path, components: list[Component] | None = None
+    ) -> InteractiveContext:
+        """Loads a simulation from a checkpoint written by
+        :meth:`~vivarium.framework.engine.SimulationContext.write_backup`.
+
+        See :meth:`SimulationContext.load_from_backup
+        <vivarium.framework.engine.SimulationContext.load_from_backup>`.
+        """
+        checkpoint = read_checkpoint(backup_path)
+        sim = cls(
+            model_specification=LayeredConfigTree(checkpoint.model_specification),
+            components=components,
+            setup=False,
+        )
+        # Restoring the checkpoint takes the place of creating the initial population.
+        SimulationContext.setup(sim)
+        sim.restore(checkpoint)
+        sim._population_view = sim._builder.population.get_view()
+        return sim
+
     def step(self, step_size: ClockStepSize | None = None) -> None:
         """Advance the simulation one step.
 
@@ -1,17 +1,23 @@
+import sys
 from pathlib import Path
 from typing import Any
 from unittest.mock import MagicMock, call
 
+import pandas as pd
 import pytest
 import pytest_mock
 
+from vivarium.framework.artifact import hdf
 from vivarium.framework.artifact.artifact import (
     Artifact,
     ArtifactException,
+    _get_key_info,
     _parse_draw_filters,
     _to_tree,
+    convert_artifact,
 )
 from vivarium.framework.artifact.hdf import EntityKey
+from vivarium.framework.utilities import get_nbytes
 
 
 @pytest.fixture()
@@ -173,6 +179,33 @@ def test_artifact_load(
         hdf_mock.load.reset_mock()
 
 
+def test_artifact_load_with_cache_size(hdf_mock: MagicMock, artifact_path: Path) -> None:
+    keys = ["population.structure", "population.age_bins", "cause.all_causes.restrictions"]
+    a = Artifact(artifact_path, cache_size=2 * sys.getsizeof("data"))
+
+    for key in keys:
+        assert a.load(key) == "data"
+    assert list(a._cache) == keys[1:]
+
+    hdf_mock.load.reset_mock()
+    a.load(keys[0])
+    hdf_mock.load.assert_called_once_with(artifact_path, keys[0], None, None)
+    assert list(a._cache) == [keys[2], keys[0]]
+
+
+def test_clear_cache_keep_pinned(hdf_mock: MagicMock, artifact_path: Path) -> None:
+    a = Artifact(artifact_path)
+    a.pin("population.structure")
+    a.load("population.structure")
+    a.load("population.age_bins")
+
+    a.clear_cache(keep_pinned=True)
+    assert list(a._cache) == ["population.structure"]
+
+    a.clear_cache()
+    assert a._cache == {}
+
+
 def test_artifact_contains(
     hdf_mock: MagicMock, keys_mock: list[str], artifact_path: Path
 ) -> None:
@@ -247,6 +280,7 @@ def test_artifact_write(
     expected_call = [
         call(artifact_path, key, "data"),
         call(artifact_path, "metadata.keyspace", keys_mock + [key]),
+        call(artifact_path, "metadata.key_index", {key: _get_key_info("data")}),
     ]
     assert hdf_mock.write.call_args_list == expected_call
     assert set(a.keys) == set(initial_keys + [key])
@@ -390,6 +424,36 @@ def test_clear_cache(hdf_mock: MagicMock, keys_mock: list[str], artifact_path: P
     assert a._cache == {}
 
 
+@pytest.mark.parametrize("max_workers", [1, 2])
+def test_prefetch(
+    mocker: pytest_mock.MockFixture, hdf_file_path: Path, max_workers: int
+) -> None:
+    keys = [
+        "population.age_bins",
+        "population.structure",
+        "population.theoretical_minimum_risk_life_expectancy",
+    ]
+    a = Artifact(hdf_file_path)
+    a.prefetch(keys + ["not.a_real.key"], max_workers=max_workers)
+    assert set(a._prefetched) == set(keys)
+    assert set(a.get_cache_memory_usage()) == set(keys)
+
+    expected = {key: Artifact(hdf_file_path).load(key) for key in keys}
+    load_spy = mocker.spy(hdf, "load")
+    for key in keys:
+        data = a.load(key)
+        if isinstance(data, pd.DataFrame):
+            pd.testing.assert_frame_equal(data, expected[key])
+        else:
+            assert data == expected[key]
+    load_spy.assert_not_called()
+    assert a._prefetched == {}
+
+    # Keys that have already been loaded are not read again.
+    a.prefetch(keys, max_workers=max_workers)
+    assert a._prefetched == {}
+
+
 def test_loading_key_leaves_filters_unchanged(
     hdf_mock: MagicMock, keys_mock: list[str], artifact_path: Path
 ) -> None:
@@ -414,29 +478,36 @@ def test_replace(hdf_mock: MagicMock, keys_mock: list[str], artifact_path: Path)
 
     a.write(key, "data")
     keyspace_key = "metadata.keyspace"
+    index_key = "metadata.key_index"
     new_keyspace = [k for k in keys_mock + [key]]
 
     assert hdf_mock.write.call_args_list == [
         call(artifact_path, key, "data"),
         call(artifact_path, keyspace_key, new_keyspace),
+        call(artifact_path, index_key, {key: _get_key_info("data")}),
     ]
 
     hdf_mock.reset_mock()
 
     a.replace(key, "new_data")
 
-    # keyspace will be remove first in self.remove from a.replace then self.write from a.replace
+    # keyspace and key index will be removed first in self.remove from a.replace
+    # then in self.write from a.replace
     expected_calls_remove = [
         call(artifact_path, keyspace_key),
+        call(artifact_path, index_key),
         call(artifact_path, key),
         call(artifact_path, keyspace_key),
+        call(artifact_path, index_key),
     ]
     assert hdf_mock.remove.call_args_list == expected_calls_remove
 
     expected_calls_write = [
         call(artifact_path, keyspace_key, new_keyspace),
+        call(artifact_path, index_key, {}),
         call(artifact_path, key, "new_data"),
         call(artifact_path, keyspace_key, new_keyspace),
+        call(artifact_path, index_key, {key: _get_key_info("new_data")}),
     ]
     assert hdf_mock.write.call_args_list == expected_calls_write
     assert key in a
@@ -494,6 +565,109 @@ def test_create_hdf(tmpdir: Path) -> None:
     assert "new.key" in new_artifact
 
 
+def test_create_parquet(tmp_path: Path) -> None:
+    path = tmp_path / "test.parquet"
+
+    with pytest.warns(UserWarning, match="No artifact found"):
+        test_artifact = Artifact(path)
+    assert path.is_dir()
+    assert test_artifact.keys == ["metadata.keyspace"]
+
+    data = pd.DataFrame({"value": [1.0, 2.0]}, index=pd.Index([0, 1], name="draw"))
+    test_artifact.write("new.key", data)
+    test_artifact.write("new.json", {"a": 1})
+    test_artifact.remove("new.json")
+
+    new_artifact = Artifact(path, filter_terms=["draw == 1"])
+    assert new_artifact.keys == ["metadata.keyspace", "new.key"]
+    pd.testing.assert_frame_equal(new_artifact.load("new.key"), data.iloc[1:])
+
+
+def test_convert_artifact(hdf_file_path: Path, tmp_path: Path) -> None:
+    source = Artifact(hdf_file_path)
+    destination = tmp_path / "artifact.parquet"
+
+    converted = convert_artifact(hdf_file_path, destination)
+    assert converted.keys == source.keys
+    assert Artifact(destination).keys == source.keys
+    for key in source:
+        if isinstance(source.load(key), pd.DataFrame):
+            pd.testing.assert_frame_equal(converted.load(key), source.load(key))
+        else:
+            assert converted.load(key) == source.load(key)
+
+    with pytest.raises(ArtifactException, match="already exists"):
+        convert_artifact(hdf_file_path, destination)
+
+
+@pytest.mark.parametrize("suffix", [".hdf", ".parquet"])
+def test_key_index(tmp_path: Path, suffix: str, mocker: pytest_mock.MockFixture) -> None:
+    path = tmp_path / f"test{suffix}"
+    data = pd.DataFrame(
+        {"value": [1.0, 2.0], "sex": ["Male", "Female"]},
+        index=pd.Index([0, 1], name="draw"),
+    )
+    with pytest.warns(UserWarning, match="No artifact found"):
+        test_artifact = Artifact(path)
+    test_artifact.write("new.data", data)
+    test_artifact.write("new.json", ["a", "b"])
+    test_artifact.write("new.removed", "data")
+    test_artifact.remove("new.removed")
+
+    get_keys_spy = mocker.spy(test_artifact._backend, "get_keys")
+    load_spy = mocker.spy(test_artifact._backend, "load")
+    new_artifact = Artifact(path)
+    get_keys_spy.assert_not_called()
+    assert load_spy.call_count == 1
+    assert "new.data" in new_artifact and "new.removed" not in new_artifact
+
+    assert new_artifact.key_index == {
+        "new.data": {
+            "type": "DataFrame",
+            "nbytes": get_nbytes(data),
+            "rows": 2,
+            "columns": ["value", "sex"],
+            "dtypes": {"value": "float64", "sex": "object"},
+            "index": ["draw"],
+        },
+        "new.json": {"type": "list", "nbytes": get_nbytes(["a", "b"])},
+    }
+    assert "metadata.key_index" not in new_artifact
+
+
+def test_rebuild_key_index(hdf_file_path: Path) -> None:
+    test_artifact = Artifact(hdf_file_path)
+    assert test_artifact.key_index == {}
+
+    test_artifact.rebuild_key_index()
+    expected_keys = set(test_artifact.keys) - {"metadata.keyspace"}
+    assert set(test_artifact.key_index) == expected_keys
+    assert set(Artifact(hdf_file_path).key_index) == expected_keys
+    assert test_artifact.key_index["population.structure"]["rows"] == len(
+        test_artifact.load("population.structure")
+    )
+
+
+def test_shared_directory(
+    hdf_file_path: Path, tmp_path: Path, mocker: pytest_mock.MockFixture
+) -> None:
+    key = "population.structure"
+    first = Artifact(hdf_file_path, ["draw == 0"], shared_directory=tmp_path / "shared")
+    expected = hdf.load(hdf_file_path, key, ["draw == 0"], None)
+    pd.testing.assert_frame_equal(first.load(key), expected)
+
+    second = Artifact(hdf_file_path, ["draw == 1"], shared_directory=tmp_path / "shared")
+    load_spy = mocker.spy(second._backend, "load")
+    second.prefetch([key, "population.age_bins"])
+    data = second.load(key)
+    pd.testing.assert_frame_equal(data, expected)
+    assert not data["value"].to_numpy().flags.writeable
+    assert [c.args[1] for c in load_spy.call_args_list] == ["population.age_bins"]
+
+    second.replace(key, expected.iloc[:10])
+    pd.testing.assert_frame_equal(second.load(key), expected.iloc[:10])
+
+
 def test_keys_initialization(tmpdir: Path) -> None:
     path = Path(tmpdir) / "test.hdf"
 
@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import numpy as np
+
+from vivarium.framework.artifact.cache import ArtifactCache
+
+
+def test_artifact_cache_evicts_least_recently_used() -> None:
+    cache = ArtifactCache(max_bytes=200)
+    cache["a"] = np.zeros(10)
+    cache["b"] = np.zeros(10)
+    assert cache.nbytes == 160
+
+    # Reading a key makes it the most recently used.
+    assert (cache["a"] == 0).all()
+    cache["c"] = np.zeros(10)
+
+    assert list(cache) == ["a", "c"]
+    assert cache.nbytes == 160
+    assert cache.get_memory_usage() == {"a": 80, "c": 80}
+
+
+def test_artifact_cache_pinning() -> None:
+    cache = ArtifactCache(max_bytes=100)
+    cache.pin("a")
+    cache["a"] = np.zeros(10)
+    cache["b"] = np.zeros(5)
+    # The pinned key is older, so the unpinned key is evicted instead.
+    assert list(cache) == ["a"]
+
+    # Pinned data is cached even when it is larger than the cache.
+    cache.pin("big")
+    cache["big"] = np.zeros(20)
+    assert set(cache) == {"a", "big"}
+    assert cache.nbytes == 240
+
+    cache.unpin("big")
+    assert set(cache) == {"a"}
+    assert cache.pinned == {"a"}
+
+
+def test_artifact_cache_does_not_cache_oversized_data() -> None:
+    cache = ArtifactCache(max_bytes=100)
+    cache["a"] = np.zeros(5)
+    cache["big"] = np.zeros(20)
+    assert list(cache) == ["a"]
+
+
+def test_artifact_cache_release() -> None:
+    cache = ArtifactCache()
+    cache.pin("a")
+    for key in ["a", "b", "c"]:
+        cache[key] = np.zeros(1000)
+    assert len(cache) == 3
+
+    cache.release()
+    assert list(cache) == ["a"]
+    assert cache.nbytes == 8000
+
+    cache.clear()
+    assert cache == {}
+    assert cache.nbytes == 0
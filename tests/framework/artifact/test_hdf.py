@@ -1,3 +1,4 @@
+import gc
 import json
 import random
 from pathlib import Path
@@ -137,6 +138,27 @@ def test_load_with_valid_filters(hdf_file_path: Path, hdf_key: str) -> None:
             assert set(data.year) == {2006}
 
 
+@pytest.mark.parametrize(
+    "filter_terms",
+    [
+        ["sex == 'Male'"],
+        ["sex = 'Female'", "year_start >= 2006"],
+        ["value > 30000"],
+        ["(sex == 'Male') & (year_start >= 2006)"],
+    ],
+)
+def test_load_filter_unqueryable_columns(
+    hdf_file_path: Path, filter_terms: list[str]
+) -> None:
+    key = "population.structure"
+    data = hdf.load(hdf_file_path, key, filter_terms=filter_terms, column_filters=None)
+    unfiltered = hdf.load(hdf_file_path, key, filter_terms=None, column_filters=None)
+    query = " & ".join(f"({term})" for term in filter_terms).replace(" = ", " == ")
+    expected = unfiltered.query(query)
+    assert 0 < len(data) < len(unfiltered)
+    pd.testing.assert_frame_equal(data.sort_index(), expected.sort_index())
+
+
 def test_load_filter_empty_data_frame_index(hdf_file_path: Path) -> None:
     key = hdf.EntityKey("cause.test.prevalence")
     data = pd.DataFrame(data={"age": range(10), "year": range(10), "draw": range(10)})
@@ -161,6 +183,59 @@ def test_get_keys(hdf_file_path: Path, hdf_keys: list[str]) -> None:
     assert sorted(hdf.get_keys(hdf_file_path)) == sorted(hdf_keys)
 
 
+def test_contains(hdf_file_path: Path, hdf_key: str) -> None:
+    assert hdf.contains(hdf_file_path, hdf_key)
+    assert not hdf.contains(hdf_file_path, "population.fake_key")
+    assert not hdf.contains(hdf_file_path, "fake.type.key")
+
+
+def test_read_handle(hdf_file_path: Path, hdf_keys: list[str], mocker: MockerFixture) -> None:
+    handle = hdf.get_read_handle(hdf_file_path)
+    assert handle is hdf.get_read_handle(str(hdf_file_path))
+    assert not handle.is_open
+
+    store_spy = mocker.spy(hdf.pd, "HDFStore")
+    handle.acquire()
+    for key in hdf_keys:
+        hdf.load(hdf_file_path, key, filter_terms=None, column_filters=None)
+    hdf.get_keys(hdf_file_path)
+    assert store_spy.call_count == 1
+    assert handle.is_open and handle.count == 1
+
+    handle.release()
+    assert not handle.is_open and handle.count == 0
+
+
+def test_read_handle_discarded(hdf_file_path: Path, mocker: MockerFixture) -> None:
+    store_spy = mocker.spy(hdf.pd, "HDFStore")
+    handle = hdf.get_read_handle(hdf_file_path)
+    handle.acquire()
+    store = store_spy.spy_return
+    assert store.is_open
+
+    # Dropping the last reference discards the handle and closes its file.
+    del handle
+    gc.collect()
+    assert not store.is_open
+    assert hdf_file_path.resolve() not in hdf._READ_HANDLES
+
+
+def test_read_handle_reopened_after_write(hdf_file_path: Path, hdf_key: str) -> None:
+    handle = hdf.get_read_handle(hdf_file_path)
+    node_path = EntityKey(hdf_key).path
+    with handle.open() as store:
+        hdf.remove(hdf_file_path, hdf_key)
+        # The held store is reopened and sees the change.
+        assert handle.is_open and store.is_open
+        assert store.get_node(node_path) is None  # type: ignore [operator]
+
+        hdf.write(hdf_file_path, hdf_key, ["data"])
+        assert store.get_node(node_path) is not None  # type: ignore [operator]
+        assert hdf.load(hdf_file_path, hdf_key, None, None) == ["data"]
+        assert handle.count == 1
+    assert not handle.is_open
+
+
 def test_write_json_blob(
     hdf_file_path: Path, mock_key: EntityKey, json_data: list[str]
 ) -> None:
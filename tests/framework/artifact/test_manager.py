@@ -1,22 +1,30 @@
 from __future__ import annotations
 
+import gc
 import random
 from pathlib import Path
 from unittest.mock import MagicMock
 
+import numpy as np
 import pandas as pd
 import pytest
 from layered_config_tree import LayeredConfigTree
 from pytest_mock import MockerFixture
 
+from vivarium import Component, InteractiveContext
+from vivarium.framework.artifact import hdf
+from vivarium.framework.artifact.artifact import Artifact, convert_artifact
 from vivarium.framework.artifact.manager import (
     ArtifactManager,
     _config_filter,
+    _filter_data,
     _subset_columns,
     _subset_rows,
+    filter_data,
     parse_artifact_path_config,
     validate_filter_term,
 )
+from vivarium.framework.engine import Builder
 from vivarium.testing_utilities import build_table, metadata
 
 
@@ -61,6 +69,49 @@ def test_subset_rows() -> None:
     )
 
 
+def test_subset_rows_categorical() -> None:
+    data = pd.DataFrame(
+        {
+            "sex": pd.Categorical(["Male", "Female", "Male", "Female"]),
+            "value": [1.0, 2.0, 3.0, 4.0],
+        }
+    )
+    assert _subset_rows(data, sex="Male").equals(data.iloc[[0, 2]])
+    assert _subset_rows(data, sex=["Female", "Both"]).equals(data.iloc[[1, 3]])
+    assert _subset_rows(data, sex="Both").empty
+
+
+def test_filter_data() -> None:
+    data = pd.DataFrame(
+        {
+            "sex": pd.Categorical(["Male", "Female"] * 4),
+            "year": [1990, 1990, 1991, 1991] * 2,
+            "draw": [0] * 8,
+            "value": range(8),
+        }
+    )
+    filtered = filter_data(data, "year > 1990", sex="Female")
+    expected = data.query("year > 1990 and sex == 'Female'").drop(columns=["sex", "draw"])
+    assert filtered.equals(expected)
+
+
+def test_load_reuses_category_index(mocker: MockerFixture) -> None:
+    data = pd.DataFrame(
+        {"sex": ["Male", "Female"] * 3, "location": ["A", "A", "B", "B", "C", "C"]}
+    ).set_index(["sex", "location"])
+    data["value"] = range(6)
+    am = ArtifactManager()
+    am.artifact = mocker.Mock(load=mocker.Mock(return_value=data))
+    groupby_spy = mocker.spy(pd.DataFrame, "groupby")
+
+    male = am.load("cause.test.incidence", sex="Male", location=["A", "C"])
+    assert list(male.value) == [0, 4]
+    female = am.load("cause.test.incidence", sex="Female", location="B")
+    assert list(female.value) == [3]
+    assert groupby_spy.call_count == 2
+    assert set(am._category_indices["cause.test.incidence"]) == {"sex", "location"}
+
+
 def test_subset_columns() -> None:
     values = [0, "red", 100]
     data = build_table(
@@ -151,6 +202,212 @@ def test_load_with_df_data(artifact_mock: MagicMock) -> None:
     assert isinstance(am.load("df_data.key"), pd.DataFrame)
 
 
+class ArtifactLoader(Component):
+    def setup(self, builder: Builder) -> None:
+        self.structure = builder.data.load("population.structure")
+        self.age_bins = builder.data.load("population.age_bins")
+        builder.data.retain("population.age_bins")
+
+
+def test_raw_data_released_after_setup(hdf_file_path: Path) -> None:
+    component = ArtifactLoader()
+    sim = InteractiveContext(
+        components=[component],
+        configuration={"input_data": {"artifact_path": str(hdf_file_path)}},
+    )
+    assert isinstance(component.structure, pd.DataFrame)
+
+    artifact = sim._data.artifact
+    assert artifact is not None
+    assert list(artifact._cache) == ["population.age_bins"]
+    assert list(sim.get_memory_metrics().query("Type == 'artifact_cache'")["Name"]) == [
+        "population.age_bins"
+    ]
+    assert artifact._handle is not None and not artifact._handle.is_open
+
+
+class FailingComponent(Component):
+    def setup(self, builder: Builder) -> None:
+        raise ValueError("Setup failed.")
+
+
+def test_artifact_file_closed_after_failed_setup(
+    hdf_file_path: Path, mocker: MockerFixture
+) -> None:
+    store_spy = mocker.spy(hdf.pd, "HDFStore")
+    with pytest.raises(ValueError, match="Setup failed"):
+        InteractiveContext(
+            components=[FailingComponent()],
+            configuration={"input_data": {"artifact_path": str(hdf_file_path)}},
+        )
+    gc.collect()
+    assert store_spy.call_count > 0
+    assert not any(store.is_open for store in store_spy.spy_return_list)
+
+
+def test_artifact_file_closed_at_simulation_end(hdf_file_path: Path) -> None:
+    sim = InteractiveContext(
+        configuration={"input_data": {"artifact_path": str(hdf_file_path)}}
+    )
+    artifact = sim._data.artifact
+    assert artifact is not None and artifact._handle is not None
+    artifact.acquire_handle()
+    assert artifact._handle.is_open
+
+    sim.take_steps(1)
+    sim.finalize()
+    assert not artifact._handle.is_open
+
+
+class ConfiguredArtifactLoader(Component):
+    CONFIGURATION_DEFAULTS = {
+        "configured_artifact_loader": {
+            "data_sources": {
+                "structure": "population.structure",
+                "age_bins": "self::load_age_bins",
+                "scalar": 1.0,
+            }
+        }
+    }
+
+    def setup(self, builder: Builder) -> None:
+        key = "population.theoretical_minimum_risk_life_expectancy"
+        builder.data.prefetch([key])
+        self.life_expectancy = builder.data.load(key)
+
+
+def test_prefetch(mocker: MockerFixture, hdf_file_path: Path) -> None:
+    prefetch_spy = mocker.spy(Artifact, "prefetch")
+    component = ConfiguredArtifactLoader()
+    InteractiveContext(
+        components=[component],
+        configuration={
+            "input_data": {
+                "artifact_path": str(hdf_file_path),
+                "artifact_prefetch_workers": 2,
+            }
+        },
+    )
+
+    assert prefetch_spy.call_count == 2
+    (_, configured_keys), kwargs = prefetch_spy.call_args_list[0]
+    assert list(configured_keys) == ["population.structure"]
+    assert kwargs == {"max_workers": 2}
+    (_, component_keys), _ = prefetch_spy.call_args_list[1]
+    assert list(component_keys) == ["population.theoretical_minimum_risk_life_expectancy"]
+    assert isinstance(component.life_expectancy, pd.DataFrame)
+
+
+@pytest.mark.parametrize("suffix", [".hdf", ".parquet"])
+@pytest.mark.parametrize("filter_term", ["sex == 'Male'", "year_start >= 2006"])
+def test_config_filter_applied_on_read(
+    hdf_file_path: Path, tmp_path: Path, suffix: str, filter_term: str
+) -> None:
+    artifact_path = hdf_file_path
+    if suffix == ".parquet":
+        artifact_path = tmp_path / "artifact.parquet"
+        convert_artifact(hdf_file_path, artifact_path)
+    component = ArtifactLoader()
+    sim = InteractiveContext(
+        components=[component],
+        configuration={
+            "input_data": {
+                "artifact_path": str(artifact_path),
+                "artifact_filter_term": filter_term,
+            }
+        },
+    )
+
+    artifact = sim._data.artifact
+    assert artifact is not None and artifact.filter_terms == [filter_term]
+    expected = Artifact(hdf_file_path).load("population.structure").reset_index()
+    expected = expected.query(filter_term).reset_index(drop=True)
+    assert len(expected)
+    pd.testing.assert_frame_equal(
+        component.structure.sort_values(list(expected.columns)).reset_index(drop=True),
+        expected.sort_values(list(expected.columns)).reset_index(drop=True),
+        check_like=True,
+    )
+
+
+@pytest.mark.parametrize("suffix", [".hdf", ".parquet"])
+def test_shared_directory(hdf_file_path: Path, tmp_path: Path, suffix: str) -> None:
+    artifact_path = hdf_file_path
+    if suffix == ".parquet":
+        artifact_path = tmp_path / "artifact.parquet"
+        convert_artifact(hdf_file_path, artifact_path)
+    shared_directory = tmp_path / "shared"
+    components = []
+    for draw in range(2):
+        component = ArtifactLoader()
+        InteractiveContext(
+            components=[component],
+            configuration={
+                "input_data": {
+                    "artifact_path": str(artifact_path),
+                    "input_draw_number": draw,
+                    "artifact_shared_directory": str(shared_directory),
+                }
+            },
+        )
+        components.append(component)
+
+    (artifact_directory,) = shared_directory.iterdir()
+    assert sorted(path.name for path in artifact_directory.glob("*.arrow")) == [
+        "population.age_bins.arrow",
+        "population.structure.arrow",
+    ]
+    expected = Artifact(hdf_file_path).load("population.structure").reset_index()
+    for component in components:
+        pd.testing.assert_frame_equal(component.structure, expected)
+
+
+class SharedDataLoader(Component):
+    def setup(self, builder: Builder) -> None:
+        self.structure = builder.data.load("population.structure")
+        builder.data.retain("population.structure")
+
+
+def test_shared_data_not_copied(hdf_file_path: Path, tmp_path: Path) -> None:
+    component = SharedDataLoader()
+    sim = InteractiveContext(
+        components=[component],
+        configuration={
+            "input_data": {
+                "artifact_path": str(hdf_file_path),
+                "artifact_shared_directory": str(tmp_path / "shared"),
+            }
+        },
+    )
+    artifact = sim._data.artifact
+    assert artifact is not None and artifact.is_shared("population.structure")
+    mapped = artifact.load("population.structure")["value"].to_numpy()
+    loaded = component.structure["value"].to_numpy()
+    assert np.shares_memory(loaded, mapped)
+    assert not loaded.flags.writeable
+    expected = Artifact(hdf_file_path).load("population.structure").reset_index()
+    pd.testing.assert_frame_equal(component.structure, expected)
+
+
+def test_filter_data_without_copy() -> None:
+    data = pd.DataFrame(
+        {"sex": ["Female"] * 3 + ["Male"] * 3, "year": [1, 2, 3] * 2, "value": range(6)}
+    )
+    values = data["value"].to_numpy()
+
+    contiguous = _filter_data(data, None, {"sex": "Male"}, copy=False)
+    assert list(contiguous.columns) == ["year", "value"]
+    assert list(contiguous["value"]) == [3, 4, 5]
+    assert np.shares_memory(contiguous["value"].to_numpy(), values)
+
+    scattered = _filter_data(data, None, {"year": 2}, copy=False)
+    assert list(scattered["value"]) == [1, 4]
+    assert not np.shares_memory(scattered["value"].to_numpy(), values)
+
+    copied = _filter_data(data, None, {"sex": "Male"})
+    assert not np.shares_memory(copied["value"].to_numpy(), values)
+
+
 def test_config_filter() -> None:
     df = pd.DataFrame({"year": range(1990, 2000, 1), "color": ["red", "yellow"] * 5})
     filtered = _config_filter(df, "year in [1992, 1995]")
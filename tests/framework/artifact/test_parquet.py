@@ -0,0 +1,158 @@
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from vivarium.framework.artifact import hdf, parquet
+
+_KEYS = [
+    "population.age_bins",
+    "population.structure",
+    "population.theoretical_minimum_risk_life_expectancy",
+    "cause.all_causes.restrictions",
+    "metadata.versions",
+    "metadata.locations",
+    "metadata.keyspace",
+]
+
+
+@pytest.fixture
+def parquet_path(tmp_path: Path) -> Path:
+    path = tmp_path / "artifact.parquet"
+    parquet.touch(path)
+    return path
+
+
+@pytest.fixture
+def parquet_artifact_path(parquet_path: Path, hdf_file_path: Path) -> Path:
+    for key in hdf.get_keys(hdf_file_path):
+        parquet.write(parquet_path, key, hdf.load(hdf_file_path, key, None, None))
+    return parquet_path
+
+
+@pytest.fixture
+def draw_data() -> pd.DataFrame:
+    index = pd.MultiIndex.from_product(
+        [["Kenya", "Uganda"], ["Female", "Male"], range(2000, 2005)],
+        names=["location", "sex", "year_start"],
+    )
+    return pd.DataFrame(
+        {f"draw_{i}": np.arange(len(index), dtype=float) + i for i in range(10)},
+        index=index,
+    )
+
+
+def test_touch(tmp_path: Path) -> None:
+    path = tmp_path / "artifact.parquet"
+    parquet.touch(path)
+    assert path.is_dir()
+
+    (path / "data.population.structure.parquet").touch()
+    parquet.touch(path)
+    assert not list(path.iterdir())
+
+
+def test_touch_invalid_suffix(tmp_path: Path) -> None:
+    with pytest.raises(ValueError, match="invalid Parquet artifact suffix"):
+        parquet.touch(tmp_path / "artifact.hdf")
+
+
+def test_get_keys(parquet_artifact_path: Path) -> None:
+    assert sorted(parquet.get_keys(parquet_artifact_path)) == sorted(_KEYS)
+
+
+def test_contains(parquet_artifact_path: Path) -> None:
+    assert parquet.contains(parquet_artifact_path, "population.structure")
+    assert parquet.contains(parquet_artifact_path, "metadata.keyspace")
+    assert not parquet.contains(parquet_artifact_path, "population.fake_key")
+
+
+@pytest.mark.parametrize("key", _KEYS)
+def test_load_matches_hdf(parquet_artifact_path: Path, hdf_file_path: Path, key: str) -> None:
+    expected = hdf.load(hdf_file_path, key, None, None)
+    data = parquet.load(parquet_artifact_path, key, None, None)
+    if isinstance(expected, pd.DataFrame):
+        pd.testing.assert_frame_equal(data, expected)
+    else:
+        assert data == expected
+
+
+def test_load_with_filters_matches_hdf(
+    parquet_artifact_path: Path, hdf_file_path: Path
+) -> None:
+    key = "population.structure"
+    filter_terms = ["year_start >= 2006", "location == 'Ethiopia'", "fake_column == 0"]
+    expected = hdf.load(hdf_file_path, key, filter_terms, ["value"])
+    data = parquet.load(parquet_artifact_path, key, filter_terms, ["value"])
+    assert len(data) and len(data) == len(expected)
+    pd.testing.assert_frame_equal(data.sort_index(), expected.sort_index())
+
+
+def test_load_draw_columns(parquet_path: Path, draw_data: pd.DataFrame) -> None:
+    parquet.write(parquet_path, "cause.test.incidence", draw_data)
+    data = parquet.load(
+        parquet_path,
+        "cause.test.incidence",
+        ["draw = 3", "(location in ['Kenya']) & ~(year_start < 2002)"],
+        ["draw_3", "value"],
+    )
+    expected = draw_data.query("location == 'Kenya' and year_start >= 2002")[["draw_3"]]
+    pd.testing.assert_frame_equal(data, expected)
+
+
+@pytest.mark.parametrize("name", [None, "value", "rate"])
+def test_write_load_series(parquet_path: Path, name: str | None) -> None:
+    series = pd.Series([0.1, 0.2, 0.3], index=pd.Index([1, 3, 5], name="age"), name=name)
+    parquet.write(parquet_path, "cause.test.rate", series)
+    pd.testing.assert_series_equal(
+        parquet.load(parquet_path, "cause.test.rate", ["age > 1"], ["draw_0"]),
+        series.iloc[1:],
+    )
+
+
+def test_write_load_empty_data_frame_index(parquet_path: Path) -> None:
+    data = pd.DataFrame(
+        index=pd.MultiIndex.from_tuples([(0, "a"), (1, "b")], names=["i", "j"])
+    )
+    parquet.write(parquet_path, "population.test.index", data)
+    pd.testing.assert_frame_equal(
+        parquet.load(parquet_path, "population.test.index", None, ["value"]), data
+    )
+
+
+@pytest.mark.parametrize("data", [[], {}, ["data"], {"thing": "value"}, "bananas"])
+def test_write_load_json(parquet_path: Path, data: Any) -> None:
+    parquet.write(parquet_path, "metadata.test", data)
+    assert parquet.load(parquet_path, "metadata.test", None, None) == data
+
+
+def test_remove(parquet_artifact_path: Path) -> None:
+    parquet.remove(parquet_artifact_path, "population.structure")
+    parquet.remove(parquet_artifact_path, "metadata.versions")
+    assert "population.structure" not in parquet.get_keys(parquet_artifact_path)
+    assert "metadata.versions" not in parquet.get_keys(parquet_artifact_path)
+    with pytest.raises(FileNotFoundError):
+        parquet.remove(parquet_artifact_path, "population.structure")
+
+
+@pytest.mark.parametrize(
+    "term",
+    [
+        "draw",
+        "draw ==",
+        "draw == other_column",
+        "draw == 1 == 2",
+        "draw.real == 0",
+        "draw(0) == 0",
+    ],
+)
+def test_get_filter_expression_invalid(term: str) -> None:
+    with pytest.raises(ValueError, match="Unsupported"):
+        parquet._get_filter_expression([term], ["draw", "other_column"])
+
+
+def test_get_filter_expression_no_valid_terms() -> None:
+    assert parquet._get_filter_expression(None, ["draw"]) is None
+    assert parquet._get_filter_expression(["year == 2000"], ["draw"]) is None
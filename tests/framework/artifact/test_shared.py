@@ -0,0 +1,104 @@
+import gc
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from vivarium.framework.artifact import hdf
+from vivarium.framework.artifact.shared import SharedArtifactData, is_draw_invariant
+
+
+@pytest.fixture
+def shared(tmp_path: Path, hdf_file_path: Path) -> SharedArtifactData:
+    return SharedArtifactData(tmp_path / "shared", hdf_file_path, ["draw == 0"])
+
+
+@pytest.fixture
+def structure() -> pd.DataFrame:
+    index = pd.MultiIndex.from_product(
+        [pd.Categorical(["Female", "Male"]), np.arange(0, 100, 5)],
+        names=["sex", "age_start"],
+    )
+    return pd.DataFrame({"value": np.arange(len(index), dtype=float)}, index=index)
+
+
+def test_load_or_share(shared: SharedArtifactData, structure: pd.DataFrame) -> None:
+    loader = MagicMock(return_value=structure)
+    assert "population.structure" not in shared
+
+    data = shared.load_or_share("population.structure", loader)
+    pd.testing.assert_frame_equal(data, structure)
+    assert "population.structure" in shared
+
+    shared.load_or_share("population.structure", loader)
+    loader.assert_called_once()
+
+
+def test_load_is_read_only(shared: SharedArtifactData, structure: pd.DataFrame) -> None:
+    shared.load_or_share("population.structure", lambda: structure)
+    data = shared.load("population.structure")
+    assert not data["value"].to_numpy().flags.writeable
+    with pytest.raises(ValueError, match="read-only"):
+        data["value"].to_numpy()[0] = 1.0
+
+
+@pytest.mark.parametrize("name", [None, "value", "rate"])
+def test_load_or_share_series(shared: SharedArtifactData, name: str | None) -> None:
+    series = pd.Series([0.1, 0.2, 0.3], index=pd.Index([1, 3, 5], name="age"), name=name)
+    shared.load_or_share("cause.test.rate", lambda: series)
+    pd.testing.assert_series_equal(shared.load("cause.test.rate"), series)
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        pd.DataFrame({"draw_0": [1.0]}),
+        pd.DataFrame({"value": [1.0]}, index=pd.Index([0], name="draw")),
+        pd.Series([1.0], name="draw_3"),
+        ["Kenya"],
+    ],
+)
+def test_load_or_share_draw_data(shared: SharedArtifactData, data: object) -> None:
+    assert not is_draw_invariant(data)
+    assert shared.load_or_share("cause.test.data", lambda: data) is data
+    assert "cause.test.data" not in shared
+
+
+def test_shared_directory(tmp_path: Path, hdf_file_path: Path) -> None:
+    users = []
+
+    def get_directory(filter_terms: list[str]) -> Path:
+        users.append(SharedArtifactData(tmp_path, hdf_file_path, filter_terms))
+        return users[-1].directory
+
+    directory = get_directory(["draw == 0", "location == 'Kenya'"])
+    assert directory.parent == tmp_path and directory.is_dir()
+    assert get_directory(["location == 'Kenya'", "draw in [1, 2]"]) == directory
+    assert get_directory(["(draw == 3)"]) != directory
+    assert get_directory(["(draw == 3) & (location == 'Kenya')"]) != directory
+
+    hdf.write(hdf_file_path, "population.shared_test", pd.DataFrame({"value": [1.0]}))
+    assert get_directory(["draw == 0", "location == 'Kenya'"]) != directory
+
+
+def test_shared_directory_cleanup(
+    tmp_path: Path, hdf_file_path: Path, structure: pd.DataFrame
+) -> None:
+    first = SharedArtifactData(tmp_path, hdf_file_path)
+    second = SharedArtifactData(tmp_path, hdf_file_path)
+    data = first.load_or_share("population.structure", lambda: structure)
+    directory = first.directory
+
+    # The directory is kept until its last user is done with it.
+    del first
+    gc.collect()
+    assert "population.structure" in second
+
+    del second
+    gc.collect()
+    assert not directory.exists()
+    assert tmp_path.is_dir()
+    # Memory-mapped data stays readable after its file is removed.
+    pd.testing.assert_frame_equal(data, structure)
@@ -1,9 +1,14 @@
 from __future__ import annotations
 
+import gc
+import pickle
+from pathlib import Path
 from typing import Any, Literal
 
+import numpy as np
 import pandas as pd
 import pytest
+from layered_config_tree import LayeredConfigTree
 from pytest_mock import MockerFixture
 
 from tests.framework.population.conftest import CUBE_COL_NAMES, PIE_COL_NAMES, PIE_RECORDS
@@ -26,6 +31,8 @@ from vivarium import Component, InteractiveContext
 from vivarium.framework.engine import Builder
 from vivarium.framework.population.exceptions import PopulationError
 from vivarium.framework.population.manager import PopulationManager, SimulantData
+from vivarium.framework.population.storage import MemmapColumnStore
+from vivarium.testing_utilities import TestPopulation
 
 
 class InitializingComponent(Component):
@@ -495,6 +502,12 @@ def test_get_private_columns_raises_bad_column_request() -> None:
         mgr.get_private_columns(ColumnCreator(), columns=["foo"])
 
 
+def test_restore_checkpoint_data_without_index() -> None:
+    sim = InteractiveContext(components=[AttributePipelineCreator()])
+    with pytest.raises(PopulationError, match="has no population index"):
+        sim._population.restore_checkpoint_data({})
+
+
 def test_get_population_index() -> None:
     component = AttributePipelineCreator()
     sim = InteractiveContext(components=[component], setup=False)
@@ -537,3 +550,163 @@ def test_register_tracked_query(mocker: MockerFixture) -> None:
     mgr.register_tracked_query("foo == 'bar'")
     mgr.logger.warning.assert_called_once()  # type: ignore[attr-defined]
     assert mgr.tracked_queries == ["foo == 'bar'", "cat != dog"]
+
+
+def test_memmap_storage_matches_memory_storage(
+    base_config: LayeredConfigTree, tmp_path: Path
+) -> None:
+    populations = {}
+    for backend in ["memory", "memmap"]:
+        sim = InteractiveContext(
+            base_config,
+            components=[TestPopulation(), ColumnCreator()],
+            configuration={
+                "population": {
+                    "population_size": 100,
+                    "storage": {"backend": backend, "scratch_directory": str(tmp_path)},
+                }
+            },
+        )
+        sim.take_steps(2)
+        sim.simulant_creator(10, {"sim_state": "time_step"})
+        sim.take_steps(1)
+        populations[backend] = sim._population.private_columns
+        if backend == "memmap":
+            store = sim._population._column_store
+            assert isinstance(store, MemmapColumnStore)
+            assert set(store.columns) == {
+                "age",
+                "is_alive",
+                "entrance_time",
+                "exit_time",
+                "test_column_1",
+                "test_column_2",
+                "test_column_3",
+            }
+            private_columns = sim._population._private_columns
+            assert private_columns is not None
+            assert set(private_columns.columns) == {"sex", "location"}
+
+    memory, memmap = populations["memory"], populations["memmap"]
+    pd.testing.assert_frame_equal(memmap[memory.columns], memory)
+
+
+def test_memmap_storage_requires_scratch_directory(base_config: LayeredConfigTree) -> None:
+    with pytest.raises(PopulationError, match="scratch directory must be provided"):
+        InteractiveContext(
+            base_config,
+            components=[ColumnCreator()],
+            configuration={"population": {"storage": {"backend": "memmap"}}},
+        )
+
+
+def test_unknown_storage_backend_raises(base_config: LayeredConfigTree) -> None:
+    with pytest.raises(PopulationError, match="Unknown population storage backend"):
+        InteractiveContext(
+            base_config,
+            components=[ColumnCreator()],
+            configuration={"population": {"storage": {"backend": "cloud"}}},
+        )
+
+
+def test_memmap_column_store(tmp_path: Path) -> None:
+    store = MemmapColumnStore(tmp_path)
+    store.resize(5)
+    store.write("x", pd.Series([1, 2, 3, 4, 5]))
+    store.write("x", pd.Series([10, 30], index=[0, 2]))
+    store.resize(8)
+    store.write("x", pd.Series([6.5, 7.5, 8.5], index=[5, 6, 7]))
+
+    expected = pd.Series([10, 2, 30, 4, 5, 6.5, 7.5, 8.5], name="x")
+    pd.testing.assert_series_equal(store.read("x", pd.RangeIndex(8)), expected)
+    assert store.nbytes() == store.nbytes("x") == 8 * 8
+
+    restored = pickle.loads(pickle.dumps(store))
+    assert restored.directory == store.directory
+    pd.testing.assert_series_equal(
+        restored.read("x", pd.Index([1, 7])), expected.loc[pd.Index([1, 7])]
+    )
+
+
+def test_memmap_column_store_unwritten_rows(tmp_path: Path) -> None:
+    store = MemmapColumnStore(tmp_path)
+    store.resize(3)
+    store.write("x", pd.Series([1.0], index=[1]))
+    store.write("t", pd.Series(pd.to_datetime(["2020-01-01"]), index=[0]))
+    store.resize(10)
+    store.write("x", pd.Series([5.0], index=[5]))
+
+    x = store.read("x", pd.RangeIndex(10))
+    assert list(x.index[x.notna()]) == [1, 5]
+    t = store.read("t", pd.RangeIndex(10))
+    assert list(t.index[t.notna()]) == [0]
+    # A column rewritten with a new dtype keeps its missing values.
+    store.write("x", pd.Series(np.array([2.0], dtype=np.float32), index=[2]))
+    x = store.read("x", pd.RangeIndex(10))
+    assert x.dtype == np.float32
+    assert list(x.index[x.notna()]) == [1, 2, 5]
+
+
+def test_memmap_column_store_copy(tmp_path: Path) -> None:
+    store = MemmapColumnStore(tmp_path)
+    store.resize(3)
+    store.write("x", pd.Series([1.0, 2.0, 3.0]))
+
+    copy = store.copy()
+    assert copy.directory != store.directory
+    assert copy.directory.parent == tmp_path
+    copy.write("x", pd.Series([10.0], index=[0]))
+    assert list(copy.read("x", pd.RangeIndex(3))) == [10.0, 2.0, 3.0]
+    assert list(store.read("x", pd.RangeIndex(3))) == [1.0, 2.0, 3.0]
+
+
+def test_memmap_column_store_cleanup(tmp_path: Path) -> None:
+    store = MemmapColumnStore(tmp_path)
+    store.resize(3)
+    store.write("x", pd.Series([1, 2, 3]))
+    directory = store.directory
+    restored = pickle.loads(pickle.dumps(store))
+    # Only the store that created the directory removes it.
+    del restored
+    gc.collect()
+    assert directory.exists()
+
+    del store
+    gc.collect()
+    assert not directory.exists()
+
+
+def test_compact_dtypes(base_config: LayeredConfigTree) -> None:
+    sim = InteractiveContext(
+        base_config,
+        components=[TestPopulation(), ColumnCreator()],
+        configuration={"population": {"population_size": 100, "compact_dtypes": True}},
+    )
+    private_columns = sim._population._private_columns
+    assert private_columns is not None
+    assert private_columns["test_column_1"].dtype == np.int64
+    assert private_columns["age"].dtype == np.float64
+    assert isinstance(private_columns["sex"].dtype, pd.CategoricalDtype)
+    assert isinstance(private_columns["location"].dtype, pd.CategoricalDtype)
+    savings = sim._population.compact_dtype_savings
+    assert savings["sex"] > 0
+    assert savings["test_column_1"] == savings["age"] == 0
+
+    sim.take_steps(1)
+    sim.simulant_creator(10, {"sim_state": "time_step"})
+    col_creator = sim.get_component("column_creator")
+    # Updates that would overflow or round in a narrower dtype are stored exactly.
+    for _ in range(2):
+        col_creator.population_view.update("test_column_1", lambda col: col + 100)
+    view = sim.get_component("test_population").population_view
+    view.update("age", lambda age: pd.Series(0.1234567890123, index=age.index))
+    view.update("location", lambda col: pd.Series("Chile", index=col.index[:5]))
+
+    private_columns = sim._population._private_columns
+    assert private_columns is not None
+    assert len(private_columns) == 110
+    assert list(private_columns["test_column_1"].iloc[:3]) == [200, 201, 202]
+    assert (private_columns["age"] == 0.1234567890123).all()
+    assert isinstance(private_columns["sex"].dtype, pd.CategoricalDtype)
+    assert "Chile" in private_columns["location"].cat.categories
+    assert (private_columns["location"].iloc[:5] == "Chile").all()
@@ -1,9 +1,15 @@
 from __future__ import annotations
 
+from typing import Any
+
+import numpy as np
+import pandas as pd
 import pytest
 
 from vivarium.framework.population.utilities import (
     combine_queries,
+    compact_dtype,
+    conform_dtype,
     extract_columns_from_query,
 )
 
@@ -98,3 +104,31 @@ def test_extract_columns_from_query(query: str, expected: set[str]) -> None:
 def test_combine_queries(queries: tuple[str, ...], expected_query: str) -> None:
     combined = combine_queries(*queries)
     assert combined == expected_query
+
+
+@pytest.mark.parametrize(
+    "values, expected_dtype",
+    [
+        (pd.Series([1, 2, 3]), np.dtype("int64")),
+        (pd.Series([0.5, 0.25, np.nan]), np.dtype("float64")),
+        (pd.Series([True, False]), np.dtype("bool")),
+        (pd.Series(["a", "b", "a", "b"]), pd.CategoricalDtype(["a", "b"])),
+        (pd.Series(["a", "b", "c", "a"]), np.dtype("object")),
+        (pd.Series(["a", 1, "a", 1]), np.dtype("object")),
+        (pd.Series(pd.to_datetime(["2020-01-01"])), np.dtype("datetime64[ns]")),
+    ],
+)
+def test_compact_dtype(values: pd.Series[Any], expected_dtype: Any) -> None:
+    compacted = compact_dtype(values)
+    assert compacted.dtype == expected_dtype
+    assert (compacted.astype(object) == values.astype(object)).sum() == values.notna().sum()
+
+
+def test_conform_dtype() -> None:
+    conformed = conform_dtype(pd.Series(["b", "c"]), pd.CategoricalDtype(["a", "b"]))
+    assert list(conformed.cat.categories) == ["a", "b", "c"]
+    assert list(conformed) == ["b", "c"]
+
+    # Numeric updates keep their full width.
+    update = pd.Series([0.1234567890123, 300])
+    assert conform_dtype(update, np.dtype("float32")) is update
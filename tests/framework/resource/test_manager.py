@@ -7,8 +7,9 @@ from typing import Any
 import pytest
 from pytest_mock import MockerFixture
 
+from tests.framework.results.helpers import Hogwarts
 from tests.helpers import ColumnCreator, ColumnCreatorAndRequirer
-from vivarium import Component
+from vivarium import Component, InteractiveContext
 from vivarium.framework.population import SimulantData
 from vivarium.framework.randomness import RandomnessStream
 from vivarium.framework.randomness.index_map import IndexMap
@@ -236,3 +237,15 @@ def test_get_population_initializers(
     assert initializers[0] == resource_producers[0].initialize_A
     assert resource_producers[3].initialize_D in initializers
     assert resource_producers[4].initialize_nothing in initializers
+
+
+def test_get_columns_read() -> None:
+    sim = InteractiveContext(components=[Hogwarts()])
+    resources = sim._resource
+    assert resources.get_columns_read([]) == set()
+    assert resources.get_columns_read(["familiar", "unknown"]) == {"familiar"}
+    # Attributes are traced back to the private columns they are produced from.
+    assert resources.get_columns_read(["double_power", "grade"]) == {
+        "power_level",
+        "exam_score",
+    }
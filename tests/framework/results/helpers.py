@@ -297,6 +297,24 @@ class HogwartsResultsStratifier(Component):
         )
 
 
+class HousePointsBonus(Component):
+    """A branchable component that awards each student bonus points when metrics
+    are collected."""
+
+    CONFIGURATION_DEFAULTS = {"house_points_bonus": {"points": 0}}
+
+    def setup(self, builder: Builder) -> None:
+        self.points = self.configuration.points
+        builder.results.register_adding_observation(
+            name="bonus_points",
+            aggregator=lambda df: len(df) * self.points,
+            excluded_stratifications=["student_house", "power_level_group"],
+        )
+
+    def on_branch(self) -> None:
+        self.points = self.configuration.points
+
+
 ##################
 # Helper methods #
 ##################
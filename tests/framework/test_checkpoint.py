@@ -0,0 +1,99 @@
+from pathlib import Path
+
+import pandas as pd
+import pytest
+from pytest_mock import MockerFixture
+
+from vivarium.exceptions import VivariumError
+from vivarium.framework import checkpoint as checkpoint_module
+from vivarium.framework.checkpoint import (
+    Checkpoint,
+    read_checkpoint,
+    write_checkpoint,
+)
+
+
+@pytest.fixture
+def checkpoint() -> Checkpoint:
+    results_index = pd.MultiIndex.from_product(
+        [pd.CategoricalIndex(["cat", "owl"]), ["gryffindor", "slytherin"]],
+        names=["familiar", "student_house"],
+    )
+    return Checkpoint(
+        model_specification={"configuration": {"population": {"population_size": 3}}},
+        tables={
+            "population": {
+                "index": pd.DataFrame(index=pd.RangeIndex(3)),
+                "column.age": pd.DataFrame({"age": [1.5, 20.0, 64.25]}),
+                "column.alive": pd.DataFrame(
+                    {"alive": pd.Categorical(["alive", "dead", "alive"])}
+                ),
+            },
+            "clock": {
+                "clock": pd.DataFrame(
+                    {
+                        "time": [pd.Timestamp("2020-01-01")],
+                        "step_size": [pd.Timedelta(days=1)],
+                    }
+                )
+            },
+            "results": {
+                "house_points": pd.DataFrame({"value": range(4)}, index=results_index)
+            },
+        },
+    )
+
+
+def assert_checkpoints_equal(checkpoint: Checkpoint, expected: Checkpoint) -> None:
+    assert checkpoint.model_specification == expected.model_specification
+    assert checkpoint.tables.keys() == expected.tables.keys()
+    for manager, tables in expected.tables.items():
+        assert checkpoint.tables[manager].keys() == tables.keys()
+        for name, table in tables.items():
+            pd.testing.assert_frame_equal(checkpoint.tables[manager][name], table)
+
+
+def test_write_read_checkpoint(tmp_path: Path, checkpoint: Checkpoint) -> None:
+    write_checkpoint(tmp_path / "backup", checkpoint)
+    restored = read_checkpoint(tmp_path / "backup")
+    assert_checkpoints_equal(restored, checkpoint)
+
+    age = restored.tables["population"]["column.age"]
+    age.loc[0, "age"] = 2.5
+    assert age.loc[0, "age"] == 2.5
+
+
+def test_write_checkpoint_incremental(
+    mocker: MockerFixture, tmp_path: Path, checkpoint: Checkpoint
+) -> None:
+    write_checkpoint(tmp_path, checkpoint)
+    write_spy = mocker.spy(checkpoint_module, "_write_table")
+
+    population = dict(checkpoint.tables["population"])
+    population["column.age"] = population["column.age"] + 1
+    updated = Checkpoint(
+        checkpoint.model_specification, {**checkpoint.tables, "population": population}
+    )
+    write_checkpoint(tmp_path, updated)
+
+    assert write_spy.call_count == 1
+    assert len(list((tmp_path / "tables").iterdir())) == 5
+    assert_checkpoints_equal(read_checkpoint(tmp_path), updated)
+
+
+def test_read_checkpoint_invalid(tmp_path: Path, checkpoint: Checkpoint) -> None:
+    with pytest.raises(VivariumError, match="No checkpoint found"):
+        read_checkpoint(tmp_path)
+
+    write_checkpoint(tmp_path, checkpoint)
+    manifest = tmp_path / "checkpoint.json"
+    manifest.write_text(
+        manifest.read_text().replace('"format_version": 1', '"format_version": 0')
+    )
+    with pytest.raises(VivariumError, match="format version 0"):
+        read_checkpoint(tmp_path)
+
+    pickled_backup = tmp_path / "backup.pkl"
+    pickled_backup.write_bytes(b"")
+    with pytest.raises(VivariumError, match="can no longer be read"):
+        read_checkpoint(pickled_backup)
@@ -1,4 +1,5 @@
 import math
+import tracemalloc
 from collections.abc import Callable, Generator
 from itertools import product
 from pathlib import Path
@@ -6,7 +7,6 @@ from time import time
 from types import MethodType
 from typing import Any, cast
 
-import dill
 import pandas as pd
 import pytest
 from _pytest.logging import LogCaptureFixture
@@ -20,6 +20,7 @@ from tests.framework.results.helpers import (
     STUDENT_HOUSES,
     Hogwarts,
     HogwartsResultsStratifier,
+    HousePointsBonus,
     HousePointsObserver,
     NoStratificationsQuidditchWinsObserver,
     QuidditchWinsObserver,
@@ -32,7 +33,9 @@ from tests.helpers import (
     MockComponentB,
 )
 from vivarium import Component, InteractiveContext
+from vivarium.examples.disease_model import get_model_specification_path
 from vivarium.framework.artifact import ArtifactInterface, ArtifactManager
+from vivarium.framework.checkpoint import read_checkpoint
 from vivarium.framework.components import (
     ComponentConfigError,
     ComponentInterface,
@@ -41,8 +44,9 @@ from vivarium.framework.components import (
 )
 from vivarium.framework.engine import Builder
 from vivarium.framework.engine import SimulationContext as SimulationContext_
-from vivarium.framework.event import EventInterface, EventManager
+from vivarium.framework.event import Event, EventInterface, EventManager
 from vivarium.framework.lifecycle import (
+    ConstraintError,
     LifeCycleInterface,
     LifeCycleManager,
     lifecycle_states,
@@ -53,6 +57,7 @@ from vivarium.framework.population import PopulationInterface, PopulationManager
 from vivarium.framework.randomness import RandomnessInterface, RandomnessManager
 from vivarium.framework.resource import ResourceInterface, ResourceManager
 from vivarium.framework.results import VALUE_COLUMN, ResultsInterface, ResultsManager
+from vivarium.framework.state_machine import Machine, State
 from vivarium.framework.time import DateTimeClock, TimeInterface
 from vivarium.framework.values import ValuesInterface, ValuesManager
 
@@ -313,6 +318,79 @@ def test_SimulationContext_step(
     assert sim._clock.time == current_time + step_size
 
 
+def test_SimulationContext_step_reuses_active_index(
+    SimulationContext: type[SimulationContext_],
+    base_config: LayeredConfigTree,
+    components: list[Component],
+    mocker: MockerFixture,
+) -> None:
+    sim = SimulationContext(base_config, components)
+    sim.setup()
+    sim.initialize_simulants()
+    get_active_simulants = mocker.spy(sim._clock, "get_active_simulants")
+    listener: Listener = cast(Listener, [c for c in components if "listener" in c.name][0])
+
+    sim.step()
+
+    assert get_active_simulants.call_count == 1
+    indexes = list(listener.event_indexes.values())
+    assert all(index is indexes[0] for index in indexes)
+
+
+def test_SimulationContext_step_recomputes_active_index_on_growth(
+    SimulationContext: type[SimulationContext_],
+    base_config: LayeredConfigTree,
+    components: list[Component],
+) -> None:
+    class Births(Component):
+        def setup(self, builder: Builder) -> None:
+            self.simulant_creator = builder.population.get_simulant_creator()
+
+        def on_time_step(self, event: Event) -> None:
+            self.simulant_creator(5, {"sim_state": "time_step"})
+
+    sim = SimulationContext(base_config, [*components, Births()])
+    sim.setup()
+    sim.initialize_simulants()
+    listener: Listener = cast(Listener, [c for c in components if "listener" in c.name][0])
+    initial_index = sim.get_population_index()
+
+    sim.step()
+
+    prepare_index = listener.event_indexes[lifecycle_states.TIME_STEP_PREPARE]
+    time_step_index = listener.event_indexes[lifecycle_states.TIME_STEP]
+    cleanup_index = listener.event_indexes[lifecycle_states.TIME_STEP_CLEANUP]
+    assert prepare_index is not None and prepare_index.equals(initial_index)
+    assert time_step_index is not None and time_step_index.equals(initial_index)
+    assert cleanup_index is not None and cleanup_index.equals(sim.get_population_index())
+    assert len(sim.get_population_index()) == len(initial_index) + 5
+
+
+def test_SimulationContext_branch(
+    SimulationContext: type[SimulationContext_], base_config: LayeredConfigTree
+) -> None:
+    bonus = HousePointsBonus()
+    components = [Hogwarts(), HogwartsResultsStratifier(), HousePointsObserver(), bonus]
+    sim = SimulationContext(base_config, components, configuration=HARRY_POTTER_CONFIG)
+    with pytest.raises(ConstraintError):
+        sim.branch({"house_points_bonus": {"points": 3}})
+    sim.setup()
+    sim.initialize_simulants()
+
+    with pytest.raises(ComponentConfigError, match="house_points.include"):
+        sim.branch({"stratification": {"house_points": {"include": ["familiar"]}}})
+    assert bonus.points == 0
+
+    sim.branch({"house_points_bonus": {"points": 3}})
+    assert bonus.points == bonus.configuration.points == 3
+    assert sim.configuration.house_points_bonus.points == 0
+    steps = sim.get_number_of_steps_remaining()
+    sim.run()
+    sim.finalize()
+    bonus_points = sim.get_results()["bonus_points"][VALUE_COLUMN].sum()
+    assert bonus_points == 3 * steps * sim.configuration.population.population_size
+
+
 def test_SimulationContext_finalize(
     SimulationContext: type[SimulationContext_],
     base_config: LayeredConfigTree,
@@ -408,19 +486,35 @@ def test_SimulationContext_report_write(
         assert results.equals(written_results)
 
 
+DISEASE_MODEL_BACKUP_CONFIG = {
+    "time": {"end": {"year": 2022, "month": 1, "day": 3}},
+    "population": {"population_size": 100},
+}
+
+
 def test_SimulationContext_write_backup(
-    mocker: MockerFixture, SimulationContext: type[SimulationContext_], tmp_path: Path
+    SimulationContext: type[SimulationContext_], tmp_path: Path
 ) -> None:
-    # TODO MIC-5216: Remove mocks when we can use dill in pytest.
-    mocker.patch("vivarium.framework.engine.dill.dump")
-    mocker.patch("vivarium.framework.engine.dill.load", return_value=SimulationContext())
-    sim = SimulationContext()
-    backup_path = tmp_path / "backup.pkl"
+    sim = SimulationContext(
+        get_model_specification_path(), configuration=DISEASE_MODEL_BACKUP_CONFIG
+    )
+    sim.setup()
+    sim.initialize_simulants()
+    sim.step()
+    backup_path = tmp_path / "backup"
     sim.write_backup(backup_path)
-    assert backup_path.exists()
-    with open(backup_path, "rb") as f:
-        sim_backup = dill.load(f)
-    assert isinstance(sim_backup, SimulationContext)
+
+    checkpoint = read_checkpoint(backup_path)
+    assert set(checkpoint.tables) == {"population", "clock", "randomness", "results"}
+    population = checkpoint.tables["population"]
+    for column in sim._population.private_columns:
+        pd.testing.assert_frame_equal(
+            population[f"column.{column}"], sim._population.private_columns[[column]]
+        )
+    assert checkpoint.tables["clock"]["clock"]["time"][0] == sim.current_time
+    assert checkpoint.model_specification["configuration"]["population"] == (
+        sim.configuration.population.to_dict()
+    )
 
 
 def test_SimulationContext_run_with_backup(
@@ -429,8 +523,12 @@ def test_SimulationContext_run_with_backup(
     base_config: LayeredConfigTree,
     tmp_path: Path,
 ) -> None:
-    mocked_write_backup = mocker.patch(
-        "vivarium.framework.engine.SimulationContext.write_backup"
+    mocked_write = mocker.patch("vivarium.framework.engine.write_checkpoint")
+    # Checkpoints are never deferred for a previous one that is still being written.
+    mocker.patch(
+        "vivarium.framework.engine.BackgroundWriter.is_full",
+        new_callable=mocker.PropertyMock,
+        return_value=False,
     )
     original_time = time()
 
@@ -449,11 +547,11 @@ def test_SimulationContext_run_with_backup(
         HogwartsResultsStratifier(),
     ]
     sim = SimulationContext(base_config, components, configuration=HARRY_POTTER_CONFIG)
-    backup_path = tmp_path / "backup.pkl"
+    backup_path = tmp_path / "backup"
     sim.setup()
     sim.initialize_simulants()
     sim.run(backup_path=backup_path, backup_freq=5)
-    assert mocked_write_backup.call_count == _get_num_steps(sim)
+    assert mocked_write.call_count == _get_num_steps(sim)
 
 
 def test_get_results_formatting(
@@ -515,19 +613,82 @@ def test_get_results_formatting(
 
 
 def test_SimulationContext_load_from_backup(
-    mocker: MockerFixture,
-    SimulationContext: type[SimulationContext_],
-    tmp_path: Path,
+    SimulationContext: type[SimulationContext_], tmp_path: Path
 ) -> None:
-    # TODO MIC-5216: Remove mocks when we can use dill in pytest.
-    mocker.patch("vivarium.framework.engine.dill.dump")
-    mocker.patch("vivarium.framework.engine.dill.load", return_value=SimulationContext())
-    sim = SimulationContext()
-    backup_path = tmp_path / "backup.pkl"
+    sim = SimulationContext(
+        get_model_specification_path(), configuration=DISEASE_MODEL_BACKUP_CONFIG
+    )
+    sim.setup()
+    sim.initialize_simulants()
+    sim.step()
+    backup_path = tmp_path / "backup"
     sim.write_backup(backup_path)
-    # Load from backup
+
     sim_backup = SimulationContext.load_from_backup(backup_path)
     assert isinstance(sim_backup, SimulationContext)
+    assert sim_backup.current_time == sim.current_time
+    pd.testing.assert_frame_equal(
+        sim_backup._population.private_columns, sim._population.private_columns
+    )
+
+    # The restored simulation continues exactly as the original does.
+    for simulation in [sim, sim_backup]:
+        simulation.run()
+        simulation.finalize()
+    pd.testing.assert_frame_equal(
+        sim_backup._population.private_columns, sim._population.private_columns
+    )
+    for measure, results in sim.get_results().items():
+        pd.testing.assert_frame_equal(sim_backup.get_results()[measure], results)
+
+
+def test_SimulationContext_load_from_backup_state_machine(
+    SimulationContext: type[SimulationContext_],
+    base_config: LayeredConfigTree,
+    tmp_path: Path,
+) -> None:
+    configuration = {
+        "time": {"step_size": 1},
+        "population": {"population_size": 100},
+        "randomness": {"key_columns": []},
+    }
+
+    def get_machine() -> Machine:
+        healthy = State("healthy", initialization_weights=1.0)
+        sick = State("sick", minimum_dwell_time=pd.Timedelta(days=2))
+        dead = State("dead", absorbing=True)
+        healthy.add_transition(
+            output_state=sick, probability_function=lambda index: pd.Series(0.5, index=index)
+        )
+        sick.add_transition(
+            output_state=healthy,
+            probability_function=lambda index: pd.Series(0.5, index=index),
+        )
+        sick.add_transition(
+            output_state=dead, probability_function=lambda index: pd.Series(0.25, index=index)
+        )
+        return Machine("condition", states=[healthy, sick, dead])
+
+    sim = SimulationContext(base_config, [get_machine()], configuration=configuration)
+    sim.setup()
+    sim.initialize_simulants()
+    sim.step()
+    backup_path = tmp_path / "backup"
+    sim.write_backup(backup_path)
+
+    sim_backup = SimulationContext.load_from_backup(backup_path, [get_machine()])
+    pd.testing.assert_frame_equal(
+        sim_backup._population.private_columns, sim._population.private_columns
+    )
+    # Simulants added after a restore are tracked like any other.
+    for simulation in [sim, sim_backup]:
+        simulation.simulant_creator(10, {"sim_state": "time_step"})
+        for _ in range(4):
+            simulation.step()
+    population = sim._population.private_columns
+    assert len(population) == 110
+    assert set(population["condition"]) == {"healthy", "sick", "dead"}
+    pd.testing.assert_frame_equal(sim_backup._population.private_columns, population)
 
 
 def test_private_columns_get_registered() -> None:
@@ -562,3 +723,58 @@ def _get_num_steps(sim: SimulationContext_) -> int:
     num_steps = math.ceil((end_date - start_date).days / time_dict["step_size"])
     assert isinstance(num_steps, int)
     return num_steps
+
+
+@pytest.mark.parametrize("enabled", [True, False])
+def test_SimulationContext_get_profiling_metrics(
+    SimulationContext: type[SimulationContext_], enabled: bool
+) -> None:
+    simulation = InteractiveContext(
+        get_model_specification_path(), configuration={"profiling": {"enabled": enabled}}
+    )
+    simulation.take_steps(2)
+    metrics = simulation.get_profiling_metrics()
+
+    assert list(metrics.columns) == [
+        "Type",
+        "Name",
+        "Calls",
+        "Total time (s)",
+        "Mean time (s)",
+    ]
+    if not enabled:
+        assert metrics.empty
+        return
+    assert set(metrics["Type"]) == {
+        "listener",
+        "pipeline",
+        "lookup_table",
+        "randomness_stream",
+    }
+    assert (metrics["Calls"] > 0).all()
+    assert metrics["Total time (s)"].is_monotonic_decreasing
+
+
+def test_SimulationContext_get_memory_metrics(
+    SimulationContext: type[SimulationContext_],
+) -> None:
+    tracemalloc.start()
+    try:
+        simulation = InteractiveContext(
+            get_model_specification_path(),
+            configuration={"population": {"population_size": 100}},
+        )
+        simulation.take_steps(2)
+    finally:
+        tracemalloc.stop()
+    metrics = simulation.get_memory_metrics()
+
+    assert list(metrics.columns) == ["Type", "Name", "Bytes"]
+    assert (metrics["Bytes"] > 0).all()
+    usage = metrics.groupby("Type")["Name"].apply(set)
+    assert usage["private_column"] == set(simulation._population.private_columns.columns)
+    assert usage["lookup_table"] == set(simulation._tables.tables)
+    assert usage["randomness"] == {"index_map"}
+    assert usage["results"] == {"dead", "ylls"}
+    assert "artifact_cache" not in usage
+    assert {lifecycle_states.SETUP, lifecycle_states.TIME_STEP} <= usage["lifecycle_peak"]
@@ -1,12 +1,18 @@
 from __future__ import annotations
 
+import threading
 from typing import Any, TypedDict
 
 import numpy as np
 import pandas as pd
 import pytest
+from layered_config_tree import LayeredConfigTree
 
+from vivarium import Component, InteractiveContext
+from vivarium.framework.engine import Builder
 from vivarium.framework.event import Event, EventManager
+from vivarium.framework.lifecycle import Profiler, lifecycle_states
+from vivarium.framework.population import SimulantData
 
 
 class EventData(TypedDict):
@@ -144,3 +150,162 @@ def test_list_events() -> None:
     manager.register_listener("event3", event3_listener)
     _ = manager.get_listeners("event4")
     assert manager.list_events() == ["event1", "event2", "event3", "event4"]
+
+
+class ColumnAccessor(Component):
+    def __init__(self, name: str, reads: list[str] | None, writes: list[str] | None) -> None:
+        super().__init__()
+        self._name = name
+        self.reads = reads
+        self.writes = writes
+        self.barrier: threading.Barrier | None = None
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def listener_reads(self) -> list[str] | None:
+        return self.reads
+
+    @property
+    def listener_writes(self) -> list[str] | None:
+        return self.writes
+
+    def on_time_step(self, event: Event) -> None:
+        if self.barrier is not None:
+            # Only passes if the other listeners are run at the same time.
+            self.barrier.wait()
+
+
+def _get_parallel_manager() -> EventManager:
+    manager = EventManager()
+    manager.clock = lambda: pd.Timestamp(1990, 1, 1)
+    manager.step_size = lambda: pd.Timedelta(30, "D")
+    manager.add_constraint = lambda f, **kwargs: f
+    manager.add_handlers = lambda state, handlers: None
+
+    # Attribute "x_doubled" is produced from private column "x".
+    manager._get_columns_read = lambda attributes: {
+        attribute.removesuffix("_doubled") for attribute in attributes
+    }
+    manager._parallel_listeners = True
+    manager._profiler = Profiler()
+    return manager
+
+
+def test_listener_stages() -> None:
+    writes_a = ColumnAccessor("writes_a", reads=[], writes=["a"])
+    reads_a = ColumnAccessor("reads_a", reads=["a_doubled"], writes=["b"])
+    writes_c = ColumnAccessor("writes_c", reads=["b"], writes=["c"])
+    reads_nothing = ColumnAccessor("reads_nothing", reads=[], writes=[])
+    undeclared_reads = ColumnAccessor("undeclared_reads", reads=None, writes=["d"])
+
+    def unknown_access(event: Event) -> None:
+        pass
+
+    manager = _get_parallel_manager()
+    for listener in [writes_a, reads_a, writes_c, reads_nothing, undeclared_reads]:
+        manager.register_listener(lifecycle_states.TIME_STEP, listener.on_time_step)
+    manager.register_listener(lifecycle_states.TIME_STEP, unknown_access)
+    manager.register_listener(lifecycle_states.TIME_STEP, reads_a.on_time_step, priority=6)
+    manager.on_post_setup(Event("post_setup", pd.Index([]), {}, 0, 1))
+
+    channel = manager.get_channel(lifecycle_states.TIME_STEP)
+    assert channel.parallel
+    assert not manager.get_channel(lifecycle_states.POST_SETUP).parallel
+    assert manager.get_listener_stages(channel) == [
+        [writes_a.on_time_step, writes_c.on_time_step, reads_nothing.on_time_step],
+        [reads_a.on_time_step],
+        [undeclared_reads.on_time_step],
+        [unknown_access],
+        [reads_a.on_time_step],
+    ]
+
+
+def test_parallel_emission() -> None:
+    barrier = threading.Barrier(3, timeout=10)
+    accessors = [ColumnAccessor(f"writes_{i}", [], [str(i)]) for i in range(3)]
+    manager = _get_parallel_manager()
+    for accessor in accessors:
+        accessor.barrier = barrier
+        manager.register_listener(lifecycle_states.TIME_STEP, accessor.on_time_step)
+    manager.on_post_setup(Event("post_setup", pd.Index([]), {}, 0, 1))
+
+    emitter = manager.get_emitter(lifecycle_states.TIME_STEP)
+    emitter(pd.Index(range(10)), None)
+    assert not barrier.broken
+
+    manager.on_simulation_end(Event("simulation_end", pd.Index([]), {}, 0, 1))
+    assert manager._executor is None
+
+
+class FailingAccessor(ColumnAccessor):
+    def on_time_step(self, event: Event) -> None:
+        raise ValueError("listener failed")
+
+
+def test_parallel_emission_raises_listener_errors() -> None:
+    manager = _get_parallel_manager()
+    for accessor in [
+        ColumnAccessor("writes_a", [], ["a"]),
+        FailingAccessor("writes_b", [], ["b"]),
+    ]:
+        manager.register_listener(lifecycle_states.TIME_STEP, accessor.on_time_step)
+    manager.on_post_setup(Event("post_setup", pd.Index([]), {}, 0, 1))
+    assert (
+        len(manager.get_listener_stages(manager.get_channel(lifecycle_states.TIME_STEP))) == 1
+    )
+
+    emitter = manager.get_emitter(lifecycle_states.TIME_STEP)
+    with pytest.raises(ValueError, match="listener failed"):
+        emitter(pd.Index(range(10)), None)
+
+
+class Counter(Component):
+    def __init__(self, column: str) -> None:
+        super().__init__()
+        self.column = column
+
+    @property
+    def name(self) -> str:
+        return f"counter_{self.column}"
+
+    @property
+    def listener_reads(self) -> list[str]:
+        return []
+
+    @property
+    def listener_writes(self) -> list[str]:
+        return [self.column]
+
+    def setup(self, builder: Builder) -> None:
+        self.randomness = builder.randomness.get_stream(self.column)
+        builder.population.register_initializer(
+            self.initialize_count, self.column, required_resources=[self.randomness]
+        )
+
+    def initialize_count(self, pop_data: SimulantData) -> None:
+        self.population_view.initialize(pd.Series(0, index=pop_data.index, name=self.column))
+
+    def on_time_step(self, event: Event) -> None:
+        increment = self.randomness.get_draw(event.index) < 0.5
+        self.population_view.update(self.column, lambda count: count + increment.astype(int))
+
+
+def test_parallel_listeners_match_sequential_listeners(
+    base_config: LayeredConfigTree,
+) -> None:
+    populations = []
+    for parallel_listeners in [False, True]:
+        configuration = base_config.to_dict()
+        configuration["event"] = {"parallel_listeners": parallel_listeners}
+        configuration["randomness"]["key_columns"] = []
+        simulation = InteractiveContext(
+            components=[Counter(column) for column in "abcd"], configuration=configuration
+        )
+        simulation.take_steps(3)
+        populations.append(simulation.get_population(list("abcd")))
+
+    assert (populations[0] > 0).any().all()
+    pd.testing.assert_frame_equal(populations[0], populations[1])
@@ -1,3 +1,5 @@
+import tracemalloc
+
 import pandas as pd
 import pytest
 
@@ -6,6 +8,7 @@ from vivarium.framework.lifecycle.entities import LifeCycle, LifeCyclePhase, Lif
 from vivarium.framework.lifecycle.exceptions import ConstraintError, LifeCycleError
 from vivarium.framework.lifecycle.lifecycle_states import INITIALIZATION
 from vivarium.framework.lifecycle.manager import LifeCycleManager
+from vivarium.framework.lifecycle.profiler import Profiler
 
 
 def test_state_add_next() -> None:
@@ -340,6 +343,27 @@ def test_lifecycle_manager_set_state_with_loop() -> None:
         lm.set_state("c")  # phase 2 does not permit loops
 
 
+def test_lifecycle_manager_peak_memory() -> None:
+    lm = LifeCycleManager()
+    lm.add_phase("phase1", ["a", "b"], loop=True)
+    lm.set_state("a")
+    # Peaks are only recorded while tracing.
+    assert lm.peak_memory == {}
+
+    tracemalloc.start()
+    try:
+        lm.set_state("b")
+        data = bytearray(10_000_000)
+        del data
+        lm.set_state("a")
+        lm.set_state("b")
+    finally:
+        tracemalloc.stop()
+    assert list(lm.peak_memory) == ["a", "b"]
+    # The allocation only counts toward the state it was made in.
+    assert lm.peak_memory["b"] >= 10_000_000 > lm.peak_memory["a"]
+
+
 def test_lifecycle_manager_add_handlers() -> None:
     lm = LifeCycleManager()
     lm.add_phase("phase1", ["a"])
@@ -432,3 +456,28 @@ def test_lifecycle_manager_add_constraint() -> None:
     lm.set_state("a")
     alice.buzz(useless_event)
     bob.buzz(useless_event)
+
+
+def test_profiler() -> None:
+    def add(a: int, b: int) -> int:
+        return a + b
+
+    profiler = Profiler()
+    assert profiler.wrap("function", "add", add) is add
+    assert profiler.to_frame().empty
+
+    profiler.enabled = True
+    timed_add = profiler.wrap("function", "add", add)
+    assert timed_add is not add
+    assert timed_add(1, 2) == 3
+    assert timed_add(3, 4) == 7
+
+    manager = LifeCycleManager()
+    timed_repr = profiler.wrap("method", Profiler.get_name(manager.add_phase), repr)
+    timed_repr(manager)
+
+    profile = profiler.to_frame().set_index("Name")
+    assert profile.loc["add", "Type"] == "function"
+    assert profile.loc["add", "Calls"] == 2
+    assert profile.loc["life_cycle_manager.add_phase", "Calls"] == 1
+    assert (profile["Total time (s)"] >= profile["Mean time (s)"]).all()
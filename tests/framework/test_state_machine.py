@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from typing import Any
+
 import numpy as np
 import pandas as pd
 import pytest
@@ -10,8 +12,8 @@ from tests.helpers import ColumnCreator
 from vivarium import InteractiveContext
 from vivarium.framework.configuration import build_simulation_configuration
 from vivarium.framework.engine import Builder
-from vivarium.framework.population import SimulantData
-from vivarium.framework.state_machine import Machine, State, Transition
+from vivarium.framework.population import PopulationView, SimulantData
+from vivarium.framework.state_machine import Machine, State, Transition, TransitionMatrix
 from vivarium.types import ClockTime, DataInput
 
 
@@ -244,3 +246,313 @@ def test_side_effects() -> None:
     # transitioning to counting state again
     simulation.step()
     assert np.all(simulation.get_population("count") == 2)
+
+
+def test_transition_groups_effects_by_output_state(base_config: LayeredConfigTree) -> None:
+    base_config.update(
+        {"population": {"population_size": 1000}, "randomness": {"key_columns": []}}
+    )
+
+    class RecordingState(State):
+        def __init__(self, state_id: str) -> None:
+            super().__init__(state_id)
+            self.effect_sizes: list[int] = []
+
+        def transition_side_effect(self, index: pd.Index[int], _: ClockTime) -> None:
+            self.effect_sizes.append(len(index))
+
+    done_state = RecordingState("done")
+    a_state = State("a", allow_self_transition=False, initialization_weights=0.5)
+    b_state = State("b", allow_self_transition=False, initialization_weights=0.5)
+    a_state.add_transition(output_state=done_state)
+    b_state.add_transition(output_state=done_state)
+    machine = Machine("state", states=[a_state, b_state, done_state])
+
+    simulation = InteractiveContext(components=[machine], configuration=base_config)
+    assert set(simulation.get_population("state")) == {"a", "b"}
+    simulation.step()
+
+    assert np.all(simulation.get_population("state") == "done")
+    assert done_state.effect_sizes == [1000]
+
+
+@pytest.mark.parametrize("sparse_transitions", [False, True])
+def test_transition_with_dependent_machines(
+    base_config: LayeredConfigTree, sparse_transitions: bool
+) -> None:
+    base_config.update(
+        {"population": {"population_size": 1000}, "randomness": {"key_columns": []}}
+    )
+    unexposed = State("unexposed", initialization_weights=1.0)
+    exposed = State("exposed")
+    susceptible = State("susceptible", initialization_weights=1.0)
+    infected = State("infected")
+    exposure = Machine(
+        "exposure", states=[unexposed, exposed], sparse_transitions=sparse_transitions
+    )
+    infection = Machine(
+        "infection", states=[susceptible, infected], sparse_transitions=sparse_transitions
+    )
+    # Each machine's transition probabilities depend on the other's state.
+    unexposed.add_transition(
+        output_state=exposed, probability_function=lambda index: pd.Series(0.5, index=index)
+    )
+    exposed.add_transition(
+        output_state=unexposed,
+        probability_function=lambda index: (
+            infection.population_view.get(index, "infection") == "infected"
+        ).astype(float),
+    )
+    susceptible.add_transition(
+        output_state=infected,
+        probability_function=lambda index: (
+            exposure.population_view.get(index, "exposure") == "exposed"
+        ).astype(float),
+    )
+
+    simulation = InteractiveContext(
+        components=[exposure, infection], configuration=base_config
+    )
+    simulation.step()
+    first = simulation.get_population(["exposure", "infection"])
+    # The infection machine sees the exposures from earlier in the same step.
+    assert 0 < (first["exposure"] == "exposed").sum() < 1000
+    assert ((first["exposure"] == "exposed") == (first["infection"] == "infected")).all()
+
+    simulation.step()
+    second = simulation.get_population(["exposure", "infection"])
+    previously_infected = first["infection"] == "infected"
+    assert (second.loc[previously_infected, "exposure"] == "unexposed").all()
+    newly_exposed = ~previously_infected & (second["exposure"] == "exposed")
+    assert newly_exposed.any()
+    assert (
+        (second["infection"] == "infected") == (previously_infected | newly_exposed)
+    ).all()
+
+
+@pytest.mark.parametrize("sequential_transitions", [False, True])
+def test_transition_depending_on_own_effects(
+    base_config: LayeredConfigTree, sequential_transitions: bool
+) -> None:
+    base_config.update(
+        {"population": {"population_size": 100}, "randomness": {"key_columns": []}}
+    )
+    a = State("a", allow_self_transition=False, initialization_weights=0.5)
+    b = State("b", initialization_weights=0.5)
+    machine = Machine("state", states=[a, b], sequential_transitions=sequential_transitions)
+    a.add_transition(output_state=b)
+    # Simulants only leave b once nobody in the population is left in a.
+    b.add_transition(
+        output_state=a,
+        probability_function=lambda index: pd.Series(
+            float(
+                not (machine.population_view.get(pd.RangeIndex(100), "state") == "a").any()
+            ),
+            index=index,
+        ),
+    )
+
+    simulation = InteractiveContext(components=[machine], configuration=base_config)
+    start = simulation.get_population("state").to_numpy()
+    assert 0 < (start == "a").sum() < 100
+    simulation.step()
+    end = simulation.get_population("state").to_numpy()
+    if sequential_transitions:
+        # b's simulants are moved after a's, once a is empty.
+        assert (end[start == "b"] == "a").all()
+    else:
+        assert (end == "b").all()
+    assert (end[start == "a"] == "b").all()
+
+
+def test_sparse_sequential_transitions() -> None:
+    with pytest.raises(ValueError, match="both sparse and sequential"):
+        Machine("state", sparse_transitions=True, sequential_transitions=True)
+
+
+@pytest.mark.parametrize("sparse_transitions", [False, True])
+def test_transition_with_overridden_next_state(
+    base_config: LayeredConfigTree, sparse_transitions: bool
+) -> None:
+    base_config.update(
+        {"population": {"population_size": 100}, "randomness": {"key_columns": []}}
+    )
+
+    class StickyState(State):
+        def next_state(
+            self, index: pd.Index[int], event_time: ClockTime, population_view: PopulationView
+        ) -> None:
+            pass
+
+    done_state = State("done")
+    sticky_state = StickyState("sticky", initialization_weights=0.5)
+    start_state = State("start", allow_self_transition=False, initialization_weights=0.5)
+    start_state.add_transition(output_state=done_state)
+    sticky_state.add_transition(output_state=done_state)
+    machine = Machine(
+        "state",
+        states=[start_state, sticky_state, done_state],
+        sparse_transitions=sparse_transitions,
+    )
+
+    simulation = InteractiveContext(components=[machine], configuration=base_config)
+    initial = simulation.get_population("state")
+    simulation.step()
+    state = simulation.get_population("state")
+    assert isinstance(initial, pd.Series) and isinstance(state, pd.Series)
+
+    assert np.all(state[initial == "start"] == "done")
+    assert np.all(state[initial == "sticky"] == "sticky")
+
+
+def _build_cascade(sparse_transitions: bool) -> Machine:
+    healthy = State("healthy", initialization_weights=0.6)
+    mild = State("mild", initialization_weights=0.3)
+    severe = State("severe", initialization_weights=0.1)
+    dead = State("dead")
+    healthy.add_transition(
+        output_state=mild, probability_function=lambda index: pd.Series(0.2, index=index)
+    )
+    mild.add_transition(
+        output_state=healthy, probability_function=lambda index: pd.Series(0.3, index=index)
+    )
+    mild.add_transition(
+        output_state=severe, probability_function=lambda index: pd.Series(0.1, index=index)
+    )
+    severe.add_transition(
+        output_state=dead, probability_function=lambda index: pd.Series(0.25, index=index)
+    )
+    return Machine(
+        "state",
+        states=[healthy, mild, severe, dead],
+        sparse_transitions=sparse_transitions,
+    )
+
+
+def test_transition_matrix() -> None:
+    machine = _build_cascade(sparse_transitions=True)
+    matrix = TransitionMatrix(machine.states)
+
+    assert matrix.nnz == 4
+    assert matrix.indptr.tolist() == [0, 1, 3, 4, 4]
+    assert matrix.indices.tolist() == [1, 0, 2, 3]
+    assert matrix.to_sparse().toarray().tolist() == [
+        [0, 1, 0, 0],
+        [1, 0, 1, 0],
+        [0, 0, 0, 1],
+        [0, 0, 0, 0],
+    ]
+
+
+def test_transition_matrix_rejects_unknown_output_state() -> None:
+    start_state = State("start")
+    start_state.add_transition(output_state=State("elsewhere"))
+    with pytest.raises(ValueError, match="not one of the states"):
+        TransitionMatrix([start_state])
+
+
+def test_sparse_transitions_match_transition_sets(base_config: LayeredConfigTree) -> None:
+    base_config.update(
+        {"population": {"population_size": 1000}, "randomness": {"key_columns": []}}
+    )
+    results: list[pd.Series[Any]] = []
+    for sparse_transitions in [False, True]:
+        machine = _build_cascade(sparse_transitions)
+        simulation = InteractiveContext(components=[machine], configuration=base_config)
+        assert (machine.transition_matrix is not None) == sparse_transitions
+        simulation.take_steps(5)
+        state = simulation.get_population("state")
+        assert isinstance(state, pd.Series)
+        results.append(state)
+
+    assert set(results[0]) == {"healthy", "mild", "severe", "dead"}
+    pd.testing.assert_series_equal(results[0], results[1])
+
+
+def test_absorbing_state_validation() -> None:
+    with pytest.raises(ValueError, match="cannot be absorbing and have a minimum dwell"):
+        State("dead", absorbing=True, minimum_dwell_time=pd.Timedelta(days=1))
+
+    dead_state = State("dead", absorbing=True)
+    assert dead_state.is_absorbing
+    with pytest.raises(ValueError, match="absorbing state 'dead'"):
+        dead_state.add_transition(output_state=State("alive"))
+
+
+def test_absorbing_state_is_skipped(
+    base_config: LayeredConfigTree, mocker: MockerFixture
+) -> None:
+    base_config.update(
+        {"population": {"population_size": 1000}, "randomness": {"key_columns": []}}
+    )
+    dead_state = State("dead", absorbing=True)
+    alive_state = State("alive", initialization_weights=0.5)
+    alive_state.add_transition(
+        output_state=dead_state,
+        probability_function=lambda index: pd.Series(0.5, index=index),
+    )
+    machine = Machine("state", states=[alive_state, dead_state])
+    simulation = InteractiveContext(components=[machine], configuration=base_config)
+    choose_transitions = mocker.spy(machine, "_choose_transitions_from_sets")
+
+    for _ in range(3):
+        state = simulation.get_population("state")
+        assert isinstance(state, pd.Series)
+        alive = state == "alive"
+        simulation.step()
+        transitioned_index = choose_transitions.call_args.args[0]
+        assert transitioned_index.equals(alive[alive].index)
+
+    state = simulation.get_population("state")
+    assert round((state == "alive").mean(), 1) == 0.1
+
+
+def test_eligible_time_column_covers_new_simulants(
+    base_config: LayeredConfigTree,
+) -> None:
+    base_config.update(
+        {"population": {"population_size": 100}, "randomness": {"key_columns": []}}
+    )
+    dead_state = State("dead", absorbing=True)
+    alive_state = State("alive", initialization_weights=0.5)
+    alive_state.add_transition(output_state=dead_state)
+    machine = Machine("state", states=[alive_state, dead_state])
+    simulation = InteractiveContext(components=[machine], configuration=base_config)
+    assert machine.eligible_time_column in machine.population_view.private_columns
+
+    simulation.step()
+    simulation.simulant_creator(10, {"sim_state": "time_step"})
+    simulation.step()
+
+    population = simulation.get_population(["state", machine.eligible_time_column])
+    assert len(population) == 110
+    assert (population["state"] == "dead").all()
+    # Absorbed simulants can never transition again.
+    assert population[machine.eligible_time_column].isna().all()
+
+
+@pytest.mark.parametrize("sparse_transitions", [False, True])
+def test_minimum_dwell_time(base_config: LayeredConfigTree, sparse_transitions: bool) -> None:
+    base_config.update(
+        {"population": {"population_size": 10}, "randomness": {"key_columns": []}}
+    )
+    step_size = pd.Timedelta(days=base_config.time.step_size)
+    a_state = State("a", allow_self_transition=False)
+    b_state = State("b", allow_self_transition=False, minimum_dwell_time=2 * step_size)
+    a_state.add_transition(output_state=b_state)
+    b_state.add_transition(output_state=a_state)
+    machine = Machine(
+        "state",
+        states=[a_state, b_state],
+        initial_state=a_state,
+        sparse_transitions=sparse_transitions,
+    )
+    simulation = InteractiveContext(components=[machine], configuration=base_config)
+
+    observed = []
+    for _ in range(5):
+        simulation.step()
+        states = simulation.get_population("state")
+        assert states.nunique() == 1
+        observed.append(states.iloc[0])
+    assert observed == ["b", "b", "a", "b", "b"]
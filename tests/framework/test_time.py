@@ -14,7 +14,11 @@ from tests.helpers import Listener, MockComponentA, MockComponentB, MockGenericC
 from vivarium.component import Component
 from vivarium.framework.engine import Builder, SimulationContext
 from vivarium.framework.event import Event
-from vivarium.framework.time.manager import SimulationClock, get_time_stamp
+from vivarium.framework.time.manager import (
+    EventTimeQueue,
+    SimulationClock,
+    get_time_stamp,
+)
 from vivarium.framework.utilities import from_yearly
 from vivarium.framework.values import ValuesManager, rescale_post_processor
 from vivarium.types import ClockStepSize
@@ -482,6 +486,87 @@ def test_move_simulants_to_end(base_config: LayeredConfigTree) -> None:
         assert step_modifier_component.ts_pipeline_value.index.equals(odds)
 
 
+def test_restore_uneven_steps(base_config: LayeredConfigTree) -> None:
+    """Ensure that a simulation restored from a checkpoint keeps stepping to
+    the same simulants' next event times."""
+
+    def make_sim() -> SimulationContext:
+        sim = SimulationContext(
+            base_config, [StepModifier("step_modifier", 3, 7), Listener("listener")]
+        )
+        sim.setup()
+        return sim
+
+    sim = make_sim()
+    sim.initialize_simulants()
+    for _ in range(2):
+        sim.step()
+    restored = make_sim()
+    restored.restore(sim.get_checkpoint())
+    assert restored._clock.time == sim._clock.time
+
+    for correct_step_size in [1, 2, 3, 2, 1, 3, 3]:
+        for simulation in [sim, restored]:
+            assert take_step(simulation) == pd.Timedelta(days=correct_step_size)
+        assert restored._clock._individual_clocks is not None
+        assert sim._clock._individual_clocks is not None
+        pd.testing.assert_frame_equal(
+            restored._clock._individual_clocks, sim._clock._individual_clocks
+        )
+
+
+def test_event_time_queue() -> None:
+    origin = pd.Timestamp("2020-01-01")
+    queue = EventTimeQueue(origin, pd.Timedelta(days=1))
+    next_event_times = pd.Series(
+        origin + pd.to_timedelta([1, 3, 1, 2, 3.5], unit="D"), index=range(5)
+    )
+
+    def get_times(index: pd.Index[int]) -> pd.Series[pd.Timestamp]:
+        return next_event_times.loc[index]
+
+    queue.push(next_event_times.index, next_event_times)
+
+    assert len(queue) == 5
+    assert queue.next_time(get_times) == origin + pd.Timedelta(days=1)
+    assert queue.due(origin, get_times).empty
+    assert queue.due(origin + pd.Timedelta(days=1), get_times).equals(pd.Index([0, 2]))
+    # Finding due simulants doesn't remove them unless asked to
+    assert queue.due(origin + pd.Timedelta(days=1), get_times).equals(pd.Index([0, 2]))
+    assert queue.due(origin + pd.Timedelta(days=3), get_times).equals(pd.Index([0, 1, 2, 3]))
+
+    # Simulants whose event times change without being rescheduled are
+    # moved to the right bucket when they are found
+    next_event_times.loc[[0, 2]] = origin + pd.Timedelta(days=5)
+    due = queue.due(origin + pd.Timedelta(days=2), get_times, remove=True)
+    assert due.equals(pd.Index([3]))
+    assert len(queue) == 4
+    assert queue.next_time(get_times) == origin + pd.Timedelta(days=3)
+    assert queue.due(origin + pd.Timedelta(days=10), get_times).equals(pd.Index([0, 1, 2, 4]))
+
+
+@pytest.mark.parametrize("step_modifier_even,step_modifier_odd", [(3, 7), (4.5, 2)])
+def test_event_time_queue_matches_next_event_times(
+    base_config: LayeredConfigTree, step_modifier_even: float, step_modifier_odd: float
+) -> None:
+    step_modifier_component = StepModifierWithMovement(
+        "step_modifier", step_modifier_even, step_modifier_odd
+    )
+    sim = SimulationContext(base_config, [step_modifier_component])
+    sim.setup()
+    sim.initialize_simulants()
+    assert sim._clock._event_queue is not None
+
+    full_pop_index = get_full_pop_index(sim)
+    for _ in range(10):
+        next_event_times = sim._clock.simulant_next_event_times(full_pop_index)
+        expected = next_event_times[next_event_times <= sim._clock.event_time].index
+        active = sim._clock.get_active_simulants(full_pop_index, sim._clock.event_time)
+        assert active.equals(expected)
+        assert sim._clock.event_time == next_event_times.min()
+        sim.step()
+
+
 def test_step_size_post_processor(builder: MagicMock) -> None:
     """Test that step size post-processor chooses the minimum modified step, or minimum global step,
     whichever is larger."""
@@ -512,6 +597,28 @@ def test_step_size_post_processor(builder: MagicMock) -> None:
     assert np.all(value == pd.Timedelta(days=2))
 
 
+def test_step_size_modifiers_for_part_of_the_population(builder: MagicMock) -> None:
+    """Test that simulants without a modified step size get the standard step size."""
+    index = pd.Index(range(10))
+    clock = SimulationClock()
+    clock._minimum_step_size = pd.Timedelta(days=1)
+    clock._standard_step_size = pd.Timedelta(days=3)
+    clock.setup(builder)
+
+    clock.register_step_modifier(
+        lambda idx: pd.Series(pd.Timedelta(days=5), index=idx[idx % 2 == 0])
+    )
+    clock.register_step_modifier(
+        lambda idx: pd.Series(pd.Timedelta(days=2), index=idx[idx < 4])
+    )
+    value = clock._step_size_pipeline(index)
+
+    expected = pd.Series(pd.Timedelta(days=3), index=index)
+    expected[index % 2 == 0] = pd.Timedelta(days=5)
+    expected[index < 4] = pd.Timedelta(days=2)
+    assert value.equals(expected)
+
+
 @pytest.mark.parametrize("end_day", [31, 23])
 def test_time_steps_remaining(base_config: LayeredConfigTree, end_day: int) -> None:
     UselessComponent = MockGenericComponent("Placeholder")
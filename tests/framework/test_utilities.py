@@ -7,6 +7,7 @@ import pytest
 from vivarium.framework.utilities import (
     collapse_nested_dict,
     from_yearly,
+    get_nbytes,
     handle_exceptions,
     import_by_path,
     probability_to_rate,
@@ -167,3 +168,17 @@ def test_rate_to_probability_clipped(
     else:
         assert (prob == pd.Series([1.0, 1.0, 0.5, 0.25])).all()
     assert "The probability has been clipped to 1.0" in caplog.text
+
+
+def test_get_nbytes() -> None:
+    data = pd.DataFrame({"a": np.arange(10, dtype=np.int64), "b": np.ones(10)})
+    assert get_nbytes(data) == data.memory_usage(deep=True).sum()
+    assert get_nbytes(data["a"]) == data["a"].memory_usage(deep=True)
+    assert get_nbytes(data["a"].to_numpy()) == 80
+    assert get_nbytes({"x": data, "y": [data["a"], data["b"]]}) == (
+        get_nbytes("x")
+        + get_nbytes(data)
+        + get_nbytes("y")
+        + get_nbytes(data["a"])
+        + get_nbytes(data["b"])
+    )
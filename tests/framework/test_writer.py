@@ -0,0 +1,65 @@
+import threading
+
+import pytest
+
+from vivarium.framework.writer import BackgroundWriter
+
+
+def test_background_writer() -> None:
+    written: list[int] = []
+    with BackgroundWriter() as writer:
+        for i in range(5):
+            writer.submit(written.append, i)
+    assert written == list(range(5))
+
+
+def test_background_writer_back_pressure() -> None:
+    release = threading.Event()
+    started = threading.Event()
+
+    def blocked_write() -> None:
+        started.set()
+        release.wait()
+
+    writer = BackgroundWriter(max_pending=2)
+    writer.submit(blocked_write)
+    started.wait()
+    assert not writer.is_full
+    writer.submit(lambda: None)
+    assert writer.is_full
+
+    submitted = threading.Event()
+
+    def submit() -> None:
+        writer.submit(lambda: None)
+        submitted.set()
+
+    thread = threading.Thread(target=submit)
+    thread.start()
+    # The third write waits for a pending write to finish.
+    assert not submitted.wait(0.1)
+    release.set()
+    assert submitted.wait(5)
+    thread.join()
+    writer.close()
+    assert not writer.is_full
+
+
+def test_background_writer_error() -> None:
+    def failing_write() -> None:
+        raise OSError("disk full")
+
+    writer = BackgroundWriter()
+    writer.submit(failing_write)
+    with pytest.raises(OSError, match="disk full"):
+        writer.wait()
+    # Each error is raised once.
+    writer.wait()
+    writer.submit(failing_write)
+    with pytest.raises(OSError, match="disk full"):
+        writer.close()
+
+
+def test_background_writer_invalid() -> None:
+    with pytest.raises(ValueError, match="at least one"):
+        BackgroundWriter(max_pending=0)
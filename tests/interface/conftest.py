@@ -0,0 +1,28 @@
+from pathlib import Path
+
+import pytest
+import yaml
+from layered_config_tree import LayeredConfigTree
+
+from tests.framework.results.helpers import HARRY_POTTER_CONFIG
+
+
+@pytest.fixture
+def model_spec(base_config: LayeredConfigTree, tmp_path: Path) -> str:
+    base_config.update(HARRY_POTTER_CONFIG)
+    model_spec = {}
+    model_spec["configuration"] = base_config.to_dict()
+    model_spec["components"] = {
+        "tests.framework.results.helpers": [
+            "Hogwarts()",
+            "HousePointsObserver()",
+            "NoStratificationsQuidditchWinsObserver()",
+            "QuidditchWinsObserver()",
+            "HogwartsResultsStratifier()",
+        ],
+    }
+    (tmp_path / "model_spec").mkdir()
+    filepath = tmp_path / "model_spec" / "model_spec.yaml"
+    with open(filepath, "w") as f:
+        yaml.dump(model_spec, f)
+    return str(filepath)
@@ -0,0 +1,120 @@
+import tempfile
+from pathlib import Path
+
+import pandas as pd
+import pytest
+from layered_config_tree import LayeredConfigTree
+from pytest_mock import MockerFixture
+
+from tests.framework.results.helpers import (
+    HARRY_POTTER_CONFIG,
+    Hogwarts,
+    HogwartsResultsStratifier,
+    HousePointsBonus,
+    HousePointsObserver,
+)
+from vivarium import InteractiveContext
+from vivarium.interface.batch import get_run_configurations, run_batch, run_branches
+
+
+def test_get_run_configurations() -> None:
+    assert get_run_configurations() == [{}]
+
+    grid = {"input_data.input_draw_number": [0, 1], "randomness.random_seed": [2, 3]}
+    branches = [
+        {"intervention": {"coverage": 0.0}},
+        {"intervention": {"coverage": 0.5, "start": 2020}},
+    ]
+    run_configurations = get_run_configurations(grid, branches)
+    assert len(run_configurations) == 8
+    assert run_configurations[0] == {
+        "input_data.input_draw_number": 0,
+        "randomness.random_seed": 2,
+        "intervention.coverage": 0.0,
+        "intervention.start": None,
+    }
+    assert run_configurations[-1] == {
+        "input_data.input_draw_number": 1,
+        "randomness.random_seed": 3,
+        "intervention.coverage": 0.5,
+        "intervention.start": 2020,
+    }
+
+    with pytest.raises(ValueError, match="in both the grid and branches"):
+        get_run_configurations(grid, [{"randomness": {"random_seed": 4}}])
+
+
+def test_run_batch(
+    model_spec: str, hdf_file_path: Path, tmp_path: Path, mocker: MockerFixture
+) -> None:
+    mkdtemp_spy = mocker.spy(tempfile, "mkdtemp")
+    runs = run_batch(
+        model_spec,
+        tmp_path / "results",
+        grid={"randomness.random_seed": [0, 1]},
+        branches=[{"time": {"end": {"year": 2026}}}, {"time": {"end": {"year": 2027}}}],
+        configuration={"input_data": {"artifact_path": str(hdf_file_path)}},
+        max_workers=2,
+    )
+    assert list(runs["run_id"]) == [0, 1, 2, 3]
+    assert runs["error"].isna().all()
+    pd.testing.assert_frame_equal(
+        pd.read_parquet(tmp_path / "results" / "runs.parquet"), runs
+    )
+
+    quidditch_wins = pd.read_parquet(tmp_path / "results" / "results" / "quidditch_wins")
+    runs_with_results = quidditch_wins[["randomness.random_seed", "time.end.year"]]
+    assert len(runs_with_results.drop_duplicates()) == 4
+
+    mkdtemp_spy.assert_called_once()
+    assert not Path(mkdtemp_spy.spy_return).exists()
+
+
+def test_run_batch_failures(model_spec: str, hdf_file_path: Path, tmp_path: Path) -> None:
+    artifact_paths = [str(hdf_file_path), str(tmp_path / "missing.hdf")]
+    runs = run_batch(
+        model_spec,
+        tmp_path / "results",
+        grid={"input_data.artifact_path": artifact_paths},
+        max_workers=1,
+    )
+    assert runs["error"].isna().tolist() == [True, False]
+    assert "FileNotFoundError" in runs["error"].iloc[1]
+    house_points = pd.read_parquet(tmp_path / "results" / "results" / "house_points")
+    assert set(house_points["input_data.artifact_path"]) == {str(hdf_file_path)}
+
+
+@pytest.mark.parametrize("backend", ["memory", "memmap"])
+def test_run_branches(base_config: LayeredConfigTree, tmp_path: Path, backend: str) -> None:
+    storage = {"backend": backend, "scratch_directory": str(tmp_path / "scratch")}
+    bonus = HousePointsBonus()
+    components = [Hogwarts(), HogwartsResultsStratifier(), HousePointsObserver(), bonus]
+    sim = InteractiveContext(
+        base_config,
+        components,
+        configuration={**HARRY_POTTER_CONFIG, "population": {"storage": storage}},
+    )
+    start_time = sim.current_time
+    start_population = sim._population.private_columns
+
+    runs = run_branches(
+        sim,
+        tmp_path / "results",
+        branches=[
+            {"house_points_bonus": {"points": 1}},
+            {"house_points_bonus": {"points": 2}},
+        ],
+        max_workers=2,
+    )
+    assert runs["error"].isna().all()
+
+    bonus_points = pd.read_parquet(tmp_path / "results" / "results" / "bonus_points")
+    totals = bonus_points.groupby("house_points_bonus.points", observed=True)["value"].sum()
+    assert totals.loc[2] == 2 * totals.loc[1] > 0
+    house_points = pd.read_parquet(tmp_path / "results" / "results" / "house_points")
+    assert house_points.groupby("house_points_bonus.points", observed=True).ngroups == 2
+
+    # The simulation in this process is untouched.
+    assert bonus.points == 0
+    assert sim.current_time == start_time
+    pd.testing.assert_frame_equal(sim._population.private_columns, start_population)
@@ -1,11 +1,11 @@
+import json
 from pathlib import Path
 
+import pandas as pd
 import pytest
 import yaml
 from click.testing import CliRunner
-from layered_config_tree import LayeredConfigTree
 
-from tests.framework.results.helpers import HARRY_POTTER_CONFIG
 from vivarium.interface.cli import simulate
 
 
@@ -14,27 +14,6 @@ def runner() -> CliRunner:
     return CliRunner()
 
 
-@pytest.fixture
-def model_spec(base_config: LayeredConfigTree, tmp_path: Path) -> str:
-    base_config.update(HARRY_POTTER_CONFIG)
-    model_spec = {}
-    model_spec["configuration"] = base_config.to_dict()
-    model_spec["components"] = {
-        "tests.framework.results.helpers": [
-            "Hogwarts()",
-            "HousePointsObserver()",
-            "NoStratificationsQuidditchWinsObserver()",
-            "QuidditchWinsObserver()",
-            "HogwartsResultsStratifier()",
-        ],
-    }
-    (tmp_path / "model_spec").mkdir()
-    filepath = tmp_path / "model_spec" / "model_spec.yaml"
-    with open(filepath, "w") as f:
-        yaml.dump(model_spec, f)
-    return str(filepath)
-
-
 def test_simulate_run(runner: CliRunner, model_spec: str, hdf_file_path: Path) -> None:
     run_parameters = {param.name for param in simulate.commands["run"].params}
     expected_parameters = {
@@ -71,3 +50,68 @@ def test_simulate_run(runner: CliRunner, model_spec: str, hdf_file_path: Path) -
     with open(f"{output_dir}/model_specification.yaml") as f:
         ms = yaml.safe_load(f)
     assert ms["configuration"]["input_data"]["artifact_path"] == str(hdf_file_path)
+
+
+@pytest.mark.parametrize("skip_processing, trace_memory", [(True, False), (False, True)])
+def test_simulate_profile(
+    runner: CliRunner, model_spec: str, skip_processing: bool, trace_memory: bool
+) -> None:
+    output_dir = Path(model_spec).parent.parent / "profiles"
+    args = ["profile", model_spec, "-o", str(output_dir), "-n", "2"]
+    if skip_processing:
+        args.append("--skip_processing")
+    if trace_memory:
+        args.append("--trace_memory")
+    result = runner.invoke(simulate, args)
+    assert result.exit_code == 0, result.output
+
+    results_dir = list(output_dir.rglob("*/simulation.log"))[0].parent
+    assert (results_dir / "profile.stats").exists()
+    assert (results_dir / "profile.txt").exists() != skip_processing
+
+    framework_profile = pd.read_parquet(results_dir / "framework_profile.parquet")
+    assert "listener" in set(framework_profile["Type"])
+    assert (framework_profile["Calls"] > 0).all()
+
+    with open(results_dir / "performance.json") as f:
+        performance = json.load(f)
+    assert performance["steps"] == 2
+    memory_types = {usage["Type"] for usage in performance["memory"]}
+    if trace_memory:
+        assert performance["peak_memory_bytes"] > 0
+        assert "lifecycle_peak" in memory_types
+    else:
+        assert performance["peak_memory_bytes"] is None
+        assert "lifecycle_peak" not in memory_types
+    assert performance["simulation_run_time"] > 0
+    assert {timing["Event"] for timing in performance["lifecycle_timings"]} >= {
+        "time_step",
+        "total",
+    }
+    assert memory_types >= {"private_column", "results"}
+
+
+def test_simulate_batch(runner: CliRunner, model_spec: str, hdf_file_path: Path) -> None:
+    output_dir = Path(model_spec).parent.parent / "batch"
+    batch_spec = Path(model_spec).parent / "batch.yaml"
+    with open(batch_spec, "w") as f:
+        yaml.dump({"grid": {"randomness.random_seed": [0, 1]}}, f)
+    args = ["batch", model_spec, str(batch_spec), "-o", str(output_dir), "-w", "2"]
+    args += ["-i", str(hdf_file_path)]
+    result = runner.invoke(simulate, args)
+    assert result.exit_code == 0, result.output
+
+    results_dir = list(output_dir.rglob("*/simulation.log"))[0].parent
+    runs = pd.read_parquet(results_dir / "runs.parquet")
+    assert list(runs["randomness.random_seed"]) == [0, 1]
+    assert runs["error"].isna().all()
+    house_points = pd.read_parquet(results_dir / "results" / "house_points")
+    assert set(house_points["randomness.random_seed"]) == {0, 1}
+
+    with open(batch_spec, "w") as f:
+        yaml.dump({"seeds": [0, 1]}, f)
+    result = runner.invoke(
+        simulate, ["batch", model_spec, str(batch_spec), "-o", str(output_dir)]
+    )
+    assert result.exit_code != 0
+    assert "Unknown keys ['seeds']" in result.output
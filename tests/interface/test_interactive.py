@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from collections.abc import Callable
+from pathlib import Path
 
 import pandas as pd
 import pytest
@@ -47,6 +48,22 @@ def test_run_for_duration() -> None:
     assert sim._clock.time == initial_time + pd.Timedelta("15 days")  # type: ignore[operator]
 
 
+def test_load_from_backup(tmp_path: Path) -> None:
+    sim = InteractiveContext(components=[ColumnCreator()])
+    sim.run_for("3 days")
+    sim.write_backup(tmp_path / "backup")
+
+    restored = InteractiveContext.load_from_backup(
+        tmp_path / "backup", components=[ColumnCreator()]
+    )
+    assert isinstance(restored, InteractiveContext)
+    assert restored.current_time == sim.current_time
+    pd.testing.assert_frame_equal(
+        restored.get_population(["test_column_1", "test_column_2"]),
+        sim.get_population(["test_column_1", "test_column_2"]),
+    )
+
+
 def test_get_attribute_names() -> None:
     sim = InteractiveContext(
         components=[MultiLevelMultiColumnCreator(), AttributePipelineCreator()]